@@ -0,0 +1,5 @@
+"""
+Magneto benchmarks - Throughput and memory benchmarks on a synthetic corpus
+
+Run with ``python -m benchmarks``; see benchmarks/__main__.py for options.
+"""
@@ -0,0 +1,134 @@
+"""
+Benchmark runner
+
+Usage:
+    python -m benchmarks [-o results.json] [--baseline baseline.json]
+"""
+import argparse
+import fnmatch
+import sys
+import tempfile
+from pathlib import Path
+
+from .bench import (
+    benchmark_names,
+    compare,
+    environment,
+    load_results,
+    run_isolated,
+    save_results,
+)
+from .corpus import generate_corpus
+
+
+def _format_rss(value) -> str:
+    """Format a byte count in MiB"""
+    return f"{value / (1024 * 1024):.1f}" if value is not None else "-"
+
+
+def _format_change(value) -> str:
+    """Format a relative change"""
+    return f"{value:+.1f}%" if value is not None else "-"
+
+
+def main(argv=None) -> int:
+    """Run the benchmarks and return the exit code"""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Measure files/s and peak RSS of magneto on a synthetic torrent corpus'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        type=str,
+        default='benchmark-results.json',
+        help='Results file (default: benchmark-results.json)'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=str,
+        help='Results file of an earlier run to compare against'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=10.0,
+        help='Throughput drop in percent reported as a regression (default: 10)'
+    )
+    parser.add_argument(
+        '--corpus',
+        type=str,
+        default=str(Path(tempfile.gettempdir()) / 'magneto-bench-corpus'),
+        help='Corpus directory, generated on first use (default: in the temp directory)'
+    )
+    parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        help='Multiplier for the number of files per corpus profile (default: 1.0)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Timed passes per benchmark, the best is reported (default: 3)'
+    )
+    parser.add_argument(
+        '-k', '--filter',
+        type=str,
+        default='*',
+        metavar='PATTERN',
+        help='Only run benchmarks matching the glob pattern, e.g. "convert/*"'
+    )
+    args = parser.parse_args(argv)
+    if args.scale <= 0:
+        parser.error("argument --scale: must be a positive number")
+    if args.repeat <= 0:
+        parser.error("argument --repeat: must be a positive integer")
+    
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(Path(args.baseline))
+        except (IOError, ValueError) as e:
+            parser.error(str(e))
+    
+    names = [name for name in benchmark_names() if fnmatch.fnmatch(name, args.filter)]
+    if not names:
+        parser.error(f"no benchmark matches {args.filter}")
+    
+    # Generate the corpus up front so no benchmark's memory includes it
+    generate_corpus(args.corpus, scale=args.scale)
+    
+    results = environment()
+    results.update({'scale': args.scale, 'repeat': args.repeat, 'benchmarks': {}})
+    
+    print(f"{'Benchmark':<28} {'Files':>8} {'Files/s':>12} {'Peak RSS MiB':>13}")
+    for name in names:
+        result = run_isolated(name, Path(args.corpus), args.scale, args.repeat)
+        results['benchmarks'][name] = result
+        print(
+            f"{name:<28} {result['files']:>8} {result['files_per_second']:>12.1f} "
+            f"{_format_rss(result['peak_rss']):>13}",
+            flush=True
+        )
+    
+    save_results(Path(args.output), results)
+    print(f"\nResults saved to: {args.output}")
+    
+    if baseline is None:
+        return 0
+    
+    rows = compare(results, baseline, args.threshold)
+    print(f"\nCompared with {args.baseline} (created {baseline.get('created', 'unknown')}):")
+    print(f"{'Benchmark':<28} {'Files/s':>10} {'Peak RSS':>10}")
+    for row in rows:
+        marker = "  REGRESSION" if row['regressed'] else ""
+        print(
+            f"{row['name']:<28} {_format_change(row['files_per_second']):>10} "
+            f"{_format_change(row['peak_rss']):>10}{marker}"
+        )
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""
+Bench module - Throughput and memory benchmarks with baseline comparison
+"""
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from magneto import __version__
+from magneto.core import TorrentConverter
+from magneto.utils import collect_torrent_files
+from magneto.writers import WRITERS, create_writer
+
+from .corpus import PROFILES, generate_corpus
+
+
+# Profiles whose conversion results feed the output format benchmarks
+WRITER_PROFILES = ('small', 'many_trackers', 'malformed')
+
+
+def peak_rss() -> Optional[int]:
+    """
+    Peak resident set size of this process
+    
+    Returns:
+        Peak RSS in bytes, or None where it cannot be determined
+    """
+    # On Linux ru_maxrss survives fork and exec, so a spawned child would
+    # report its parent's peak; VmHWM belongs to this process alone
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, other systems kilobytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def _convert_all(paths: List[Path]) -> Callable[[], None]:
+    """Benchmark body converting every path, ignoring broken files"""
+    def run():
+        converter = TorrentConverter()
+        for path in paths:
+            try:
+                converter.convert(path)
+            except (IOError, ValueError):
+                pass
+    return run
+
+
+def _write_all(format_type: str, results: list, output_file: Path) -> Callable[[], None]:
+    """Benchmark body writing every result in one output format"""
+    def run():
+        with create_writer(format_type, output_file) as writer:
+            for path, result in results:
+                writer.write_result(path, result)
+    return run
+
+
+def _writer_results(corpus: Dict[str, List[Path]]) -> list:
+    """Convert the writer profiles into writer.write_result() arguments"""
+    paths = [path for name in WRITER_PROFILES for path in corpus[name]]
+    return [
+        (str(path), result)
+        for path, result in TorrentConverter().convert_many(paths, include_trackers=True)
+    ]
+
+
+def benchmark_names() -> List[str]:
+    """
+    List all benchmarks
+    
+    Returns:
+        Benchmark names in run order
+    """
+    names = [f"convert/{profile.name}" for profile in PROFILES]
+    names.append("collect_torrent_files")
+    names += [f"write/{format_type}" for format_type in WRITERS]
+    return names
+
+
+def _setup(name: str, corpus_root: Path, scale: float, work_dir: Path) -> Tuple[int, Callable[[], None]]:
+    """
+    Prepare a benchmark
+    
+    Returns:
+        Tuple of (files, run) where run performs one pass over files items
+    
+    Raises:
+        ValueError: Unknown benchmark name
+    """
+    corpus = generate_corpus(corpus_root, scale=scale)
+    kind, _, argument = name.partition('/')
+    if kind == 'convert' and argument in corpus:
+        return len(corpus[argument]), _convert_all(corpus[argument])
+    if kind == 'collect_torrent_files':
+        total = sum(len(paths) for paths in corpus.values())
+        return total, lambda: collect_torrent_files(corpus_root, recursive=True)
+    if kind == 'write' and argument in WRITERS:
+        results = _writer_results(corpus)
+        return len(results), _write_all(argument, results, work_dir / f"output.{argument}")
+    raise ValueError(f"Unknown benchmark: {name}")
+
+
+def run_benchmark(name: str, corpus_root: Path, scale: float = 1.0, repeat: int = 3) -> Dict:
+    """
+    Run one benchmark in this process
+    
+    The best of repeat passes is reported, which filters out noise from
+    other processes. Peak RSS covers the whole process, so use
+    run_isolated() to measure one benchmark on its own.
+    
+    Args:
+        name: Benchmark name (see benchmark_names)
+        corpus_root: Corpus directory (generated if missing)
+        scale: Corpus scale passed to generate_corpus
+        repeat: Number of timed passes
+    
+    Returns:
+        Dictionary with files, seconds (best pass), files_per_second and
+        peak_rss (bytes, None if unavailable)
+    
+    Raises:
+        ValueError: Unknown benchmark name
+    """
+    with tempfile.TemporaryDirectory(prefix='magneto-bench-') as work_dir:
+        files, run = _setup(name, Path(corpus_root), scale, Path(work_dir))
+        best = None
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    return {
+        'files': files,
+        'seconds': best,
+        'files_per_second': files / best if best else 0.0,
+        'peak_rss': peak_rss(),
+    }
+
+
+def run_isolated(name: str, corpus_root: Path, scale: float = 1.0, repeat: int = 3) -> Dict:
+    """
+    Run one benchmark in a fresh interpreter so peak RSS is its own
+    
+    Args and return value are the same as for run_benchmark.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+    
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+        return executor.submit(run_benchmark, name, corpus_root, scale, repeat).result()
+
+
+def environment() -> Dict:
+    """Describe the machine and versions a run was made with"""
+    return {
+        'magneto': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def save_results(path: Path, results: Dict):
+    """Write a results document as JSON"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: Path) -> Dict:
+    """
+    Read a results document written by save_results
+    
+    Raises:
+        IOError: File read failed
+        ValueError: File is not a results document
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            results = json.load(f)
+    except OSError as e:
+        raise IOError(f"Unable to read results {path}: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unable to parse results {path}: {e}")
+    if not isinstance(results, dict) or not isinstance(results.get('benchmarks'), dict):
+        raise ValueError(f"Unable to parse results {path}: no benchmarks")
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float = 10.0) -> List[Dict]:
+    """
+    Compare a run against a baseline
+    
+    Args:
+        results: Results document of the current run
+        baseline: Results document of the baseline run
+        threshold: Throughput drop in percent that counts as a regression
+    
+    Returns:
+        One dictionary per benchmark present in both runs, with name,
+        files_per_second and peak_rss change in percent (None when either
+        side is missing) and whether it regressed
+    """
+    rows = []
+    for name, current in results['benchmarks'].items():
+        previous = baseline['benchmarks'].get(name)
+        if previous is None:
+            continue
+        speed = _change(current.get('files_per_second'), previous.get('files_per_second'))
+        rows.append({
+            'name': name,
+            'files_per_second': speed,
+            'peak_rss': _change(current.get('peak_rss'), previous.get('peak_rss')),
+            'regressed': speed is not None and speed < -threshold,
+        })
+    return rows
+
+
+def _change(current: Optional[float], previous: Optional[float]) -> Optional[float]:
+    """Relative change in percent"""
+    if not current or not previous:
+        return None
+    return (current - previous) / previous * 100.0
@@ -0,0 +1,195 @@
+"""
+Corpus module - Deterministic synthetic torrent corpus for benchmarks
+"""
+import random
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Union
+
+
+# Piece length of generated torrents (256 KiB)
+PIECE_LENGTH = 256 * 1024
+
+# Ways a malformed torrent is broken, cycled through by file index
+MALFORMED_KINDS = ('truncated', 'not_dict', 'missing_info', 'info_not_dict', 'garbage')
+
+
+class Profile(NamedTuple):
+    """Shape of the torrents generated for one corpus profile"""
+    
+    name: str
+    count: int
+    pieces: int
+    files: int
+    trackers: int
+    malformed: bool = False
+
+
+# Corpus profiles; count is the number of files at scale 1.0
+PROFILES = (
+    Profile('tiny', 2000, 10, 1, 1),
+    Profile('small', 1000, 1000, 1, 3),
+    Profile('multi_file', 200, 1000, 100, 3),
+    Profile('many_trackers', 500, 100, 1, 200),
+    Profile('large', 20, 100_000, 1, 5),
+    Profile('huge', 2, 1_000_000, 20, 10),
+    Profile('malformed', 200, 100, 1, 3, malformed=True),
+)
+
+
+def bencode(value) -> bytes:
+    """
+    Encode a value in bencode format
+    
+    Args:
+        value: int, bytes, str, list or dict (keys are sorted)
+    
+    Returns:
+        Encoded bytes
+    
+    Raises:
+        TypeError: Value of an unsupported type
+    """
+    parts: List[bytes] = []
+    _encode(value, parts.append)
+    return b''.join(parts)
+
+
+def _encode(value, write):
+    """Write the bencoded form of value through write"""
+    if isinstance(value, int):
+        write(b'i%de' % value)
+    elif isinstance(value, (bytes, str)):
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        write(b'%d:' % len(value))
+        write(value)
+    elif isinstance(value, list):
+        write(b'l')
+        for item in value:
+            _encode(item, write)
+        write(b'e')
+    elif isinstance(value, dict):
+        write(b'd')
+        items = [
+            (key.encode('utf-8') if isinstance(key, str) else key, item)
+            for key, item in value.items()
+        ]
+        for key, item in sorted(items):
+            _encode(key, write)
+            _encode(item, write)
+        write(b'e')
+    else:
+        raise TypeError(f"Cannot bencode {type(value).__name__}")
+
+
+def _trackers(rng: random.Random, count: int) -> List[str]:
+    """Generate tracker URLs"""
+    trackers = []
+    for index in range(count):
+        scheme = 'udp' if rng.random() < 0.4 else rng.choice(('http', 'https'))
+        port = rng.choice((80, 443, 1337, 6969))
+        trackers.append(f"{scheme}://tracker{index}.example{rng.randrange(100)}.org:{port}/announce")
+    return trackers
+
+
+def make_torrent(profile: Profile, index: int) -> bytes:
+    """
+    Generate one torrent file
+    
+    The content only depends on the profile and index, so the corpus is
+    identical on every machine and run.
+    
+    Args:
+        profile: Corpus profile
+        index: File index within the profile
+    
+    Returns:
+        Torrent file content (broken on purpose for malformed profiles)
+    """
+    rng = random.Random(f"{profile.name}:{index}")
+    name = f"{profile.name}-{index:06d}"
+    total_length = profile.pieces * PIECE_LENGTH - rng.randrange(PIECE_LENGTH)
+    
+    info: dict = {
+        'name': name,
+        'piece length': PIECE_LENGTH,
+        'pieces': rng.getrandbits(profile.pieces * 160).to_bytes(profile.pieces * 20, 'big'),
+    }
+    if profile.files == 1:
+        info['length'] = total_length
+    else:
+        file_length = total_length // profile.files
+        info['files'] = [
+            {
+                'length': file_length + (total_length % profile.files if number == 0 else 0),
+                'path': [f"disc{number % 10}", f"track{number:04d}.bin"],
+            }
+            for number in range(profile.files)
+        ]
+    
+    trackers = _trackers(rng, profile.trackers)
+    torrent: dict = {
+        'announce': trackers[0],
+        'comment': f"Synthetic benchmark torrent {name}",
+        'created by': 'magneto benchmarks',
+        'creation date': 1_600_000_000 + index,
+        'info': info,
+    }
+    if len(trackers) > 1:
+        torrent['announce-list'] = [[tracker] for tracker in trackers]
+    
+    if not profile.malformed:
+        return bencode(torrent)
+    
+    kind = MALFORMED_KINDS[index % len(MALFORMED_KINDS)]
+    if kind == 'truncated':
+        data = bencode(torrent)
+        return data[:rng.randrange(1, len(data))]
+    if kind == 'not_dict':
+        return bencode([name, trackers])
+    if kind == 'missing_info':
+        del torrent['info']
+        return bencode(torrent)
+    if kind == 'info_not_dict':
+        torrent['info'] = [name]
+        return bencode(torrent)
+    return rng.getrandbits(8 * 512).to_bytes(512, 'big')
+
+
+def generate_corpus(
+    root: Union[str, Path],
+    profiles: Iterable[Profile] = PROFILES,
+    scale: float = 1.0
+) -> Dict[str, List[Path]]:
+    """
+    Write the corpus to disk
+    
+    Each profile is written to its own subdirectory. Files that already
+    exist are reused, since generation is deterministic.
+    
+    Args:
+        root: Corpus directory
+        profiles: Profiles to generate
+        scale: Multiplier for the number of files per profile (at least one
+            file is generated per profile)
+    
+    Returns:
+        Dictionary mapping profile name to its torrent file paths
+    """
+    root = Path(root)
+    corpus = {}
+    for profile in profiles:
+        directory = root / profile.name
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for index in range(max(1, round(profile.count * scale))):
+            path = directory / f"{index:06d}.torrent"
+            if not path.exists():
+                # Write under a temporary name so an interrupted run never
+                # leaves a partial file behind to be reused
+                partial = path.with_suffix('.partial')
+                partial.write_bytes(make_torrent(profile, index))
+                partial.replace(path)
+            paths.append(path)
+        corpus[profile.name] = paths
+    return corpus
@@ -5,33 +5,65 @@ __version__ = "0.1.2"
 __author__ = "Yuze Xie"
 
 from pathlib import Path
-from typing import Tuple, Dict, Union
+from typing import TYPE_CHECKING, BinaryIO, Union
 
-from .core import TorrentConverter
-from .parser import ArgumentParser
-from .ui import UI
-from .utils import is_url
+if TYPE_CHECKING:
+    from .result import ConversionResult
 
-__all__ = ["TorrentConverter", "ArgumentParser", "UI", "torrent_to_magnet"]
+__all__ = [
+    "TorrentConverter", "ArgumentParser", "UI", "ConversionResult", "ConversionStatus",
+    "torrent_to_magnet", "torrent_to_magnet_async",
+]
+
+# Public names imported from their submodule on first access, so that
+# importing the package (and starting the CLI) only loads what is used
+_LAZY_ATTRIBUTES = {
+    "TorrentConverter": "core",
+    "ArgumentParser": "parser",
+    "UI": "ui",
+    "ConversionResult": "result",
+    "ConversionStatus": "result",
+    "is_url": "utils",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
 
 def torrent_to_magnet(
-    input_source: Union[str, Path],
-    include_trackers: bool = False
-) -> Tuple[str, str, Dict]:
+    input_source: Union[str, Path, bytes, bytearray, memoryview, BinaryIO],
+    include_trackers: bool = False,
+    use_mmap: bool = True
+) -> 'ConversionResult':
     """
-    Convert a torrent file or URL to a magnet link.
+    Convert a torrent file, URL or in-memory torrent data to a magnet link.
     
     This is a convenient entry point function that can be used directly in code
     without going through the CLI.
     
     Args:
-        input_source: Path to torrent file (str or Path) or URL of torrent file
+        input_source: Path to torrent file (str or Path), URL of torrent file,
+            torrent data (bytes, bytearray or memoryview) or a binary file
+            object to read the torrent data from
         include_trackers: Whether to include tracker information in the magnet link
             (default: False)
+        use_mmap: Whether to memory-map large torrent files instead of reading
+            them into memory (default: True, ignored for URLs)
     
     Returns:
-        A tuple containing three elements:
+        A ConversionResult, which unpacks like a tuple of three elements:
         - magnet_link (str): Generated magnet link
         - info_hash (str): Torrent info hash (hexadecimal string, uppercase)
         - metadata (Dict): Dictionary containing the following keys:
@@ -44,7 +76,6 @@ def torrent_to_magnet(
     Raises:
         IOError: File read failed or URL download failed
         ValueError: Torrent file format error
-        ImportError: Missing required dependency (bencode.py)
     
     Example:
         >>> from magneto import torrent_to_magnet
@@ -59,9 +90,21 @@ def torrent_to_magnet(
         >>> 
         >>> # Include trackers
         >>> magnet, hash, meta = torrent_to_magnet("file.torrent", include_trackers=True)
+        >>> 
+        >>> # Convert data already in memory
+        >>> magnet, hash, meta = torrent_to_magnet(uploaded_bytes)
     """
+    from .core import TorrentConverter
+    from .utils import is_url
+    
     converter = TorrentConverter()
     
+    # Torrent data in memory or in a file object
+    if isinstance(input_source, (bytes, bytearray, memoryview)):
+        return converter.convert_bytes(input_source, include_trackers=include_trackers)
+    if hasattr(input_source, 'read'):
+        return converter.convert_stream(input_source, include_trackers=include_trackers)
+    
     # Check if input is a URL
     input_str = str(input_source)
     if is_url(input_str):
@@ -71,4 +114,52 @@ def torrent_to_magnet(
         torrent_path = Path(input_source)
         if not torrent_path.exists():
             raise IOError(f"File does not exist: {torrent_path}")
-        return converter.convert(torrent_path, include_trackers=include_trackers)
+        return converter.convert(
+            torrent_path,
+            include_trackers=include_trackers,
+            use_mmap=use_mmap
+        )
+
+
+async def torrent_to_magnet_async(
+    input_source: Union[str, Path, bytes, bytearray, memoryview, BinaryIO],
+    include_trackers: bool = False,
+    use_mmap: bool = True
+) -> 'ConversionResult':
+    """
+    Convert a torrent file, URL or in-memory torrent data to a magnet link
+    without blocking the event loop.
+    
+    URLs are downloaded with non-blocking sockets on the running event loop;
+    file reads, stream reads and hashing run on the loop's default executor.
+    Arguments, return value and exceptions are the same as for
+    torrent_to_magnet.
+    
+    Example:
+        >>> import asyncio
+        >>> from magneto import torrent_to_magnet_async
+        >>> 
+        >>> async def main():
+        ...     magnet, hash, meta = await torrent_to_magnet_async(
+        ...         "https://example.com/file.torrent"
+        ...     )
+        >>> 
+        >>> asyncio.run(main())
+    """
+    import asyncio
+    from functools import partial
+    
+    from .utils import is_url
+    
+    is_data = isinstance(input_source, (bytes, bytearray, memoryview)) or hasattr(input_source, 'read')
+    if not is_data and is_url(str(input_source)):
+        from .core import TorrentConverter
+        
+        return await TorrentConverter().aconvert_from_url(
+            str(input_source), include_trackers=include_trackers
+        )
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(
+        torrent_to_magnet, input_source, include_trackers=include_trackers, use_mmap=use_mmap
+    ))
@@ -0,0 +1,231 @@
+"""
+Asyncnet module - Non-blocking HTTP client for the asyncio API
+"""
+import asyncio
+import http.client
+import io
+from typing import Dict, Optional
+from urllib.parse import urljoin
+
+from .network import _REDIRECT_CODES, split_url
+
+
+# Limits on the status line and header block of a response
+_MAX_LINE = 64 * 1024
+_MAX_HEADERS = 100
+
+# TLS context shared by all HTTPS requests, created on first use
+_ssl_context = None
+
+
+def _get_ssl_context():
+    """Default TLS context (loading the CA certificates once)"""
+    global _ssl_context
+    if _ssl_context is None:
+        import ssl
+        _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+async def _wait(awaitable, timeout: float):
+    """Await with a timeout raising the built-in TimeoutError (an OSError)"""
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError("timed out")
+
+
+class AsyncResponse:
+    """
+    HTTP response read from an asyncio stream
+    
+    The body is decoded according to Transfer-Encoding or Content-Length;
+    close the response (or use it as an async context manager) to close
+    its connection.
+    """
+    
+    def __init__(self, reader: asyncio.StreamReader, writer, timeout: float):
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self.status = 0
+        self.reason = ''
+        self.headers = None
+        self._chunked = False
+        # Body bytes left to read: None until the connection closes, and for
+        # chunked bodies the bytes left in the current chunk
+        self._remaining: Optional[int] = None
+        self._done = False
+    
+    async def _readline(self, what: str = "header line") -> bytes:
+        """Read one line, which is empty at the end of the stream"""
+        try:
+            return await _wait(self._reader.readline(), self._timeout)
+        except ValueError:
+            # Raised by readline for lines over the stream's limit
+            raise http.client.LineTooLong(what)
+    
+    async def _begin(self):
+        """Read the status line and headers, skipping interim 1xx responses"""
+        while True:
+            line = await self._readline("status line")
+            if not line:
+                raise http.client.RemoteDisconnected("Remote end closed connection without response")
+            parts = line.decode('iso-8859-1').rstrip('\r\n').split(None, 2)
+            if len(parts) < 2 or not parts[0].startswith('HTTP/') or not parts[1].isdigit():
+                raise http.client.BadStatusLine(line.decode('iso-8859-1', 'replace'))
+            
+            block = []
+            while True:
+                header = await self._readline()
+                if not header:
+                    raise http.client.IncompleteRead(b'')
+                if header in (b'\r\n', b'\n'):
+                    break
+                block.append(header)
+                if len(block) > _MAX_HEADERS:
+                    raise http.client.HTTPException(f"got more than {_MAX_HEADERS} headers")
+            
+            status = int(parts[1])
+            if not 100 <= status < 200 or status == 101:
+                break
+        
+        self.status = status
+        self.reason = parts[2] if len(parts) > 2 else ''
+        self.headers = http.client.parse_headers(io.BytesIO(b''.join(block) + b'\r\n'))
+        
+        if status in (101, 204, 304):
+            self._done = True
+        elif 'chunked' in self.headers.get('Transfer-Encoding', '').lower():
+            self._chunked = True
+            self._remaining = 0
+        else:
+            length = self.headers.get('Content-Length', '').strip()
+            if length.isdigit():
+                self._remaining = int(length)
+                self._done = self._remaining == 0
+    
+    async def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt bytes of the body (all remaining bytes if None)"""
+        if amt is None:
+            parts = []
+            while True:
+                chunk = await self.read(64 * 1024)
+                if not chunk:
+                    return b''.join(parts)
+                parts.append(chunk)
+        if self._done or amt <= 0:
+            return b''
+        
+        if self._chunked and self._remaining == 0:
+            line = await self._readline("chunk size")
+            size = line.split(b';', 1)[0].strip()
+            try:
+                self._remaining = int(size, 16)
+            except ValueError:
+                raise http.client.IncompleteRead(b'')
+            if self._remaining == 0:
+                # Skip trailers up to the final empty line
+                while (await self._readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                self._done = True
+                return b''
+        
+        if self._remaining is not None:
+            amt = min(amt, self._remaining)
+        data = await _wait(self._reader.read(amt), self._timeout)
+        if not data:
+            if self._remaining is not None:
+                raise http.client.IncompleteRead(b'', self._remaining)
+            self._done = True
+            return b''
+        
+        if self._remaining is not None:
+            self._remaining -= len(data)
+            if self._remaining == 0:
+                if self._chunked:
+                    await self._readline()
+                else:
+                    self._done = True
+        return data
+    
+    def close(self):
+        """Close the connection"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+async def open_url(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30,
+    max_redirects: int = 5
+) -> AsyncResponse:
+    """
+    Send a GET request without blocking the event loop
+    
+    Each request uses its own connection, closed with the response.
+    
+    Args:
+        url: HTTP or HTTPS URL to fetch
+        headers: Additional request headers
+        timeout: Timeout in seconds for connecting and for each read
+        max_redirects: Maximum number of redirects followed
+    
+    Returns:
+        Response whose status and headers have been read
+    
+    Raises:
+        IOError: Connection failed, too many redirects or HTTP error status
+    """
+    for _ in range(max_redirects + 1):
+        response = await _send(url, headers or {}, timeout)
+        
+        location = response.headers.get('Location')
+        if response.status in _REDIRECT_CODES and location:
+            response.close()
+            url = urljoin(url, location)
+            continue
+        
+        if response.status >= 400:
+            response.close()
+            raise IOError(f"HTTP Error {response.status}: {response.reason}")
+        
+        return response
+    
+    raise IOError(f"Too many redirects (more than {max_redirects})")
+
+
+async def _send(url: str, headers: Dict[str, str], timeout: float) -> AsyncResponse:
+    """Connect, send the request and read the response head"""
+    (scheme, host, port), target = split_url(url)
+    reader, writer = await _wait(asyncio.open_connection(
+        host,
+        port,
+        ssl=_get_ssl_context() if scheme == 'https' else None,
+        limit=_MAX_LINE
+    ), timeout)
+    
+    authority = f"[{host}]" if ':' in host else host
+    if port != (443 if scheme == 'https' else 80):
+        authority += f":{port}"
+    lines = [f"GET {target} HTTP/1.1", f"Host: {authority}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    lines += ["Accept-Encoding: identity", "Connection: close", "", ""]
+    
+    response = AsyncResponse(reader, writer, timeout)
+    try:
+        writer.write("\r\n".join(lines).encode('iso-8859-1'))
+        await _wait(writer.drain(), timeout)
+        await response._begin()
+    except BaseException:
+        response.close()
+        raise
+    return response
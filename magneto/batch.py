@@ -0,0 +1,210 @@
+"""
+Batch module - Line-delimited JSON conversion requests for co-processes
+
+A client keeps one magneto process running (``magneto --batch``) and
+writes one JSON request per line to its stdin:
+
+    {"id": 1, "path": "/data/file.torrent"}
+    {"id": 2, "url": "https://example.com/file.torrent", "trackers": true}
+    {"id": 3, "data": "<base64 torrent file>"}
+
+Every request gets exactly one response line on stdout, carrying the
+request's id:
+
+    {"id": 1, "status": "ok", "magnet": "...", "info_hash": "...", "name": "...",
+     "trackers": [], "file_size": 1234}
+    {"id": 2, "status": "error", "error": "..."}
+
+Requests are processed concurrently, so responses arrive in completion
+order rather than request order; clients match them up by id.
+"""
+import base64
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional
+
+from .core import TorrentConverter
+
+
+# Request fields naming the torrent to convert; a request has exactly one
+SOURCES = ('path', 'url', 'data')
+
+# Requests read ahead per worker before reading waits for a free worker
+QUEUE_PER_WORKER = 4
+
+
+class BatchSession:
+    """
+    Answers line-delimited JSON conversion requests
+    
+    Requests are converted on a pool of worker threads sharing one
+    TorrentConverter, and each response is written and flushed as soon as
+    it is ready. Reading stops early if the client stops reading responses.
+    """
+    
+    def __init__(
+        self,
+        output: BinaryIO,
+        converter: Optional[TorrentConverter] = None,
+        workers: int = 8,
+        include_trackers: bool = False
+    ):
+        """
+        Initialize the session
+        
+        Args:
+            output: Binary stream responses are written to
+            converter: Converter to use (default: a new TorrentConverter,
+                closed with the session)
+            workers: Number of requests processed at the same time
+            include_trackers: Whether to include trackers in the magnet
+                links of requests that do not say otherwise
+        """
+        self.output = output
+        self._owns_converter = converter is None
+        self.converter = converter if converter is not None else TorrentConverter()
+        self.include_trackers = include_trackers
+        self.ok_count = 0
+        self.error_count = 0
+        self._broken = False
+        self._write_lock = threading.Lock()
+        # Bound the requests queued ahead so a fast client cannot buffer
+        # its whole backlog in memory
+        self._slots = threading.Semaphore(max(workers, 1) * QUEUE_PER_WORKER)
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix='magneto-batch')
+    
+    def run(self, requests: BinaryIO) -> int:
+        """
+        Answer every request read from a stream until it ends
+        
+        Args:
+            requests: Binary stream of request lines
+        
+        Returns:
+            Number of requests answered
+        """
+        for line in requests:
+            if self._broken:
+                break
+            if line.strip():
+                self.submit(line)
+        self._executor.shutdown(wait=True)
+        return self.ok_count + self.error_count
+    
+    def submit(self, line: bytes):
+        """
+        Queue one request line
+        
+        Lines that are not a JSON object are answered at once with an error
+        and a null id.
+        
+        Args:
+            line: Request line
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            self._respond_error({"id": None}, f"Invalid request: {e}")
+            return
+        if not isinstance(request, dict):
+            self._respond_error({"id": None}, "Invalid request: not a JSON object")
+            return
+        
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._process, request)
+        except RuntimeError:
+            self._slots.release()
+            raise
+    
+    def _process(self, request: Dict):
+        """Convert one request and write its response on a worker thread"""
+        record = {"id": request.get('id')}
+        try:
+            result = self.convert(request)
+        except Exception as e:
+            self._respond_error(record, str(e))
+        else:
+            record.update({
+                "status": "ok",
+                "magnet": result.magnet_link,
+                "info_hash": result.info_hash,
+                "name": result.name or '',
+                "trackers": list(result.trackers),
+                "file_size": result.file_size,
+            })
+            self._write(record)
+        finally:
+            self._slots.release()
+    
+    def convert(self, request: Dict):
+        """
+        Convert the torrent a request names
+        
+        Args:
+            request: Request object with one of path, url or data (base64)
+                and an optional trackers flag
+        
+        Returns:
+            ConversionResult of the torrent
+        
+        Raises:
+            IOError: Reading or downloading the torrent failed
+            ValueError: Invalid request or torrent file format error
+        """
+        sources = [key for key in SOURCES if key in request]
+        if len(sources) != 1:
+            raise ValueError("Invalid request: needs exactly one of path, url or data")
+        source = sources[0]
+        value = request[source]
+        if not isinstance(value, str):
+            raise ValueError(f"Invalid request: {source} must be a string")
+        include_trackers = request.get('trackers', self.include_trackers)
+        if not isinstance(include_trackers, bool):
+            raise ValueError("Invalid request: trackers must be true or false")
+        
+        if source == 'path':
+            return self.converter.convert(Path(value), include_trackers=include_trackers)
+        if source == 'url':
+            return self.converter.convert_from_url(value, include_trackers=include_trackers)
+        try:
+            data = base64.b64decode(value, validate=True)
+        except ValueError as e:
+            raise ValueError(f"Invalid request: data is not base64: {e}")
+        return self.converter.convert_bytes(data, include_trackers=include_trackers)
+    
+    def _respond_error(self, record: Dict, error: str):
+        """Write an error response"""
+        record.update({"status": "error", "error": error})
+        self._write(record)
+    
+    def _write(self, record: Dict):
+        """Write and flush one response line"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        with self._write_lock:
+            if record['status'] == 'ok':
+                self.ok_count += 1
+            else:
+                self.error_count += 1
+            if self._broken:
+                return
+            try:
+                self.output.write(line)
+                self.output.flush()
+            except OSError:
+                # The client closed its end; nobody is left to answer
+                self._broken = True
+    
+    def close(self):
+        """Wait for queued requests and release the converter"""
+        self._executor.shutdown(wait=True)
+        if self._owns_converter:
+            self.converter.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,204 @@
+"""
+Cache module - Persistent conversion cache keyed on file identity
+"""
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+
+# Number of writes batched into one transaction
+_COMMIT_INTERVAL = 1000
+
+
+def default_cache_path() -> Path:
+    """
+    Determine the default cache database location
+    
+    Returns:
+        $XDG_CACHE_HOME/magneto/cache.sqlite3, falling back to
+        ~/.cache/magneto/cache.sqlite3
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+    return Path(cache_home).expanduser() / 'magneto' / 'cache.sqlite3'
+
+
+class ConversionCache:
+    """
+    SQLite-backed cache of conversion results
+    
+    Entries are keyed on the absolute file path and are only valid while the
+    file's size, modification time (ns) and inode are unchanged, so an
+    unchanged file can be converted from a single stat() call.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (and create if needed) the cache database
+        
+        Args:
+            path: Database file path (default: see default_cache_path)
+        
+        Raises:
+            IOError: Database cannot be opened
+        """
+        self.path = Path(path) if path is not None else default_cache_path()
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS conversions ('
+                ' path TEXT PRIMARY KEY,'
+                ' size INTEGER NOT NULL,'
+                ' mtime_ns INTEGER NOT NULL,'
+                ' inode INTEGER NOT NULL,'
+                ' info_hash TEXT NOT NULL,'
+                ' name TEXT,'
+                ' trackers TEXT NOT NULL'
+                ')'
+            )
+            self._db.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise IOError(f"Unable to open cache {self.path}: {e}")
+    
+    @staticmethod
+    def _key(torrent_path: Union[str, Path]) -> str:
+        """Normalize a path into its cache key"""
+        return os.path.abspath(torrent_path)
+    
+    def get(
+        self,
+        torrent_path: Union[str, Path],
+        stat: os.stat_result
+    ) -> Optional[Tuple[str, Optional[str], List[str], int]]:
+        """
+        Look up the cached conversion of an unchanged file
+        
+        Args:
+            torrent_path: Path to the torrent file
+            stat: Current stat result of the file
+        
+        Returns:
+            Tuple of (info_hash, name, trackers, file_size), or None if the
+            file is not cached or has changed since it was cached
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT size, mtime_ns, inode, info_hash, name, trackers '
+                'FROM conversions WHERE path = ?',
+                (self._key(torrent_path),)
+            ).fetchone()
+            if row is None or tuple(row[:3]) != (stat.st_size, stat.st_mtime_ns, stat.st_ino):
+                self.misses += 1
+                return None
+            self.hits += 1
+        trackers = row[5].split('\n') if row[5] else []
+        return row[3], row[4], trackers, row[0]
+    
+    def put(
+        self,
+        torrent_path: Union[str, Path],
+        stat: os.stat_result,
+        info_hash: str,
+        name: Optional[str],
+        trackers: Optional[List[str]]
+    ):
+        """
+        Store the conversion of a file
+        
+        Writes are batched; call flush() or close() to commit them.
+        
+        Args:
+            torrent_path: Path to the torrent file
+            stat: Stat result of the file taken before it was read
+            info_hash: Info hash (hexadecimal, uppercase)
+            name: Torrent name
+            trackers: All trackers of the torrent
+        """
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO conversions '
+                '(path, size, mtime_ns, inode, info_hash, name, trackers) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (
+                    self._key(torrent_path),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    stat.st_ino,
+                    info_hash,
+                    name,
+                    '\n'.join(trackers or []),
+                )
+            )
+            self._pending += 1
+            if self._pending >= _COMMIT_INTERVAL:
+                self._db.commit()
+                self._pending = 0
+    
+    def prune(self) -> int:
+        """
+        Remove entries whose file no longer exists or has changed
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT path, size, mtime_ns, inode FROM conversions'
+            ).fetchall()
+        stale = []
+        for path, size, mtime_ns, inode in rows:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stale.append((path,))
+                continue
+            if (stat.st_size, stat.st_mtime_ns, stat.st_ino) != (size, mtime_ns, inode):
+                stale.append((path,))
+        with self._lock:
+            self._db.executemany('DELETE FROM conversions WHERE path = ?', stale)
+            self._db.commit()
+            self._pending = 0
+        return len(stale)
+    
+    def clear(self) -> int:
+        """
+        Remove all entries
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._db.execute('DELETE FROM conversions').rowcount
+            self._db.commit()
+            self._pending = 0
+        return removed
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM conversions').fetchone()[0]
+    
+    def flush(self):
+        """Commit pending writes"""
+        with self._lock:
+            self._db.commit()
+            self._pending = 0
+    
+    def close(self):
+        """Commit pending writes and close the database"""
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
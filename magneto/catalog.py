@@ -0,0 +1,318 @@
+"""
+Catalog module - Searchable SQLite catalog of converted torrents
+"""
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from .result import ConversionResult
+
+
+# Number of torrents written per transaction
+_BATCH_SIZE = 5000
+
+# Info hash queries are looked up by key instead of by name
+_HEX_HASH = re.compile(r'[0-9A-Fa-f]{40}')
+
+_SCHEMA = (
+    # Rows are linked to the full-text index by their implicit rowid, which
+    # stays stable as long as the database is not vacuumed
+    'CREATE TABLE IF NOT EXISTS torrents ('
+    ' info_hash BLOB PRIMARY KEY,'
+    ' name TEXT NOT NULL,'
+    ' file_size INTEGER,'
+    ' source TEXT'
+    ')',
+    'CREATE TABLE IF NOT EXISTS trackers ('
+    ' id INTEGER PRIMARY KEY,'
+    ' url TEXT NOT NULL UNIQUE'
+    ')',
+    'CREATE TABLE IF NOT EXISTS torrent_trackers ('
+    ' info_hash BLOB NOT NULL,'
+    ' tracker_id INTEGER NOT NULL,'
+    ' position INTEGER NOT NULL,'
+    ' PRIMARY KEY (info_hash, tracker_id)'
+    ') WITHOUT ROWID',
+)
+
+_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS torrents_fts USING fts5("
+    " name, content='torrents', content_rowid='rowid', tokenize='unicode61 remove_diacritics 2'"
+    ")",
+    'CREATE TRIGGER IF NOT EXISTS torrents_fts_insert AFTER INSERT ON torrents BEGIN'
+    ' INSERT INTO torrents_fts(rowid, name) VALUES (new.rowid, new.name);'
+    ' END',
+    'CREATE TRIGGER IF NOT EXISTS torrents_fts_delete AFTER DELETE ON torrents BEGIN'
+    " INSERT INTO torrents_fts(torrents_fts, rowid, name) VALUES ('delete', old.rowid, old.name);"
+    ' END',
+    'CREATE TRIGGER IF NOT EXISTS torrents_fts_update AFTER UPDATE OF name ON torrents'
+    ' WHEN old.name <> new.name BEGIN'
+    " INSERT INTO torrents_fts(torrents_fts, rowid, name) VALUES ('delete', old.rowid, old.name);"
+    ' INSERT INTO torrents_fts(rowid, name) VALUES (new.rowid, new.name);'
+    ' END',
+)
+
+
+def default_catalog_path() -> Path:
+    """
+    Determine the default catalog database location
+    
+    Returns:
+        $XDG_DATA_HOME/magneto/catalog.sqlite3, falling back to
+        ~/.local/share/magneto/catalog.sqlite3
+    """
+    data_home = os.environ.get('XDG_DATA_HOME') or os.path.join('~', '.local', 'share')
+    return Path(data_home).expanduser() / 'magneto' / 'catalog.sqlite3'
+
+
+def _fts_query(query: str) -> str:
+    """Turn search words into an FTS5 query matching names with all of them as prefixes"""
+    return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in query.split())
+
+
+def _like_pattern(word: str) -> str:
+    """Turn a search word into a LIKE pattern matching it anywhere"""
+    escaped = word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+class TorrentCatalog:
+    """
+    SQLite catalog of converted torrents, searchable by name and info hash
+    
+    Torrents are keyed on their 20-byte info hash, stored as a BLOB, and
+    tracker URLs are stored once in their own table. Names are indexed with
+    FTS5 so word searches stay fast on millions of rows; where SQLite lacks
+    FTS5, searches fall back to scanning names with LIKE.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """
+        Open (and create if needed) the catalog database
+        
+        Args:
+            path: Database file path (default: see default_catalog_path)
+        
+        Raises:
+            IOError: Database cannot be opened
+        """
+        self.path = Path(path) if path is not None else default_catalog_path()
+        self._pending: List[tuple] = []
+        self._tracker_ids: Dict[str, int] = {}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path))
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+            try:
+                for statement in _FTS_SCHEMA:
+                    self._db.execute(statement)
+                self.full_text = True
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5
+                self.full_text = False
+            self._db.commit()
+        except (OSError, sqlite3.Error) as e:
+            raise IOError(f"Unable to open catalog {self.path}: {e}")
+    
+    def add(
+        self,
+        info_hash: str,
+        name: Optional[str],
+        trackers: Optional[List[str]] = None,
+        file_size: Optional[int] = None,
+        source: Optional[str] = None
+    ):
+        """
+        Add a torrent, replacing any entry with the same info hash
+        
+        Writes are batched; call flush() or close() to commit them.
+        
+        Args:
+            info_hash: Info hash (hexadecimal)
+            name: Torrent name
+            trackers: Tracker URLs of the torrent
+            file_size: Size of the .torrent file in bytes
+            source: Path or URL the torrent was converted from
+        """
+        self._queue(bytes.fromhex(info_hash), name, trackers, file_size, source)
+    
+    def add_result(self, source: str, result: 'ConversionResult'):
+        """
+        Add a torrent from the result of TorrentConverter.convert
+        
+        Args:
+            source: Path or URL the torrent was converted from
+            result: ConversionResult returned by the converter
+        """
+        self._queue(result.digest, result.name, result.trackers, result.file_size, source)
+    
+    def _queue(
+        self,
+        digest: bytes,
+        name: Optional[str],
+        trackers: Optional[Iterable[str]],
+        file_size: Optional[int],
+        source: Optional[str]
+    ):
+        """Buffer an addition, writing the buffer once it is full"""
+        self._pending.append((digest, name or '', file_size, source, trackers or ()))
+        if len(self._pending) >= _BATCH_SIZE:
+            self.flush()
+    
+    def _tracker_id_map(self, urls: set) -> Dict[str, int]:
+        """Ids of tracker URLs, inserting the ones not stored yet"""
+        missing = [url for url in urls if url not in self._tracker_ids]
+        if missing:
+            self._db.executemany(
+                'INSERT OR IGNORE INTO trackers (url) VALUES (?)', [(url,) for url in missing]
+            )
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT url, id FROM trackers WHERE url IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                self._tracker_ids.update(rows)
+        return self._tracker_ids
+    
+    def flush(self):
+        """Commit pending additions in one transaction"""
+        if not self._pending:
+            return
+        # The last addition of an info hash wins
+        batch = list({entry[0]: entry for entry in self._pending}.values())
+        self._pending = []
+        try:
+            with self._db:
+                rows = [(name, size, source, digest) for digest, name, size, source, _ in batch]
+                # Update first so existing rows keep their rowid in the
+                # full-text index, then insert the new ones
+                self._db.executemany(
+                    'UPDATE torrents SET name = ?, file_size = ?, source = ? WHERE info_hash = ?',
+                    rows
+                )
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO torrents (name, file_size, source, info_hash) '
+                    'VALUES (?, ?, ?, ?)',
+                    rows
+                )
+                
+                tracker_ids = self._tracker_id_map({url for *_, urls in batch for url in urls})
+                self._db.executemany(
+                    'DELETE FROM torrent_trackers WHERE info_hash = ?',
+                    [(digest,) for digest, *_ in batch]
+                )
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO torrent_trackers (info_hash, tracker_id, position) '
+                    'VALUES (?, ?, ?)',
+                    [
+                        (digest, tracker_ids[url], position)
+                        for digest, *_, urls in batch
+                        for position, url in enumerate(urls)
+                    ]
+                )
+        except sqlite3.Error as e:
+            # Ids cached during the rolled back transaction may not exist
+            self._tracker_ids.clear()
+            raise IOError(f"Unable to write catalog {self.path}: {e}")
+    
+    def _trackers(self, digest: bytes) -> List[str]:
+        """Tracker URLs of a torrent, in their original order"""
+        rows = self._db.execute(
+            'SELECT url FROM torrent_trackers JOIN trackers ON trackers.id = tracker_id '
+            'WHERE info_hash = ? ORDER BY position',
+            (digest,)
+        )
+        return [url for url, in rows]
+    
+    def _entry(self, row: tuple) -> Dict:
+        """Build a search result from a torrents row"""
+        digest, name, file_size, source = row
+        return {
+            "info_hash": digest.hex().upper(),
+            "name": name,
+            "file_size": file_size,
+            "source": source,
+            "trackers": self._trackers(digest),
+        }
+    
+    def get(self, info_hash: str) -> Optional[Dict]:
+        """
+        Look up a torrent by info hash
+        
+        Args:
+            info_hash: Info hash (hexadecimal)
+        
+        Returns:
+            Dictionary with info_hash, name, file_size, source and trackers,
+            or None if the torrent is not in the catalog
+        """
+        self.flush()
+        row = self._db.execute(
+            'SELECT info_hash, name, file_size, source FROM torrents WHERE info_hash = ?',
+            (bytes.fromhex(info_hash),)
+        ).fetchone()
+        return self._entry(row) if row is not None else None
+    
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Find torrents by name or info hash
+        
+        A 40-character hexadecimal query is looked up as an info hash.
+        Otherwise every word must start a word of the name (with FTS5) or
+        appear in the name (without FTS5), ignoring case.
+        
+        Args:
+            query: Search words or info hash
+            limit: Maximum number of results
+        
+        Returns:
+            Matching torrents as returned by get(), best matches first
+        """
+        query = query.strip()
+        if _HEX_HASH.fullmatch(query):
+            entry = self.get(query)
+            return [entry] if entry is not None else []
+        words = query.split()
+        if not words:
+            return []
+        
+        self.flush()
+        if self.full_text:
+            rows = self._db.execute(
+                'SELECT t.info_hash, t.name, t.file_size, t.source '
+                'FROM torrents_fts JOIN torrents AS t ON t.rowid = torrents_fts.rowid '
+                'WHERE torrents_fts MATCH ? ORDER BY rank LIMIT ?',
+                (_fts_query(query), limit)
+            ).fetchall()
+        else:
+            conditions = ' AND '.join(["name LIKE ? ESCAPE '\\'"] * len(words))
+            rows = self._db.execute(
+                f'SELECT info_hash, name, file_size, source FROM torrents '
+                f'WHERE {conditions} ORDER BY name LIMIT ?',
+                [_like_pattern(word) for word in words] + [limit]
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+    
+    def __len__(self) -> int:
+        self.flush()
+        return self._db.execute('SELECT COUNT(*) FROM torrents').fetchone()[0]
+    
+    def close(self):
+        """Commit pending additions and close the database"""
+        try:
+            self.flush()
+        finally:
+            self._db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
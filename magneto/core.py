@@ -2,85 +2,895 @@
 Core conversion module - Handles torrent file to magnet link conversion
 """
 import hashlib
-import urllib.error
+import io
+import mmap
+import os
+import threading
 import urllib.parse
-import urllib.request
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from time import perf_counter
+from typing import (
+    TYPE_CHECKING, AsyncIterator, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+)
 
-try:
-    import bencode
-except ImportError:
-    bencode = None
+if TYPE_CHECKING:
+    # Imported on demand: the HTTP stack, SQLite and the timing statistics
+    # are not needed to convert local files
+    from .cache import ConversionCache
+    from .network import ConnectionPool
+    from .stats import ConversionStats
+
+from .result import ConversionResult
+from .trackers import TRACKER_CACHE_SIZE, TrackerRegistry
+
+# Bencode token bytes (indexing bytes/mmap yields ints)
+_INT = ord('i')
+_LIST = ord('l')
+_DICT = ord('d')
+_END = ord('e')
+_DIGIT_0 = ord('0')
+_DIGIT_9 = ord('9')
+
+# Files at least this large are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 256 * 1024
+
+# Default memory budget for files read ahead by the prefetcher
+PREFETCH_BYTES = 64 * 1024 * 1024
+
+# Default cap on the size of a downloaded torrent file
+MAX_DOWNLOAD_BYTES = 64 * 1024 * 1024
+
+# Size of the chunks read from a download response
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Headers sent with every torrent download
+_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+}
+
+# Per-process converter used by convert_many worker processes
+_worker_converter = None
+
+
+class _DownloadTooLarge(Exception):
+    """Raised while streaming a download that exceeds its size limit"""
+
+
+class _PrefetchCancelled(Exception):
+    """Raised in prefetch reader threads once the consumer has stopped"""
+
+
+class _ReadBudget:
+    """Byte budget shared by prefetch reader threads"""
+    
+    def __init__(self, max_bytes: int):
+        self._cond = threading.Condition()
+        self._max_bytes = max_bytes
+        self._used = 0
+        self._turn = 0
+        self._closed = False
+    
+    def acquire(self, ticket: int, size: int):
+        """
+        Reserve size bytes for the read with the given ticket
+        
+        Reservations are granted strictly in ticket order, so an early file
+        can never be starved by later ones. A single file larger than the
+        whole budget is admitted once nothing else is held.
+        
+        Raises:
+            _PrefetchCancelled: The budget was closed while waiting
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed or (
+                self._turn == ticket
+                and (self._used == 0 or self._used + size <= self._max_bytes)
+            ))
+            if self._closed:
+                raise _PrefetchCancelled()
+            self._used += size
+            self._turn += 1
+            self._cond.notify_all()
+    
+    def release(self, size: int):
+        """Return size bytes to the budget"""
+        with self._cond:
+            self._used -= size
+            self._cond.notify_all()
+    
+    def close(self):
+        """Wake up and cancel all waiting readers"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+# Keys materialized by the selective decoder; everything else is skipped
+_TOP_LEVEL_KEYS = frozenset((b'announce', b'announce-list', b'name'))
+_INFO_KEYS = frozenset((b'name',))
+_INFO_KEYS_WITH_FILES = _INFO_KEYS | {b'files'}
+
+
+class _TorrentDict(dict):
+    """Decoded torrent dictionary that remembers the info hash of its source bytes"""
+    
+    __slots__ = ('info_hash', 'hash_seconds')
+
+
+class _PartialInfo(dict):
+    """Info dictionary holding only the keys decoded for conversion, which cannot be re-encoded"""
+    
+    __slots__ = ()
+
+
+def _string_bounds(data, pos: int) -> Tuple[int, int]:
+    """
+    Locate the payload of the bencoded byte string starting at pos
+    
+    Args:
+        data: Bencoded buffer (bytes, bytearray or mmap)
+        pos: Offset of the string's length prefix
+        
+    Returns:
+        Tuple of (payload_start, payload_end) offsets
+        
+    Raises:
+        ValueError: Malformed or truncated string
+    """
+    colon = data.find(b':', pos)
+    if colon < 0:
+        raise ValueError(f"Unterminated string length at offset {pos}")
+    length = data[pos:colon]
+    if not length.isdigit():
+        raise ValueError(f"Invalid string length at offset {pos}")
+    start = colon + 1
+    end = start + int(length)
+    if end > len(data):
+        raise ValueError(f"String at offset {pos} runs past end of data")
+    return start, end
+
+
+def _skip_value(data, pos: int) -> int:
+    """
+    Skip over the bencoded value starting at pos without decoding it
+    
+    Args:
+        data: Bencoded buffer (bytes, bytearray or mmap)
+        pos: Offset of the value's first byte
+        
+    Returns:
+        Offset just past the end of the value
+        
+    Raises:
+        ValueError: Malformed or truncated value
+    """
+    size = len(data)
+    depth = 0
+    while True:
+        if pos >= size:
+            raise ValueError("Unexpected end of data")
+        token = data[pos]
+        if token == _LIST or token == _DICT:
+            depth += 1
+            pos += 1
+            continue
+        if token == _INT:
+            pos = data.find(b'e', pos + 1)
+            if pos < 0:
+                raise ValueError("Unterminated integer")
+            pos += 1
+        elif token == _END:
+            if depth == 0:
+                raise ValueError(f"Unexpected end marker at offset {pos}")
+            depth -= 1
+            pos += 1
+        elif _DIGIT_0 <= token <= _DIGIT_9:
+            pos = _string_bounds(data, pos)[1]
+        else:
+            raise ValueError(f"Invalid token at offset {pos}")
+        if depth == 0:
+            return pos
+
+
+def _text(raw):
+    """Decode a byte string as UTF-8 text, keeping raw bytes if it is not valid UTF-8"""
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return bytes(raw)
+
+
+def _decode_value(data, pos: int):
+    """
+    Fully decode the bencoded value starting at pos
+    
+    Args:
+        data: Bencoded buffer (bytes, bytearray or mmap)
+        pos: Offset of the value's first byte
+        
+    Returns:
+        Tuple of (value, end_offset)
+        
+    Raises:
+        ValueError: Malformed or truncated value
+    """
+    if pos >= len(data):
+        raise ValueError("Unexpected end of data")
+    token = data[pos]
+    
+    if _DIGIT_0 <= token <= _DIGIT_9:
+        start, end = _string_bounds(data, pos)
+        return _text(data[start:end]), end
+    
+    if token == _INT:
+        end = data.find(b'e', pos + 1)
+        if end < 0:
+            raise ValueError("Unterminated integer")
+        return int(data[pos + 1:end]), end + 1
+    
+    if token == _LIST:
+        items = []
+        pos += 1
+        while pos < len(data) and data[pos] != _END:
+            item, pos = _decode_value(data, pos)
+            items.append(item)
+        if pos >= len(data):
+            raise ValueError("Unexpected end of data")
+        return items, pos + 1
+    
+    if token == _DICT:
+        result = {}
+        pos += 1
+        while pos < len(data) and data[pos] != _END:
+            key_start, key_end = _string_bounds(data, pos)
+            result[_text(data[key_start:key_end])], pos = _decode_value(data, key_end)
+        if pos >= len(data):
+            raise ValueError("Unexpected end of data")
+        return result, pos + 1
+    
+    raise ValueError(f"Invalid token at offset {pos}")
+
+
+def _decode_dict(data, pos: int, keys: frozenset, on_key=None):
+    """
+    Decode only the selected keys of the bencoded dictionary starting at pos
+    
+    Values of other keys are skipped by their length prefixes without being
+    materialized.
+    
+    Args:
+        data: Bencoded buffer (bytes, bytearray or mmap)
+        pos: Offset of the dictionary's 'd' marker
+        keys: Raw keys whose values should be decoded
+        on_key: Optional mapping of raw key to a handler(data, value_start)
+            returning (value, end_offset), for keys that need custom decoding
+        
+    Returns:
+        Tuple of (dictionary, end_offset)
+        
+    Raises:
+        ValueError: Malformed or truncated dictionary
+    """
+    if pos >= len(data) or data[pos] != _DICT:
+        raise ValueError("Data is not a bencoded dictionary")
+    
+    result = {}
+    pos += 1
+    size = len(data)
+    while pos < size and data[pos] != _END:
+        if not _DIGIT_0 <= data[pos] <= _DIGIT_9:
+            raise ValueError(f"Dictionary key at offset {pos} is not a string")
+        key_start, key_end = _string_bounds(data, pos)
+        key = bytes(data[key_start:key_end])
+        if on_key is not None and key in on_key:
+            result[_text(key)], pos = on_key[key](data, key_end)
+        elif key in keys:
+            result[_text(key)], pos = _decode_value(data, key_end)
+        else:
+            pos = _skip_value(data, key_end)
+    
+    if pos >= size:
+        raise ValueError("Unexpected end of data")
+    return result, pos + 1
+
+
+def _decode_torrent(
+    data,
+    include_files: bool = False,
+    hash_info: bool = True,
+    timed: bool = False
+) -> _TorrentDict:
+    """
+    Selectively decode raw torrent data
+    
+    Only the fields needed for conversion are materialized (announce,
+    announce-list, root name, info.name and optionally info.files). The
+    info value is hashed in place while it is being scanned, so the pieces
+    blob is never copied.
+    
+    Args:
+        data: Bencoded torrent buffer (bytes, bytearray or mmap)
+        include_files: Whether to also decode info.files
+        hash_info: Whether to hash the info value (callers that already
+            know the hash can skip it)
+        timed: Whether to measure the time spent hashing
+        
+    Returns:
+        Decoded torrent dictionary with its info_hash attribute set
+        (None if the torrent has no info field or hash_info is False) and
+        hash_seconds set to the hashing time (0.0 unless timed)
+        
+    Raises:
+        ValueError: Data is not a valid bencoded dictionary
+    """
+    info_keys = _INFO_KEYS_WITH_FILES if include_files else _INFO_KEYS
+    info_hash = None
+    hash_seconds = 0.0
+    
+    def decode_info(buffer, start):
+        nonlocal info_hash, hash_seconds
+        info, end = _decode_dict(buffer, start, info_keys)
+        info = _PartialInfo(info)
+        if not hash_info:
+            return info, end
+        if timed:
+            started = perf_counter()
+        with memoryview(buffer) as view, view[start:end] as info_view:
+            info_hash = hashlib.sha1(info_view).digest().hex().upper()
+        if timed:
+            hash_seconds = perf_counter() - started
+        return info, end
+    
+    fields, _ = _decode_dict(data, 0, _TOP_LEVEL_KEYS, {b'info': decode_info})
+    torrent = _TorrentDict(fields)
+    torrent.info_hash = info_hash
+    torrent.hash_seconds = hash_seconds
+    return torrent
+
+
+def _encode(value, out: list):
+    """
+    Bencode a Python value into a list of byte chunks
+    
+    Args:
+        value: dict, list, tuple, int, str or bytes to encode
+        out: List that receives the encoded chunks
+        
+    Raises:
+        TypeError: Value type cannot be bencoded
+    """
+    if isinstance(value, (bytes, bytearray)):
+        out.append(b'%d:' % len(value))
+        out.append(bytes(value))
+    elif isinstance(value, str):
+        _encode(value.encode('utf-8'), out)
+    elif isinstance(value, bool) or not isinstance(value, (int, list, tuple, dict)):
+        raise TypeError(f"Cannot bencode value of type {type(value).__name__}")
+    elif isinstance(value, int):
+        out.append(b'i%de' % value)
+    elif isinstance(value, (list, tuple)):
+        out.append(b'l')
+        for item in value:
+            _encode(item, out)
+        out.append(b'e')
+    else:
+        out.append(b'd')
+        items = [
+            (key.encode('utf-8') if isinstance(key, str) else bytes(key), item)
+            for key, item in value.items()
+        ]
+        for key, item in sorted(items, key=lambda pair: pair[0]):
+            _encode(key, out)
+            _encode(item, out)
+        out.append(b'e')
+
+
+class _StreamScanner:
+    """
+    Incremental scanner for torrent data arriving in chunks
+    
+    Tracks the structure of the top-level dictionary without decoding it,
+    rejects data that is not a bencoded dictionary as soon as the first byte
+    arrives, and hashes the info value while its bytes come in. String
+    payloads are skipped by their length prefixes, so each byte is examined
+    at most once.
+    """
+    
+    def __init__(self):
+        self.buffer = bytearray()
+        self.info_end = None
+        self.closed = False
+        self._pos = 0
+        self._depth = 0
+        self._skip = 0
+        self._expect_key = False
+        self._key = None
+        self._keys_sorted = True
+        self._info_start = None
+        self._hashed = 0
+        self._hasher = None
+    
+    @property
+    def info_hash(self) -> Optional[str]:
+        """Hex info hash once the info value is complete, else None"""
+        if self.info_end is None:
+            return None
+        return self._hasher.hexdigest().upper()
+    
+    @property
+    def info_complete(self) -> bool:
+        """
+        Whether everything needed for conversion has been received
+        
+        True once the top-level dictionary is closed, or once the info value
+        is complete and all keys so far were in canonical (sorted) order, in
+        which case announce and announce-list cannot follow it.
+        """
+        return self.closed or (self.info_end is not None and self._keys_sorted)
+    
+    def feed(self, chunk: bytes):
+        """
+        Append a chunk of data and scan as far as possible
+        
+        Raises:
+            ValueError: Data is not a valid bencoded dictionary
+        """
+        self.buffer += chunk
+        self._scan()
+        if self._info_start is not None:
+            end = self.info_end if self.info_end is not None else self._pos
+            if end > self._hashed:
+                with memoryview(self.buffer) as view, view[self._hashed:end] as part:
+                    self._hasher.update(part)
+                self._hashed = end
+    
+    def _value_done(self):
+        """Record the end of a value; at top level the next token is a key"""
+        if self._depth == 1:
+            self._expect_key = True
+            if self._key == b'info':
+                self.info_end = self._pos
+    
+    def _length(self, buf, pos: int) -> Optional[Tuple[int, int]]:
+        """Parse a string length prefix, returning (payload_start, length) or None if incomplete"""
+        colon = buf.find(b':', pos)
+        if colon < 0:
+            if len(buf) - pos > 20:
+                raise ValueError(f"Invalid string length at offset {pos}")
+            return None
+        length = buf[pos:colon]
+        if not length.isdigit():
+            raise ValueError(f"Invalid string length at offset {pos}")
+        return colon + 1, int(length)
+    
+    def _scan(self):
+        """Advance the scan position through all complete tokens in the buffer"""
+        buf = self.buffer
+        size = len(buf)
+        while not self.closed:
+            if self._skip:
+                step = min(self._skip, size - self._pos)
+                self._pos += step
+                self._skip -= step
+                if self._skip:
+                    return
+                self._value_done()
+                continue
+            
+            if self._pos >= size:
+                return
+            token = buf[self._pos]
+            
+            if self._depth == 0:
+                if token != _DICT:
+                    raise ValueError("Data is not a bencoded dictionary")
+                self._depth = 1
+                self._pos += 1
+                self._expect_key = True
+                continue
+            
+            if self._depth == 1 and self._expect_key:
+                if token == _END:
+                    self._depth = 0
+                    self._pos += 1
+                    self.closed = True
+                    return
+                if not _DIGIT_0 <= token <= _DIGIT_9:
+                    raise ValueError(f"Dictionary key at offset {self._pos} is not a string")
+                parsed = self._length(buf, self._pos)
+                if parsed is None or parsed[0] + parsed[1] > size:
+                    return
+                start, length = parsed
+                key = bytes(buf[start:start + length])
+                if self._key is not None and key <= self._key:
+                    self._keys_sorted = False
+                self._key = key
+                self._expect_key = False
+                self._pos = start + length
+                if key == b'info' and self._info_start is None:
+                    self._info_start = self._hashed = self._pos
+                    self._hasher = hashlib.sha1()
+                continue
+            
+            if token == _LIST or token == _DICT:
+                self._depth += 1
+                self._pos += 1
+            elif token == _INT:
+                end = buf.find(b'e', self._pos + 1)
+                if end < 0:
+                    if size - self._pos > 32:
+                        raise ValueError(f"Unterminated integer at offset {self._pos}")
+                    return
+                self._pos = end + 1
+                self._value_done()
+            elif token == _END:
+                if self._depth == 1:
+                    raise ValueError(f"Missing value for key at offset {self._pos}")
+                self._depth -= 1
+                self._pos += 1
+                self._value_done()
+            elif _DIGIT_0 <= token <= _DIGIT_9:
+                parsed = self._length(buf, self._pos)
+                if parsed is None:
+                    return
+                self._pos, self._skip = parsed
+                if not self._skip:
+                    self._value_done()
+            else:
+                raise ValueError(f"Invalid token at offset {self._pos}")
+
+
+def _find_info_span(data) -> Optional[Tuple[int, int]]:
+    """
+    Find the byte range of the top-level info value in raw torrent data
+    
+    Args:
+        data: Bencoded torrent buffer (bytes, bytearray or mmap)
+        
+    Returns:
+        Tuple of (start, end) offsets of the info value, or None if absent
+        
+    Raises:
+        ValueError: Data is not a valid bencoded dictionary
+    """
+    if not len(data) or data[0] != _DICT:
+        raise ValueError("Data is not a bencoded dictionary")
+    
+    pos = 1
+    size = len(data)
+    while pos < size and data[pos] != _END:
+        if not _DIGIT_0 <= data[pos] <= _DIGIT_9:
+            raise ValueError(f"Dictionary key at offset {pos} is not a string")
+        key_start, key_end = _string_bounds(data, pos)
+        value_end = _skip_value(data, key_end)
+        if data[key_start:key_end] == b'info':
+            return key_end, value_end
+        pos = value_end
+    
+    if pos >= size:
+        raise ValueError("Unexpected end of data")
+    return None
+
+
+def _feed_scanner(scanner: _StreamScanner, read: Callable, max_bytes: int, stop_after_info: bool) -> int:
+    """
+    Feed chunks from a read(size) callable to a scanner until the data ends
+    
+    Args:
+        scanner: Scanner receiving the data
+        read: Function returning the next chunk of at most size bytes
+            (empty at the end of the data)
+        max_bytes: Maximum accepted size in bytes
+        stop_after_info: Whether to stop as soon as everything needed for
+            conversion has been received
+        
+    Returns:
+        Number of bytes received
+        
+    Raises:
+        _DownloadTooLarge: Data exceeds max_bytes
+        ValueError: Data is not a bencoded torrent
+    """
+    received = 0
+    while not (stop_after_info and scanner.info_complete):
+        chunk = read(_DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        received += len(chunk)
+        if received > max_bytes:
+            raise _DownloadTooLarge(received)
+        scanner.feed(chunk)
+    return received
+
+
+def _download_error(url: str, max_bytes: int, error: Exception) -> Exception:
+    """Map an exception raised while downloading url to the one reported"""
+    if isinstance(error, _DownloadTooLarge):
+        return IOError(
+            f"Torrent file from {url} exceeds maximum size of {max_bytes} bytes "
+            f"({error.args[0]} bytes)"
+        )
+    if isinstance(error, ValueError):
+        return ValueError(f"Unable to parse torrent file from {url}: {error}")
+    if isinstance(error, OSError):
+        return IOError(f"Unable to download from URL {url}: {error}")
+    return IOError(f"Error downloading torrent file from {url}: {error}")
+
+
+def _populate(mapping: mmap.mmap):
+    """
+    Read every page of a memory-mapped file into the page cache
+    
+    Mapping a file does not read it; without this the disk reads of a
+    prefetched file would happen as page faults on whichever thread first
+    touches the data.
+    """
+    if hasattr(mmap, 'MADV_WILLNEED'):
+        mapping.madvise(mmap.MADV_WILLNEED)
+    # Slicing reads one byte of each page, faulting them all in from C
+    mapping[::mmap.PAGESIZE]
+
+
+def _as_buffer(data) -> Union[bytes, bytearray, mmap.mmap]:
+    """
+    Get a buffer the decoder can scan from bytes-like torrent data
+    
+    A memoryview covering a whole bytes, bytearray or mmap object is
+    unwrapped without copying; other memoryviews are copied.
+    
+    Raises:
+        TypeError: data is not a bytes-like object
+    """
+    if isinstance(data, (bytes, bytearray, mmap.mmap)):
+        return data
+    if isinstance(data, memoryview):
+        base = data.obj
+        if isinstance(base, (bytes, bytearray, mmap.mmap)) and data.contiguous and data.nbytes == len(base):
+            return base
+        return data.tobytes()
+    raise TypeError(f"Torrent data must be a bytes-like object, not {type(data).__name__}")
 
 
 class TorrentConverter:
     """Torrent file converter"""
     
-    def __init__(self):
-        if bencode is None:
-            raise ImportError(
-                "bencode module is not installed. Please run: pip install bencode.py"
-            )
+    def __init__(
+        self,
+        mmap_threshold: int = MMAP_THRESHOLD,
+        pool_size: int = 8,
+        idle_timeout: float = 30.0,
+        max_download_bytes: int = MAX_DOWNLOAD_BYTES,
+        cache: Optional['ConversionCache'] = None,
+        timings: bool = False,
+        tracker_cache_size: int = TRACKER_CACHE_SIZE
+    ):
+        """
+        Initialize converter
+        
+        Args:
+            mmap_threshold: Minimum file size in bytes for memory-mapped reads
+                (default: 256 KiB); smaller files are read into memory
+            pool_size: Maximum number of idle keep-alive HTTP connections
+                reused across downloads (0 disables reuse)
+            idle_timeout: Seconds after which an idle HTTP connection is closed
+            max_download_bytes: Maximum size of a downloaded torrent file
+                (default: 64 MiB)
+            cache: Conversion cache consulted before reading torrent files;
+                unchanged files are converted without being read
+            timings: Whether to record per-stage timings in self.stats
+                (a ConversionStats, None when disabled)
+            tracker_cache_size: Number of tracker URLs whose shared and
+                encoded forms are kept in self.tracker_registry
+        """
+        self.mmap_threshold = mmap_threshold
+        self.max_download_bytes = max_download_bytes
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.cache = cache
+        self.tracker_registry = TrackerRegistry(tracker_cache_size)
+        self.stats: Optional['ConversionStats'] = None
+        if timings:
+            from .stats import ConversionStats
+            self.stats = ConversionStats()
+        self._http: Optional['ConnectionPool'] = None
+        self._http_lock = threading.Lock()
+    
+    @property
+    def http(self) -> 'ConnectionPool':
+        """HTTP connection pool, created on the first download"""
+        if self._http is None:
+            with self._http_lock:
+                if self._http is None:
+                    from .network import ConnectionPool
+                    self._http = ConnectionPool(
+                        max_size=self.pool_size, idle_timeout=self.idle_timeout
+                    )
+        return self._http
+    
+    def close(self):
+        """Close pooled HTTP connections and commit pending cache writes"""
+        if self._http is not None:
+            self._http.close()
+        if self.cache is not None:
+            self.cache.flush()
     
-    def download_torrent_file(self, url: str, timeout: int = 30) -> bytes:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def download_torrent_file(
+        self,
+        url: str,
+        timeout: int = 30,
+        max_bytes: Optional[int] = None
+    ) -> bytes:
         """
         Download torrent file from URL
         
+        The response is streamed through an incremental bencode scanner, so
+        content that is not a torrent (such as an HTML error page) is rejected
+        as soon as it starts arriving. Connections are kept alive and reused
+        for later downloads from the same host.
+        
         Args:
             url: URL of the torrent file
             timeout: Request timeout in seconds (default: 30)
+            max_bytes: Maximum accepted size in bytes
+                (default: the converter's max_download_bytes)
             
         Returns:
             Binary content of the torrent file
             
         Raises:
-            IOError: Download failed
+            IOError: Download failed or file exceeds max_bytes
+            ValueError: Downloaded data is not a bencoded torrent
         """
-        try:
-            # Create request with User-Agent header
-            req = urllib.request.Request(url)
-            req.add_header('User-Agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+        scanner, _ = self._download(url, timeout, max_bytes, stop_after_info=False)
+        return bytes(scanner.buffer)
+    
+    def _download(
+        self,
+        url: str,
+        timeout: int,
+        max_bytes: Optional[int],
+        stop_after_info: bool
+    ) -> Tuple[_StreamScanner, int]:
+        """
+        Stream a torrent download into a _StreamScanner
+        
+        Args:
+            url: URL of the torrent file
+            timeout: Request timeout in seconds
+            max_bytes: Maximum accepted size in bytes (None: converter default)
+            stop_after_info: Whether to stop reading as soon as everything
+                needed for conversion has arrived
             
-            # Download the file
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                torrent_data = response.read()
+        Returns:
+            Tuple of (scanner, file_size) where file_size is the announced
+            Content-Length if any, else the number of bytes received
+            
+        Raises:
+            IOError: Download failed or file exceeds max_bytes
+            ValueError: Downloaded data is not a bencoded torrent
+        """
+        if max_bytes is None:
+            max_bytes = self.max_download_bytes
+        scanner = _StreamScanner()
+        received = 0
+        content_length = None
+        
+        try:
+            # Download the file over a pooled connection
+            with self.http.open(url, headers=_REQUEST_HEADERS, timeout=timeout) as response:
+                headers = getattr(response, 'headers', None)
+                if headers is not None and headers.get('Content-Length', '').isdigit():
+                    content_length = int(headers['Content-Length'])
+                    if content_length > max_bytes:
+                        raise _DownloadTooLarge(content_length)
                 
-            if not torrent_data:
-                raise IOError(f"Downloaded file is empty: {url}")
+                received = _feed_scanner(scanner, response.read, max_bytes, stop_after_info)
+        except Exception as e:
+            raise _download_error(url, max_bytes, e)
+        
+        if not received:
+            raise IOError(f"Downloaded file is empty: {url}")
+        
+        return scanner, content_length if content_length is not None else received
+    
+    async def _adownload(
+        self,
+        url: str,
+        timeout: int,
+        max_bytes: Optional[int],
+        stop_after_info: bool
+    ) -> Tuple[_StreamScanner, int]:
+        """
+        Stream a torrent download into a _StreamScanner without blocking
+        
+        Asynchronous counterpart of _download; each chunk is scanned and
+        hashed on the event loop as it arrives, which is bounded work.
+        """
+        import asyncio
+        from .asyncnet import open_url
+        
+        if max_bytes is None:
+            max_bytes = self.max_download_bytes
+        scanner = _StreamScanner()
+        received = 0
+        content_length = None
+        
+        try:
+            async with await open_url(url, headers=_REQUEST_HEADERS, timeout=timeout) as response:
+                if response.headers.get('Content-Length', '').isdigit():
+                    content_length = int(response.headers['Content-Length'])
+                    if content_length > max_bytes:
+                        raise _DownloadTooLarge(content_length)
                 
-            return torrent_data
-            
-        except urllib.error.URLError as e:
-            raise IOError(f"Unable to download from URL {url}: {e}")
+                while not (stop_after_info and scanner.info_complete):
+                    chunk = await response.read(_DOWNLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise _DownloadTooLarge(received)
+                    scanner.feed(chunk)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            raise IOError(f"Error downloading torrent file from {url}: {e}")
+            raise _download_error(url, max_bytes, e)
+        
+        if not received:
+            raise IOError(f"Downloaded file is empty: {url}")
+        
+        return scanner, content_length if content_length is not None else received
     
-    def read_torrent_file(self, torrent_path: Path) -> bytes:
+    def read_torrent_file(self, torrent_path: Path, use_mmap: bool = False) -> bytes:
         """
         Read torrent file content
         
         Args:
             torrent_path: Path to the torrent file
+            use_mmap: Whether to memory-map files of at least mmap_threshold
+                bytes instead of reading them into memory
             
         Returns:
-            Binary content of the torrent file
+            Binary content of the torrent file. In mmap mode this may be a
+            read-only mmap.mmap, which the caller is responsible for closing.
             
         Raises:
             IOError: File read failed
         """
         try:
             with open(torrent_path, 'rb') as f:
+                if use_mmap:
+                    size = os.fstat(f.fileno()).st_size
+                    if size and size >= self.mmap_threshold:
+                        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
                 return f.read()
         except Exception as e:
             raise IOError(f"Unable to read file {torrent_path}: {e}")
     
-    def parse_torrent(self, torrent_data: bytes) -> Dict:
+    def parse_torrent(self, torrent_data: bytes, include_files: bool = False) -> Dict:
         """
         Parse torrent file data
         
+        Only the fields used for conversion are decoded: announce,
+        announce-list, name and info.name (plus info.files on request).
+        Everything else, including the pieces blob, is skipped without
+        being copied. The info hash is computed during parsing and can be
+        retrieved with get_info_hash on the returned dictionary.
+        
+        Because its info section is incomplete, the returned dictionary
+        cannot be re-encoded to compute the info hash: get_info_hash
+        returns the hash recorded during parsing, and copies of the
+        dictionary need the raw bytes instead.
+        
         Args:
             torrent_data: Binary data of the torrent file
+            include_files: Whether to also decode the info.files list
             
         Returns:
             Parsed torrent dictionary data
@@ -89,31 +899,63 @@ class TorrentConverter:
             ValueError: Torrent file format error
         """
         try:
-            return bencode.bdecode(torrent_data)
+            return _decode_torrent(torrent_data, include_files=include_files)
         except Exception as e:
             raise ValueError(f"Unable to parse torrent file: {e}")
     
-    def get_info_hash(self, torrent_data: Dict) -> str:
+    def get_info_hash(self, torrent_data: Union[Dict, bytes]) -> str:
         """
         Extract info hash from torrent data
         
+        When given the raw torrent bytes, the info value is located in place
+        and hashed exactly as stored, which matches what BitTorrent clients
+        compute even for torrents with non-canonical key order. Dictionaries
+        returned by parse_torrent carry the hash computed while parsing; any
+        other fully decoded dictionary (e.g. from bencode.bdecode) is hashed
+        by re-encoding its info section.
+        
         Args:
-            torrent_data: Parsed torrent data dictionary
+            torrent_data: Raw torrent bytes or parsed torrent data dictionary
             
         Returns:
             Info hash as hexadecimal string (uppercase)
             
         Raises:
-            ValueError: Torrent data missing info field
+            ValueError: Torrent data missing info field or malformed, or a
+                parsed dictionary whose hash is not known (copies of
+                parse_torrent output hold only part of the info section)
         """
-        if 'info' not in torrent_data:
+        if isinstance(torrent_data, dict):
+            if 'info' not in torrent_data:
+                raise ValueError("Torrent file is missing info field")
+            if getattr(torrent_data, 'info_hash', None):
+                return torrent_data.info_hash
+            if isinstance(torrent_data, _TorrentDict) or isinstance(torrent_data['info'], _PartialInfo):
+                # Re-encoding the few decoded keys would give a wrong hash
+                raise ValueError(
+                    "Info hash of partially decoded torrent data is unknown; pass the raw torrent bytes instead"
+                )
+            
+            # Re-encode info section
+            encoded = []
+            _encode(torrent_data['info'], encoded)
+            info_encoded = b''.join(encoded)
+            # Calculate SHA1 hash
+            info_hash = hashlib.sha1(info_encoded).digest()
+            # Convert to hexadecimal string (uppercase)
+            return info_hash.hex().upper()
+        
+        try:
+            span = _find_info_span(torrent_data)
+        except ValueError as e:
+            raise ValueError(f"Unable to parse torrent file: {e}")
+        if span is None:
             raise ValueError("Torrent file is missing info field")
         
-        # Re-encode info section
-        info_encoded = bencode.bencode(torrent_data['info'])
-        # Calculate SHA1 hash
-        info_hash = hashlib.sha1(info_encoded).digest()
-        # Convert to hexadecimal string (uppercase)
+        # Hash the original bytes of the info value without copying them
+        start, end = span
+        with memoryview(torrent_data) as view, view[start:end] as info_view:
+            info_hash = hashlib.sha1(info_view).digest()
         return info_hash.hex().upper()
     
     def get_torrent_name(self, torrent_data: Dict) -> Optional[str]:
@@ -166,13 +1008,10 @@ class TorrentConverter:
             encoded_name = urllib.parse.quote(name, safe='')
             magnet += f"&dn={encoded_name}"
         
-        # Add trackers
+        # Add trackers, encoded once per distinct tracker
         if trackers:
-            for tracker in trackers:
-                if isinstance(tracker, bytes):
-                    tracker = tracker.decode('utf-8', errors='ignore')
-                encoded_tracker = urllib.parse.quote(tracker, safe='')
-                magnet += f"&tr={encoded_tracker}"
+            encode = self.tracker_registry.encode
+            magnet += ''.join([f"&tr={encoded}" for encoded in map(encode, trackers) if encoded])
         
         return magnet
     
@@ -184,105 +1023,937 @@ class TorrentConverter:
             torrent_data: Parsed torrent data dictionary
             
         Returns:
-            List of tracker URLs
+            List of distinct tracker URLs in the order they appear, shared
+            with other torrents through the tracker registry
         """
+        intern = self.tracker_registry.intern
         trackers = []
+        seen = set()
         
         # Get from announce
         if 'announce' in torrent_data:
             announce = torrent_data['announce']
-            if isinstance(announce, bytes):
-                announce = announce.decode('utf-8', errors='ignore')
-            trackers.append(announce)
+            if isinstance(announce, (str, bytes)):
+                announce = intern(announce)
+                if announce:
+                    trackers.append(announce)
+                    seen.add(announce)
         
         # Get from announce-list
-        if 'announce-list' in torrent_data:
-            for announce_group in torrent_data['announce-list']:
-                if isinstance(announce_group, list):
-                    for announce in announce_group:
-                        if isinstance(announce, bytes):
-                            announce = announce.decode('utf-8', errors='ignore')
-                        if announce not in trackers:
-                            trackers.append(announce)
-                elif isinstance(announce_group, bytes):
-                    announce = announce_group.decode('utf-8', errors='ignore')
-                    if announce not in trackers:
-                        trackers.append(announce)
+        for announce_group in torrent_data.get('announce-list') or ():
+            if not isinstance(announce_group, list):
+                announce_group = (announce_group,)
+            for announce in announce_group:
+                if not isinstance(announce, (str, bytes)):
+                    continue
+                announce = intern(announce)
+                if announce and announce not in seen:
+                    seen.add(announce)
+                    trackers.append(announce)
         
         return trackers
     
-    def convert(self, torrent_path: Path, include_trackers: bool = False) -> Tuple[str, str, Dict]:
+    def _convert_data(
+        self,
+        torrent_data_bytes: bytes,
+        include_trackers: bool,
+        info_hash: Optional[str] = None,
+        collect_trackers: bool = False
+    ) -> Tuple[str, str, Optional[str], Optional[list]]:
         """
-        Convert a single torrent file to magnet link
+        Convert raw torrent data to a magnet link
         
         Args:
-            torrent_path: Path to the torrent file
+            torrent_data_bytes: Raw torrent data (bytes or mmap)
             include_trackers: Whether to include trackers in the magnet link
+            info_hash: Info hash if already known, to avoid hashing again
+            collect_trackers: Whether to return the trackers even when they
+                are not included in the magnet link
             
         Returns:
-            Tuple of (magnet_link, info_hash, metadata)
-            metadata contains: name, trackers, etc.
+            Tuple of (magnet_link, info_hash, name, trackers)
             
         Raises:
-            IOError: File read failed
             ValueError: Torrent file format error
         """
-        torrent_data_bytes = self.read_torrent_file(torrent_path)
-        torrent_data = self.parse_torrent(torrent_data_bytes)
-        info_hash = self.get_info_hash(torrent_data)
+        stats = self.stats
+        if stats is not None:
+            started = perf_counter()
+        
+        if info_hash is None:
+            # The info value is hashed while it is being decoded, so its
+            # hashing time is taken out of the parse stage
+            try:
+                torrent_data = _decode_torrent(torrent_data_bytes, timed=stats is not None)
+            except Exception as e:
+                raise ValueError(f"Unable to parse torrent file: {e}")
+            if stats is not None:
+                hashed = torrent_data.hash_seconds
+                stats.add('parse', perf_counter() - started - hashed)
+                stats.add('info_hash', hashed)
+            info_hash = self.get_info_hash(torrent_data)
+        else:
+            try:
+                torrent_data = _decode_torrent(torrent_data_bytes, hash_info=False)
+            except Exception as e:
+                raise ValueError(f"Unable to parse torrent file: {e}")
+            if stats is not None:
+                stats.add('parse', perf_counter() - started)
         
         # Get metadata
         name = self.get_torrent_name(torrent_data)
-        trackers = self.get_trackers(torrent_data) if include_trackers else None
+        trackers = None
+        if include_trackers or collect_trackers:
+            trackers = self.get_trackers(torrent_data)
         
         # Generate magnet link
-        magnet_link = self.generate_magnet_link(info_hash, name, trackers)
+        if stats is not None:
+            started = perf_counter()
+        magnet_link = self.generate_magnet_link(
+            info_hash, name, trackers if include_trackers else None
+        )
+        if stats is not None:
+            stats.add('magnet', perf_counter() - started)
+        return magnet_link, info_hash, name, trackers
+    
+    def _lookup(self, torrent_path: Path) -> Tuple[Optional[os.stat_result], Optional[tuple]]:
+        """
+        Look up a file in the conversion cache
         
-        metadata = {
-            'name': name,
-            'trackers': trackers if include_trackers else [],
-            'info_hash': info_hash,
-            'file_size': torrent_path.stat().st_size if torrent_path.exists() else 0
-        }
+        Returns:
+            Tuple of (stat, entry): stat is None when no cache is attached or
+            the file cannot be stat'ed; entry is the cached (info_hash, name,
+            trackers, file_size) tuple or None on a miss
+        """
+        if self.cache is None:
+            return None, None
+        try:
+            stat = os.stat(torrent_path)
+        except OSError:
+            return None, None
+        return stat, self.cache.get(torrent_path, stat)
+    
+    def _from_cache(
+        self,
+        entry: tuple,
+        include_trackers: bool,
+        collect_trackers: bool = False
+    ) -> Tuple[str, str, Optional[str], Optional[list], int]:
+        """Build the compact conversion result of a cache entry"""
+        info_hash, name, trackers, file_size = entry
+        if self.stats is not None:
+            started = perf_counter()
+        magnet_link = self.generate_magnet_link(
+            info_hash, name, trackers if include_trackers else None
+        )
+        if self.stats is not None:
+            self.stats.add('magnet', perf_counter() - started)
+        if not (include_trackers or collect_trackers):
+            trackers = None
+        return magnet_link, info_hash, name, trackers, file_size
+    
+    def _convert_file(
+        self,
+        torrent_path: Path,
+        include_trackers: bool,
+        use_mmap: bool,
+        collect_trackers: bool = False
+    ) -> Tuple[str, str, Optional[str], Optional[list], int]:
+        """
+        Convert a torrent file without building the metadata dictionary
+        
+        Args:
+            torrent_path: Path to the torrent file
+            include_trackers: Whether to include trackers in the magnet link
+            use_mmap: Whether to memory-map large files
+            collect_trackers: Whether to return the trackers even when they
+                are not included in the magnet link
+            
+        Returns:
+            Tuple of (magnet_link, info_hash, name, trackers, file_size)
+            
+        Raises:
+            IOError: File read failed
+            ValueError: Torrent file format error
+        """
+        stats = self.stats
+        if stats is not None:
+            started = perf_counter()
         
-        return magnet_link, info_hash, metadata
+        stat, entry = self._lookup(torrent_path)
+        if stats is not None and stat is not None:
+            stats.add('cache', perf_counter() - started)
+        if entry is not None:
+            result = self._from_cache(entry, include_trackers, collect_trackers)
+            if stats is not None:
+                stats.add_file(torrent_path, perf_counter() - started)
+            return result
+        
+        if stats is not None:
+            read_started = perf_counter()
+        torrent_data_bytes = self.read_torrent_file(torrent_path, use_mmap=use_mmap)
+        if stats is not None:
+            stats.add('read', perf_counter() - read_started)
+        try:
+            magnet_link, info_hash, name, trackers = self._convert_data(
+                torrent_data_bytes,
+                include_trackers,
+                # Cache entries always carry the trackers
+                collect_trackers=collect_trackers or stat is not None
+            )
+            file_size = len(torrent_data_bytes)
+        finally:
+            if isinstance(torrent_data_bytes, mmap.mmap):
+                torrent_data_bytes.close()
+        
+        if stat is not None:
+            self.cache.put(torrent_path, stat, info_hash, name, trackers)
+            if not (include_trackers or collect_trackers):
+                trackers = None
+        if stats is not None:
+            stats.add_file(torrent_path, perf_counter() - started)
+        return magnet_link, info_hash, name, trackers, file_size
     
-    def convert_from_url(self, url: str, include_trackers: bool = False) -> Tuple[str, str, Dict]:
+    def iter_prefetched(
+        self,
+        torrent_paths: Iterable[Path],
+        depth: int = 64,
+        max_bytes: int = PREFETCH_BYTES,
+        use_mmap: bool = True
+    ) -> Iterator[Tuple[Path, Union[bytes, Exception]]]:
+        """
+        Read torrent files ahead of the consumer on a thread pool
+        
+        Up to depth files are read concurrently while earlier files are being
+        processed, with the total size of files held at once capped by
+        max_bytes. Memory-mapped files are also paged in by the reader
+        threads, so their disk reads overlap with processing too. Each
+        buffer is only valid until the next item is requested: its budget
+        is then released and memory-mapped buffers are closed.
+        
+        Args:
+            torrent_paths: Paths of the torrent files to read
+            depth: Maximum number of files read ahead
+            max_bytes: Memory budget in bytes for files read ahead
+            use_mmap: Whether to memory-map large files
+            
+        Yields:
+            Tuple of (torrent_path, data) where data is the file content
+            or the exception raised while reading it
+        """
+        for torrent_path, data, _, _, _ in self._prefetch(
+            torrent_paths, depth, max_bytes, use_mmap, lookup=False
+        ):
+            yield torrent_path, data
+    
+    def _prefetch(
+        self,
+        torrent_paths: Iterable[Path],
+        depth: int,
+        max_bytes: int,
+        use_mmap: bool,
+        lookup: bool
+    ) -> Iterator[tuple]:
+        """
+        Implementation of iter_prefetched with optional cache lookups
+        
+        With lookup set, reader threads consult the conversion cache first
+        and cache hits are yielded without reading the file.
+        
+        Yields:
+            Tuple of (torrent_path, data, stat, entry, timing) where data is
+            None for cache hits, stat/entry are as returned by _lookup and
+            timing is (lookup_seconds, read_seconds) when timings are enabled
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        budget = _ReadBudget(max_bytes)
+        
+        timed = self.stats is not None
+        
+        def read(ticket, torrent_path):
+            # Stage timings are handed to the consumer, which owns self.stats
+            started = perf_counter() if timed else 0.0
+            size = 0
+            try:
+                stat, entry = self._lookup(torrent_path) if lookup else (None, None)
+                lookup_seconds = perf_counter() - started if timed and stat is not None else 0.0
+                if entry is None:
+                    try:
+                        size = (stat or os.stat(torrent_path)).st_size
+                    except (OSError, ValueError):
+                        # Unreadable paths fail in read_torrent_file below
+                        pass
+            finally:
+                # Always take the turn, even if the lookup failed, so that
+                # the readers of later tickets are not blocked forever
+                budget.acquire(ticket, size)
+            if entry is not None:
+                return size, None, stat, entry, (lookup_seconds, 0.0) if timed else None
+            try:
+                started = perf_counter() if timed else 0.0
+                data = self.read_torrent_file(torrent_path, use_mmap=use_mmap)
+                if isinstance(data, mmap.mmap):
+                    # Do the disk reads here, so they overlap with the consumer
+                    try:
+                        _populate(data)
+                    except Exception:
+                        data.close()
+                        raise
+                timing = (lookup_seconds, perf_counter() - started) if timed else None
+                return size, data, stat, None, timing
+            except Exception:
+                budget.release(size)
+                raise
+        
+        def take(torrent_path, future):
+            try:
+                size, data, stat, entry, timing = future.result()
+            except Exception as e:
+                yield torrent_path, e, None, None, None
+                return
+            try:
+                yield torrent_path, data, stat, entry, timing
+            finally:
+                budget.release(size)
+                if isinstance(data, mmap.mmap):
+                    data.close()
+        
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(depth, 32)))
+        try:
+            for ticket, torrent_path in enumerate(torrent_paths):
+                pending.append((torrent_path, executor.submit(read, ticket, torrent_path)))
+                if len(pending) >= depth:
+                    yield from take(*pending.popleft())
+            while pending:
+                yield from take(*pending.popleft())
+        finally:
+            budget.close()
+            executor.shutdown(wait=True)
+            # Close buffers that were read ahead but never consumed
+            for _, future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    data = future.result()[1]
+                    if isinstance(data, mmap.mmap):
+                        data.close()
+    
+    @staticmethod
+    def _build_result(
+        magnet_link: str,
+        info_hash: str,
+        name: Optional[str],
+        trackers: Optional[list],
+        file_size: int,
+        source_url: Optional[str] = None
+    ) -> ConversionResult:
+        """Build the result returned by convert"""
+        return ConversionResult(
+            magnet_link, bytes.fromhex(info_hash), name, trackers, file_size, source_url
+        )
+    
+    def convert(
+        self,
+        torrent_path: Path,
+        include_trackers: bool = False,
+        use_mmap: bool = True
+    ) -> ConversionResult:
+        """
+        Convert a single torrent file to magnet link
+        
+        Args:
+            torrent_path: Path to the torrent file
+            include_trackers: Whether to include trackers in the magnet link
+            use_mmap: Whether to memory-map large files instead of reading
+                them into memory (default: True)
+            
+        Returns:
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
+            
+        Raises:
+            IOError: File read failed
+            ValueError: Torrent file format error
+        """
+        magnet_link, info_hash, name, trackers, file_size = self._convert_file(
+            torrent_path, include_trackers, use_mmap
+        )
+        return self._build_result(magnet_link, info_hash, name, trackers, file_size)
+    
+    def convert_many(
+        self,
+        torrent_paths: Iterable[Path],
+        include_trackers: bool = False,
+        jobs: int = 1,
+        chunksize: int = 16,
+        use_mmap: bool = True,
+        prefetch: int = 0,
+        prefetch_bytes: int = PREFETCH_BYTES
+    ) -> Iterator[Tuple[Path, ConversionResult]]:
+        """
+        Convert many torrent files, optionally in parallel worker processes
+        
+        Results are yielded in the same order as torrent_paths. Errors do not
+        stop the batch: a file that fails yields a result with status ERROR
+        carrying the error message. When a cache is attached, unchanged files are converted
+        from it without being read; with worker processes the lookups are
+        made in this process and only cache misses are sent to the workers.
+        
+        Args:
+            torrent_paths: Paths of the torrent files to convert
+            include_trackers: Whether to include trackers in the magnet links
+            jobs: Number of worker processes (1 converts in this process,
+                0 uses one process per CPU)
+            chunksize: Number of files handed to a worker process at a time
+            use_mmap: Whether to memory-map large files
+            prefetch: Number of files to read ahead on a thread pool when
+                converting in this process (0 disables read-ahead)
+            prefetch_bytes: Memory budget in bytes for files read ahead
+            
+        Yields:
+            Tuple of (torrent_path, result) where result is a ConversionResult
+        """
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+        
+        if jobs <= 1 and prefetch > 0:
+            prefetched = self._prefetch(
+                torrent_paths,
+                depth=prefetch,
+                max_bytes=prefetch_bytes,
+                use_mmap=use_mmap,
+                lookup=self.cache is not None
+            )
+            for torrent_path, data, stat, entry, timing in prefetched:
+                if isinstance(data, Exception):
+                    yield torrent_path, ConversionResult.failed(data)
+                    continue
+                if timing is not None:
+                    started = perf_counter()
+                try:
+                    if entry is not None:
+                        magnet_link, info_hash, name, trackers, file_size = self._from_cache(
+                            entry, include_trackers
+                        )
+                    else:
+                        magnet_link, info_hash, name, trackers = self._convert_data(
+                            data, include_trackers, collect_trackers=stat is not None
+                        )
+                        file_size = len(data)
+                        if stat is not None:
+                            self.cache.put(torrent_path, stat, info_hash, name, trackers)
+                    result = self._build_result(
+                        magnet_link, info_hash, name, trackers if include_trackers else None, file_size
+                    )
+                except Exception as e:
+                    yield torrent_path, ConversionResult.failed(e)
+                    continue
+                if timing is not None:
+                    lookup_seconds, read_seconds = timing
+                    if stat is not None:
+                        self.stats.add('cache', lookup_seconds)
+                    if entry is None:
+                        self.stats.add('read', read_seconds)
+                    self.stats.add_file(
+                        torrent_path,
+                        lookup_seconds + read_seconds + perf_counter() - started
+                    )
+                yield torrent_path, result
+            return
+        
+        if jobs <= 1:
+            for torrent_path in torrent_paths:
+                try:
+                    yield torrent_path, self.convert(
+                        torrent_path,
+                        include_trackers=include_trackers,
+                        use_mmap=use_mmap
+                    )
+                except Exception as e:
+                    yield torrent_path, ConversionResult.failed(e)
+            return
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        stats = self.stats
+        
+        def lookup(torrent_path):
+            if stats is None:
+                return self._lookup(torrent_path) + (0.0,)
+            started = perf_counter()
+            stat, entry = self._lookup(torrent_path)
+            seconds = perf_counter() - started
+            if stat is not None:
+                stats.add('cache', seconds)
+            return stat, entry, seconds
+        
+        def drain(chunk, lookups, future):
+            converted = ()
+            if future is not None:
+                converted, worker_stats = future.result()
+                if worker_stats is not None:
+                    stats.merge(worker_stats)
+            converted = iter(converted)
+            for torrent_path, (stat, entry, lookup_seconds) in zip(chunk, lookups):
+                if entry is not None:
+                    if stats is not None:
+                        started = perf_counter()
+                    result = self._from_cache(entry, include_trackers)
+                    if stats is not None:
+                        stats.add_file(torrent_path, lookup_seconds + perf_counter() - started)
+                else:
+                    result = next(converted)
+                if isinstance(result, Exception):
+                    yield torrent_path, ConversionResult.failed(result)
+                    continue
+                magnet_link, info_hash, name, trackers, file_size = result
+                if entry is None and stat is not None:
+                    self.cache.put(torrent_path, stat, info_hash, name, trackers)
+                yield torrent_path, self._build_result(
+                    magnet_link, info_hash, name, trackers if include_trackers else None, file_size
+                )
+        
+        # Keep a bounded window of chunks in flight so that arbitrarily long
+        # path iterables are consumed lazily and results stay in input order.
+        # Cache lookups happen here in the parent, so only misses are sent
+        # to the workers, which return every tracker for the cache.
+        pending = deque()
+        paths = iter(torrent_paths)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self.mmap_threshold, stats is not None)
+        ) as executor:
+            while True:
+                chunk = list(islice(paths, max(chunksize, 1)))
+                if not chunk:
+                    break
+                lookups = [lookup(torrent_path) for torrent_path in chunk]
+                misses = [
+                    torrent_path
+                    for torrent_path, (_, entry, _) in zip(chunk, lookups)
+                    if entry is None
+                ]
+                future = None
+                if misses:
+                    future = executor.submit(
+                        _convert_chunk,
+                        misses,
+                        include_trackers,
+                        use_mmap,
+                        self.cache is not None
+                    )
+                pending.append((chunk, lookups, future))
+                if len(pending) >= jobs * 2:
+                    yield from drain(*pending.popleft())
+            while pending:
+                yield from drain(*pending.popleft())
+    
+    def convert_from_url(self, url: str, include_trackers: bool = False) -> ConversionResult:
         """
         Download torrent file from URL and convert to magnet link
         
+        The download stops as soon as the info dictionary is complete, and
+        the info hash is computed while the bytes arrive.
+        
         Args:
             url: URL of the torrent file
             include_trackers: Whether to include trackers in the magnet link
             
         Returns:
-            Tuple of (magnet_link, info_hash, metadata)
-            metadata contains: name, trackers, etc.
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
             
         Raises:
             IOError: Download failed
             ValueError: Torrent file format error
         """
-        # Download torrent file
-        torrent_data_bytes = self.download_torrent_file(url)
+        stats = self.stats
+        if stats is not None:
+            started = perf_counter()
         
-        # Parse torrent data
-        torrent_data = self.parse_torrent(torrent_data_bytes)
-        info_hash = self.get_info_hash(torrent_data)
+        # Download only as much of the file as conversion needs
+        scanner, file_size = self._download(url, 30, None, stop_after_info=True)
+        if stats is not None:
+            stats.add('download', perf_counter() - started)
+        magnet_link, info_hash, name, trackers = self._convert_scanned(
+            scanner, include_trackers, stopped_early=True
+        )
+        result = self._build_result(
+            magnet_link, info_hash, name, trackers if include_trackers else None, file_size, url
+        )
         
-        # Get metadata
-        name = self.get_torrent_name(torrent_data)
-        trackers = self.get_trackers(torrent_data) if include_trackers else None
+        if stats is not None:
+            stats.add_file(url, perf_counter() - started)
+        return result
+    
+    def _convert_scanned(
+        self,
+        scanner: _StreamScanner,
+        include_trackers: bool,
+        stopped_early: bool = False
+    ) -> Tuple[str, str, Optional[str], Optional[list]]:
+        """
+        Convert the data collected by a scanner, reusing its info hash
         
-        # Generate magnet link
-        magnet_link = self.generate_magnet_link(info_hash, name, trackers)
+        Only a download that stopped early on purpose (stopped_early) may
+        end before the top-level dictionary is closed; it is then closed
+        right after the info value. Otherwise the data must be complete.
         
-        metadata = {
-            'name': name,
-            'trackers': trackers if include_trackers else [],
-            'info_hash': info_hash,
-            'file_size': len(torrent_data_bytes),
-            'source_url': url
-        }
+        Raises:
+            ValueError: Torrent data is truncated or malformed
+        """
+        torrent_data_bytes = scanner.buffer
+        if not scanner.closed:
+            if not stopped_early:
+                raise ValueError("Unable to parse torrent file: Unexpected end of data")
+            if scanner.info_end is not None:
+                # Close the top-level dictionary right after the info value
+                del torrent_data_bytes[scanner.info_end:]
+                torrent_data_bytes += b'e'
         
-        return magnet_link, info_hash, metadata
+        return self._convert_data(
+            torrent_data_bytes, include_trackers, info_hash=scanner.info_hash
+        )
+    
+    def convert_bytes(self, data, include_trackers: bool = False) -> ConversionResult:
+        """
+        Convert torrent data held in memory to magnet link
+        
+        The data is parsed in place; a memoryview is only copied when it
+        covers part of its underlying object.
+        
+        Args:
+            data: Torrent file content (bytes, bytearray, memoryview or mmap)
+            include_trackers: Whether to include trackers in the magnet link
+            
+        Returns:
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
+            
+        Raises:
+            TypeError: data is not a bytes-like object
+            ValueError: Torrent file format error
+        """
+        buffer = _as_buffer(data)
+        magnet_link, info_hash, name, trackers = self._convert_data(buffer, include_trackers)
+        return self._build_result(magnet_link, info_hash, name, trackers, len(buffer))
+    
+    def convert_stream(
+        self,
+        fileobj: BinaryIO,
+        include_trackers: bool = False,
+        max_bytes: Optional[int] = None
+    ) -> ConversionResult:
+        """
+        Read torrent data from a binary file object and convert to magnet link
+        
+        The stream is read to its end in chunks; the info hash is computed
+        while the chunks arrive, and data that is not a bencoded dictionary
+        is rejected as soon as its first byte is read.
+        
+        Args:
+            fileobj: Binary file object, such as sys.stdin.buffer, an upload
+                body or io.BytesIO
+            include_trackers: Whether to include trackers in the magnet link
+            max_bytes: Maximum accepted size in bytes (default: the
+                converter's max_download_bytes)
+            
+        Returns:
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
+            
+        Raises:
+            TypeError: fileobj is a text stream
+            IOError: Read failed or data exceeds max_bytes
+            ValueError: Torrent file format error
+        """
+        if isinstance(fileobj, io.TextIOBase):
+            raise TypeError("Torrent data must be read from a binary stream, not a text stream")
+        if max_bytes is None:
+            max_bytes = self.max_download_bytes
+        
+        scanner = _StreamScanner()
+        try:
+            file_size = _feed_scanner(scanner, fileobj.read, max_bytes, stop_after_info=False)
+        except _DownloadTooLarge as e:
+            raise IOError(
+                f"Torrent data exceeds maximum size of {max_bytes} bytes ({e.args[0]} bytes)"
+            )
+        except ValueError as e:
+            raise ValueError(f"Unable to parse torrent file: {e}")
+        except OSError as e:
+            raise IOError(f"Unable to read torrent data: {e}")
+        if not file_size:
+            raise ValueError("Unable to parse torrent file: no data")
+        
+        magnet_link, info_hash, name, trackers = self._convert_scanned(scanner, include_trackers)
+        return self._build_result(magnet_link, info_hash, name, trackers, file_size)
+    
+    def convert_urls(
+        self,
+        urls: Iterable[str],
+        include_trackers: bool = False,
+        concurrency: int = 8,
+        per_host: int = 4,
+        on_result: Optional[Callable[[str, ConversionResult], None]] = None
+    ) -> Iterator[Tuple[str, ConversionResult]]:
+        """
+        Download and convert many torrent URLs concurrently
+        
+        Each URL is converted with convert_from_url on a thread pool, so
+        downloads share the converter's keep-alive connection pool. At most
+        concurrency downloads are in flight overall and at most per_host
+        against any single host; URLs of a busy host wait without taking a
+        thread. Results are yielded as each URL completes, so they can be
+        written while later downloads are still running. Errors do not stop
+        the batch: a URL that fails gives a result with status ERROR
+        carrying the error message. Closing the iterator early cancels the
+        downloads that have not started.
+        
+        Args:
+            urls: URLs of the torrent files
+            include_trackers: Whether to include trackers in the magnet links
+            concurrency: Maximum number of downloads in flight
+            per_host: Maximum number of downloads in flight per host
+            on_result: Optional callback(url, result) invoked as each URL
+                completes, before it is yielded
+            
+        Yields:
+            Tuple of (url, result) in completion order
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+        
+        limit = max(concurrency, 1)
+        host_limit = max(per_host, 1)
+        # host -> URLs not started yet, hosts in order of first appearance
+        queued: Dict[str, deque] = {}
+        for url in urls:
+            try:
+                host = urllib.parse.urlsplit(url).netloc.lower()
+            except ValueError:
+                host = ''
+            queued.setdefault(host, deque()).append(url)
+        # host -> downloads in flight
+        active: Dict[str, int] = {}
+        # future -> (url, host)
+        running = {}
+        
+        def convert_one(url):
+            try:
+                return self.convert_from_url(url, include_trackers=include_trackers)
+            except Exception as e:
+                return ConversionResult.failed(e, url)
+        
+        def fill():
+            for host in list(queued):
+                waiting = queued[host]
+                while waiting and len(running) < limit and active.get(host, 0) < host_limit:
+                    url = waiting.popleft()
+                    active[host] = active.get(host, 0) + 1
+                    running[executor.submit(convert_one, url)] = (url, host)
+                if not waiting:
+                    del queued[host]
+                if len(running) >= limit:
+                    break
+        
+        executor = ThreadPoolExecutor(max_workers=limit)
+        try:
+            fill()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                finished = []
+                for future in done:
+                    url, host = running.pop(future)
+                    active[host] -= 1
+                    finished.append((url, future.result()))
+                # Start the next downloads before handing out results
+                fill()
+                for url, result in finished:
+                    if on_result is not None:
+                        on_result(url, result)
+                    yield url, result
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    async def aconvert(
+        self,
+        torrent_path: Path,
+        include_trackers: bool = False,
+        use_mmap: bool = True
+    ) -> ConversionResult:
+        """
+        Convert a single torrent file to magnet link without blocking the event loop
+        
+        Reading and hashing the file run on the event loop's default executor.
+        
+        Args:
+            torrent_path: Path to the torrent file
+            include_trackers: Whether to include trackers in the magnet link
+            use_mmap: Whether to memory-map large files instead of reading
+                them into memory (default: True)
+            
+        Returns:
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
+            
+        Raises:
+            IOError: File read failed
+            ValueError: Torrent file format error
+        """
+        import asyncio
+        from functools import partial
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(
+            self.convert, torrent_path, include_trackers=include_trackers, use_mmap=use_mmap
+        ))
+    
+    async def aconvert_from_url(self, url: str, include_trackers: bool = False) -> ConversionResult:
+        """
+        Download torrent file from URL and convert to magnet link without blocking
+        
+        The download uses non-blocking sockets on the running event loop and
+        stops as soon as the info dictionary is complete; parsing the
+        received data runs on the event loop's default executor.
+        
+        Args:
+            url: URL of the torrent file
+            include_trackers: Whether to include trackers in the magnet link
+            
+        Returns:
+            ConversionResult, which unpacks as (magnet_link, info_hash, metadata)
+            where metadata contains: name, trackers, etc.
+            
+        Raises:
+            IOError: Download failed
+            ValueError: Torrent file format error
+        """
+        import asyncio
+        
+        stats = self.stats
+        if stats is not None:
+            started = perf_counter()
+        
+        scanner, file_size = await self._adownload(url, 30, None, stop_after_info=True)
+        if stats is not None:
+            stats.add('download', perf_counter() - started)
+        loop = asyncio.get_running_loop()
+        magnet_link, info_hash, name, trackers = await loop.run_in_executor(
+            None, self._convert_scanned, scanner, include_trackers, True
+        )
+        result = self._build_result(
+            magnet_link, info_hash, name, trackers if include_trackers else None, file_size, url
+        )
+        
+        if stats is not None:
+            stats.add_file(url, perf_counter() - started)
+        return result
+    
+    async def aconvert_many(
+        self,
+        sources: Iterable[Union[str, Path]],
+        include_trackers: bool = False,
+        concurrency: int = 8
+    ) -> AsyncIterator[Tuple[Union[str, Path], ConversionResult]]:
+        """
+        Convert many torrent files and URLs concurrently, yielding results as they complete
+        
+        URLs are converted with aconvert_from_url and everything else as a
+        path with aconvert. At most concurrency conversions are in flight,
+        and sources are only taken from the iterable as slots free up.
+        Errors do not stop the batch: a source that fails yields a result
+        with status ERROR carrying the error message. Closing the iterator early cancels
+        the conversions still in flight.
+        
+        Args:
+            sources: Paths and URLs of the torrent files
+            include_trackers: Whether to include trackers in the magnet links
+            concurrency: Maximum number of conversions in flight
+            
+        Yields:
+            Tuple of (source, result) in completion order
+        """
+        import asyncio
+        from .utils import is_url
+        
+        async def convert_one(source):
+            url = source if isinstance(source, str) and is_url(source) else None
+            try:
+                if url is not None:
+                    result = await self.aconvert_from_url(url, include_trackers=include_trackers)
+                else:
+                    result = await self.aconvert(Path(source), include_trackers=include_trackers)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                result = ConversionResult.failed(e, url)
+            return source, result
+        
+        sources = iter(sources)
+        limit = max(concurrency, 1)
+        pending = set()
+        
+        def fill():
+            for source in islice(sources, limit - len(pending)):
+                pending.add(asyncio.ensure_future(convert_one(source)))
+        
+        try:
+            fill()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Start the next conversions before handing out results
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def _init_worker(mmap_threshold: int, timings: bool = False):
+    """Create the converter used by a convert_many worker process"""
+    global _worker_converter
+    _worker_converter = TorrentConverter(mmap_threshold=mmap_threshold, timings=timings)
+
+
+def _convert_chunk(
+    torrent_paths: List[Path],
+    include_trackers: bool,
+    use_mmap: bool,
+    collect_trackers: bool = False
+) -> Tuple[list, Optional['ConversionStats']]:
+    """
+    Convert a chunk of files inside a convert_many worker process
+    
+    Args:
+        torrent_paths: Paths of the torrent files to convert
+        include_trackers: Whether to include trackers in the magnet links
+        use_mmap: Whether to memory-map large files
+        collect_trackers: Whether to return the trackers even when they
+            are not included in the magnet links
+        
+    Returns:
+        Tuple of (results, stats): a list with one compact (magnet_link,
+        info_hash, name, trackers, file_size) tuple or raised exception per
+        path, and the timings collected for the chunk (None if disabled)
+    """
+    results = []
+    for torrent_path in torrent_paths:
+        try:
+            results.append(
+                _worker_converter._convert_file(
+                    torrent_path, include_trackers, use_mmap, collect_trackers
+                )
+            )
+        except Exception as e:
+            results.append(e)
+    
+    # Hand this chunk's timings to the parent and start afresh
+    stats = _worker_converter.stats
+    if stats is not None:
+        from .stats import ConversionStats
+        _worker_converter.stats = ConversionStats()
+    return results, stats
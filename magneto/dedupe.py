@@ -0,0 +1,110 @@
+"""
+Dedupe module - Duplicate detection by info hash across a batch
+"""
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class DuplicateFilter:
+    """
+    Remembers the info hashes seen in a batch
+    
+    Each info hash is kept as its 20-byte digest. Names and the paths of
+    later copies are only kept for torrents that turn out to have duplicates.
+    The path of the first copy, the one written to the output, is only
+    remembered with ``track_kept``, since it has to be stored for every
+    torrent before any duplicate turns up.
+    """
+    
+    def __init__(self, track_kept: bool = False):
+        """
+        Initialize the filter
+        
+        Args:
+            track_kept: Remember the path of the first copy of each info hash
+                so duplicate groups can report it
+        """
+        self._seen = set()
+        # digest -> path of the first copy, only with track_kept
+        self._kept: Optional[Dict[bytes, str]] = {} if track_kept else None
+        # digest -> (name, paths of the skipped copies)
+        self._groups: Dict[bytes, Tuple[str, List[str]]] = {}
+        self.duplicate_count = 0
+    
+    @staticmethod
+    def _digest(info_hash: str) -> bytes:
+        """Raw digest of a hex info hash"""
+        return bytes.fromhex(info_hash)
+    
+    def add(self, info_hash: str, torrent_path: str, name: str = '') -> bool:
+        """
+        Record a converted torrent
+        
+        Args:
+            info_hash: Hex info hash of the torrent
+            torrent_path: Source file path or URL
+            name: Torrent name, reported with duplicate groups
+        
+        Returns:
+            True if the info hash was not seen before, False for a duplicate
+        """
+        digest = self._digest(info_hash)
+        if digest not in self._seen:
+            self._seen.add(digest)
+            if self._kept is not None:
+                self._kept[digest] = str(torrent_path)
+            return True
+        self.duplicate_count += 1
+        group = self._groups.get(digest)
+        if group is None:
+            self._groups[digest] = (name or '', [str(torrent_path)])
+        else:
+            group[1].append(str(torrent_path))
+        return False
+    
+    def __len__(self) -> int:
+        """Number of distinct info hashes seen"""
+        return len(self._seen)
+    
+    def __contains__(self, info_hash: str) -> bool:
+        return self._digest(info_hash) in self._seen
+    
+    @property
+    def group_count(self) -> int:
+        """Number of info hashes seen more than once"""
+        return len(self._groups)
+    
+    def groups(self) -> Iterator[Tuple[str, str, Optional[str], List[str]]]:
+        """
+        Iterate over the info hashes seen more than once
+        
+        Yields:
+            Tuple of (info_hash, name, path of the kept copy, paths of the
+            skipped copies), in the order the first duplicate of each was
+            found. The kept path is None unless the filter tracks it.
+        """
+        for digest, (name, paths) in self._groups.items():
+            kept = self._kept.get(digest) if self._kept is not None else None
+            yield digest.hex().upper(), name, kept, paths
+    
+    def write_report(self, report_file: Path):
+        """
+        Write the duplicate groups as JSON Lines, one group per line
+        
+        The "kept" field is null unless the filter tracks kept paths.
+        
+        Args:
+            report_file: Report file path
+        
+        Raises:
+            IOError: File write failed
+        """
+        import json
+        
+        try:
+            with open(report_file, 'w', encoding='utf-8') as f:
+                for info_hash, name, kept, paths in self.groups():
+                    record = {"info_hash": info_hash, "name": name, "kept": kept, "duplicates": paths}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError as e:
+            raise IOError(f"Unable to write duplicate report {report_file}: {e}")
@@ -7,58 +7,397 @@ import sys
 from pathlib import Path
 
 from magneto.core import TorrentConverter
+from magneto.result import ConversionResult
 from magneto.parser import ArgumentParser
-from magneto.ui import UI
-from magneto.utils import collect_torrent_files, get_output_path, is_url
+from magneto.ui import LARGE_BATCH, UI
+from magneto.utils import (
+    STDIN_INPUT,
+    collect_torrent_files,
+    get_output_path,
+    is_url,
+    iter_torrent_files,
+    read_url_list,
+)
+from magneto.writers import EXTENSIONS, create_writer
+
+
+# Name recorded in the results for torrent data read from stdin
+STDIN_NAME = '<stdin>'
+
+
+def run_cache_command(args, ui: UI):
+    """
+    Run the cache maintenance subcommand
+    
+    Args:
+        args: Parsed arguments of the cache subcommand
+        ui: User interface for messages
+    """
+    from magneto.cache import ConversionCache
+    
+    with ConversionCache(args.cache_path) as cache:
+        if args.action == 'prune':
+            removed = cache.prune()
+            ui.print_success(f"Removed {removed} stale cache entries")
+        else:
+            removed = cache.clear()
+            ui.print_success(f"Removed {removed} cache entries")
+        ui.print_info(f"Cache: {cache.path} ({len(cache)} entries)")
+
+
+def run_serve_command(args, ui: UI):
+    """
+    Run the HTTP conversion service until interrupted
+    
+    Args:
+        args: Parsed arguments of the serve subcommand
+        ui: User interface for messages
+    """
+    from magneto.server import ConversionServer
+    
+    try:
+        server = ConversionServer(
+            (args.host, args.port), workers=args.workers, verbose=args.verbose
+        )
+    except OSError as e:
+        ui.print_error(f"Unable to listen on {args.host}:{args.port}: {e}")
+        sys.exit(1)
+    
+    ui.print_success(f"Serving on {server.url} ({args.workers} workers)")
+    ui.print_info("POST torrent files to /convert, metrics at /metrics; press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        ui.print_info("Shutting down")
+    finally:
+        server.server_close()
+
+
+def run_watch_command(args, ui: UI):
+    """
+    Convert torrent files added to a directory until interrupted
+    
+    Args:
+        args: Parsed arguments of the watch subcommand
+        ui: User interface for messages
+    """
+    from magneto.watch import DirectoryWatcher
+    
+    output_path = None
+    if not args.stdout:
+        output_path = get_output_path(
+            Path(args.directory),
+            Path(args.output) if args.output else None,
+            default_name=f"magnet_links{EXTENSIONS.get(args.format, '.txt')}"
+        )
+    
+    watcher = DirectoryWatcher(
+        args.directory,
+        recursive=args.recursive,
+        case_sensitive=args.case_sensitive,
+        settle=args.settle,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.polling,
+        existing=args.existing
+    )
+    # Results are appended as each file is converted, so the output can be
+    # followed while watching and survives restarts
+    output = open(output_path, 'a', encoding='utf-8') if output_path is not None else sys.stdout
+    writer = create_writer(args.format, stream=output, flush_interval=0)
+    converter = TorrentConverter()
+    
+    ui.print_info(f"Watching {watcher.directory} ({watcher.mode})")
+    if output_path is not None:
+        ui.print_info(f"Appending results to: {output_path}")
+    ui.print_info("Press Ctrl+C to stop")
+    try:
+        for torrent_file in watcher:
+            try:
+                result = converter.convert(torrent_file, include_trackers=args.include_trackers)
+            except (IOError, ValueError) as e:
+                result = ConversionResult.failed(e)
+            writer.write_result(str(torrent_file), result)
+            if not result.ok:
+                ui.print_error(f"{torrent_file.name}: {result.error}")
+                continue
+            ui.print_success(torrent_file.name)
+            if args.verbose:
+                ui.print_verbose(f"  Info Hash: {result.info_hash}")
+                if result.name:
+                    ui.print_verbose(f"  Name: {result.name}")
+    except KeyboardInterrupt:
+        ui.print_info("Stopped watching")
+    except IOError as e:
+        # The watched directory itself went away
+        ui.print_error(f"Stopped watching: {e}")
+    finally:
+        watcher.close()
+        writer.close()
+        if output_path is not None:
+            output.close()
+        converter.close()
+    ui.print_summary()
+
+
+def run_index_command(args, ui: UI):
+    """
+    Convert torrent files and add them to the search catalog
+    
+    Args:
+        args: Parsed arguments of the index subcommand
+        ui: User interface for messages
+    """
+    from magneto.catalog import TorrentCatalog
+    
+    input_path = Path(args.input)
+    converter = TorrentConverter()
+    with TorrentCatalog(args.catalog) as catalog:
+        ui.print_header("Indexing torrent files...")
+        if not catalog.full_text:
+            ui.print_warning("SQLite has no FTS5 support, searches will scan every name")
+        ui.start_progress(rate=4.0)
+        conversions = converter.convert_many(
+            iter_torrent_files(
+                input_path, recursive=args.recursive, case_sensitive=args.case_sensitive
+            ),
+            include_trackers=True,
+            jobs=args.jobs
+        )
+        for torrent_file, result in conversions:
+            if not result.ok:
+                ui.advance_progress(error=f"{torrent_file.name}: {result.error}")
+                continue
+            catalog.add_result(str(torrent_file), result)
+            ui.advance_progress(result.file_size)
+        converter.close()
+        ui.finish_progress()
+        ui.print_info(f"Catalog: {catalog.path} ({len(catalog)} torrents)")
+    ui.print_summary()
+
+
+def run_search_command(args, ui: UI):
+    """
+    Print the catalog entries matching a search
+    
+    Args:
+        args: Parsed arguments of the search subcommand
+        ui: User interface for messages (on stderr, stdout carries results)
+    """
+    from magneto.catalog import TorrentCatalog
+    
+    converter = TorrentConverter()
+    with TorrentCatalog(args.catalog) as catalog:
+        matches = catalog.search(' '.join(args.query), limit=args.limit)
+    if not matches:
+        ui.print_warning("No matching torrents found")
+        return
+    
+    if args.format == 'jsonl':
+        import json
+    for entry in matches:
+        magnet_link = converter.generate_magnet_link(
+            entry['info_hash'],
+            entry['name'] or None,
+            entry['trackers'] if args.include_trackers else None
+        )
+        if args.format == 'links_only':
+            print(magnet_link)
+        elif args.format == 'jsonl':
+            print(json.dumps(dict(entry, magnet=magnet_link), ensure_ascii=False, separators=(',', ':')))
+        else:
+            print(f"Name: {entry['name']}")
+            print(f"Info Hash: {entry['info_hash']}")
+            print(f"Magnet Link: {magnet_link}")
+            if entry['source']:
+                print(f"Source: {entry['source']}")
+            print()
+
+
+def run_batch_mode(args, ui: UI, converter: TorrentConverter):
+    """
+    Answer JSON conversion requests from stdin until it is closed
+    
+    Args:
+        args: Parsed arguments
+        ui: User interface for messages (on stderr, stdout carries responses)
+        converter: Converter shared by all requests
+    """
+    from magneto.batch import BatchSession
+    
+    ui.print_verbose(f"Batch mode: {args.concurrency} concurrent request(s)")
+    with BatchSession(
+        sys.stdout.buffer,
+        converter=converter,
+        workers=args.concurrency,
+        include_trackers=args.include_trackers
+    ) as session:
+        session.run(sys.stdin.buffer)
+    ui.print_verbose(
+        f"Answered {session.ok_count + session.error_count} request(s), "
+        f"{session.error_count} error(s)"
+    )
 
 
 def main():
     """Main function"""
     args = None
+    cache = None
+    writer = None
     try:
         # Parse command line arguments
         args = ArgumentParser.parse_args()
         
         # Initialize components
-        converter = TorrentConverter()
+        # Keep stdout for the results themselves when they are printed there
         ui = UI(
             verbose=args.verbose,
             quiet=args.quiet,
-            use_colors=not args.no_colors
+            use_colors=not args.no_colors,
+            stream=sys.stderr if getattr(args, 'stdout', False) or getattr(args, 'batch', False) else None
         )
         
-        # Check if input is a URL
+        if args.command == 'cache':
+            run_cache_command(args, ui)
+            return
+        if args.command == 'serve':
+            run_serve_command(args, ui)
+            return
+        if args.command == 'watch':
+            run_watch_command(args, ui)
+            return
+        if args.command == 'index':
+            run_index_command(args, ui)
+            return
+        if args.command == 'search':
+            run_search_command(args, ui)
+            return
+        
+        if args.cache:
+            from magneto.cache import ConversionCache
+            cache = ConversionCache(args.cache_path)
+        converter = TorrentConverter(cache=cache, timings=args.timings)
+        
+        if args.batch:
+            run_batch_mode(args, ui, converter)
+            converter.close()
+            if cache is not None:
+                cache.close()
+                cache = None
+            if converter.stats is not None:
+                ui.print_timings(converter.stats)
+            return
+        
+        # Check if input is stdin or a URL
         input_str = args.input
+        stdin_mode = input_str == STDIN_INPUT
+        url_mode = not stdin_mode and (args.url_file is not None or is_url(input_str))
         
-        if is_url(input_str):
-            # Handle URL input
-            ui.print_header("Downloading torrent file from URL...")
-            ui.print_info(f"URL: {input_str}")
+        # Results are written out as they are produced
+        output_path = None
+        if not args.stdout:
+            output_path = get_output_path(
+                # For URL and stdin input, use current directory
+                Path.cwd() if url_mode or stdin_mode else Path(args.input),
+                Path(args.output) if args.output else None
+            )
             
-            results = []
+            # Adjust output file extension based on format
+            extension = EXTENSIONS.get(args.format, '.txt')
+            if args.format in EXTENSIONS or output_path.suffix in EXTENSIONS.values():
+                if output_path.suffix != extension:
+                    output_path = output_path.with_suffix(extension)
+        duplicates = None
+        if args.dedupe:
+            from magneto.dedupe import DuplicateFilter
+            duplicates = DuplicateFilter(
+                track_kept=args.dedupe_report is not None or args.verbose
+            )
+        writer = create_writer(
+            args.format, output_path, stats=converter.stats, duplicates=duplicates
+        )
+        
+        if stdin_mode:
+            # Handle torrent data piped to stdin
+            ui.print_header("Converting torrent data from stdin...")
             try:
-                ui.print_progress(1, 1, input_str)
-                magnet_link, info_hash, metadata = converter.convert_from_url(
-                    input_str,
-                    include_trackers=args.include_trackers
+                result = converter.convert_stream(
+                    sys.stdin.buffer, include_trackers=args.include_trackers
+                )
+            except (IOError, ValueError) as e:
+                result = ConversionResult.failed(e)
+            writer.write_result(STDIN_NAME, result)
+            if not result.ok:
+                ui.print_error(f"{STDIN_NAME}: {result.error}")
+            else:
+                ui.print_success(STDIN_NAME)
+                if args.verbose:
+                    ui.print_verbose(f"  Info Hash: {result.info_hash}")
+                    if result.name:
+                        ui.print_verbose(f"  Name: {result.name}")
+                    if result.trackers:
+                        ui.print_verbose(f"  Trackers: {len(result.trackers)} found")
+        elif url_mode:
+            # Handle URL input
+            urls = [input_str] if input_str is not None else []
+            urls += args.urls
+            if args.url_file is not None:
+                urls += read_url_list(args.url_file)
+            
+            if not urls:
+                ui.print_warning("No URLs found")
+                sys.exit(0)
+            
+            if len(urls) == 1:
+                ui.print_header("Downloading torrent file from URL...")
+                ui.print_info(f"URL: {urls[0]}")
+            else:
+                ui.print_header("Downloading torrent files from URLs...")
+                ui.print_info(f"Found {len(urls)} URL(s)")
+                ui.print_verbose(
+                    f"Concurrency: {args.concurrency} ({args.per_host} per host)"
                 )
+            
+            completed = 0
+            if args.progress == 'line' or (args.progress == 'auto' and len(urls) > LARGE_BATCH):
+                ui.start_progress(len(urls), rate=args.progress_rate)
+            
+            def report(url, result):
+                nonlocal completed
+                completed += 1
+                if ui.progress is not None:
+                    if not result.ok:
+                        ui.advance_progress(error=f"{url}: {result.error}")
+                    else:
+                        ui.advance_progress(result.file_size or 0)
+                    return
                 
-                results.append((input_str, magnet_link, info_hash, metadata))
-                ui.print_success(f"Downloaded and converted: {input_str}")
+                ui.print_progress(completed, len(urls), url)
+                
+                if not result.ok:
+                    ui.print_error(f"{url}: {result.error}")
+                    return
+                
+                ui.print_success(f"Downloaded and converted: {url}")
                 
                 if args.verbose:
-                    ui.print_verbose(f"  Info Hash: {info_hash}")
-                    if metadata.get('name'):
-                        ui.print_verbose(f"  Name: {metadata['name']}")
-                    if metadata.get('trackers'):
-                        ui.print_verbose(f"  Trackers: {len(metadata['trackers'])} found")
-                    if metadata.get('file_size'):
-                        ui.print_verbose(f"  File Size: {metadata['file_size']} bytes")
+                    ui.print_verbose(f"  Info Hash: {result.info_hash}")
+                    if result.name:
+                        ui.print_verbose(f"  Name: {result.name}")
+                    if result.trackers:
+                        ui.print_verbose(f"  Trackers: {len(result.trackers)} found")
+                    if result.file_size:
+                        ui.print_verbose(f"  File Size: {result.file_size} bytes")
             
-            except Exception as e:
-                error_msg = str(e)
-                results.append((input_str, f"Error: {error_msg}", "", {}))
-                ui.print_error(f"{input_str}: {error_msg}")
+            # Results are written as each download completes
+            conversions = converter.convert_urls(
+                urls,
+                include_trackers=args.include_trackers,
+                concurrency=args.concurrency,
+                per_host=args.per_host
+            )
+            for url, result in conversions:
+                writer.write_result(url, result)
+                report(url, result)
         else:
             # Handle file/directory input
             input_path = Path(args.input)
@@ -67,88 +406,119 @@ def main():
                 ui.print_error(f"Path does not exist: {input_path}")
                 sys.exit(1)
             
-            # Collect torrent files
+            # Find torrent files; unless sorting was requested, conversion
+            # starts with the first file found instead of after the walk
             ui.print_header("Searching for torrent files...")
-            torrent_files = collect_torrent_files(
-                input_path,
-                recursive=args.recursive,
-                case_sensitive=args.case_sensitive
-            )
-            
-            if not torrent_files:
-                ui.print_warning(f"No .torrent files found: {input_path}")
-                sys.exit(0)
-            
-            ui.print_info(f"Found {len(torrent_files)} torrent file(s)")
             if args.recursive:
                 ui.print_verbose("Search mode: Recursive")
             else:
                 ui.print_verbose("Search mode: Current directory only")
             
+            if args.sort:
+                torrent_files = collect_torrent_files(
+                    input_path,
+                    recursive=args.recursive,
+                    case_sensitive=args.case_sensitive
+                )
+                if not torrent_files:
+                    ui.print_warning(f"No .torrent files found: {input_path}")
+                    sys.exit(0)
+                total = len(torrent_files)
+                ui.print_info(f"Found {total} torrent file(s)")
+            else:
+                torrent_files = iter_torrent_files(
+                    input_path,
+                    recursive=args.recursive,
+                    case_sensitive=args.case_sensitive
+                )
+                total = None
+            
             # Process files
             ui.print_header("Starting conversion...")
-            results = []
+            if args.jobs != 1:
+                ui.print_verbose(f"Worker processes: {args.jobs or 'one per CPU'}")
+            
+            conversions = converter.convert_many(
+                torrent_files,
+                include_trackers=args.include_trackers,
+                jobs=args.jobs,
+                prefetch=args.prefetch,
+                prefetch_bytes=args.prefetch_memory * 1024 * 1024
+            )
+            # One status line instead of lines per file for parallel runs and
+            # large batches; a batch of unknown size switches once it is large
+            if args.progress == 'line' or (args.progress == 'auto' and (
+                args.jobs != 1 or (total is not None and total > LARGE_BATCH)
+            )):
+                ui.start_progress(total, rate=args.progress_rate)
             
-            for idx, torrent_file in enumerate(torrent_files, 1):
-                ui.print_progress(idx, len(torrent_files), torrent_file.name)
+            for idx, (torrent_file, result) in enumerate(conversions, 1):
+                if ui.progress is None and args.progress == 'auto' and idx > LARGE_BATCH:
+                    ui.start_progress(total, rate=args.progress_rate, done=idx - 1)
                 
-                try:
-                    magnet_link, info_hash, metadata = converter.convert(
-                        torrent_file,
-                        include_trackers=args.include_trackers
-                    )
-                    
-                    results.append((str(torrent_file), magnet_link, info_hash, metadata))
-                    ui.print_success(f"{torrent_file.name}")
-                    
-                    if args.verbose:
-                        ui.print_verbose(f"  Info Hash: {info_hash}")
-                        if metadata.get('name'):
-                            ui.print_verbose(f"  Name: {metadata['name']}")
-                        if metadata.get('trackers'):
-                            ui.print_verbose(f"  Trackers: {len(metadata['trackers'])} found")
+                writer.write_result(str(torrent_file), result)
+                if not result.ok:
+                    error_msg = result.error
+                    if ui.progress is not None:
+                        ui.advance_progress(error=f"{torrent_file.name}: {error_msg}")
+                    else:
+                        ui.print_progress(idx, total, torrent_file.name)
+                        ui.print_error(f"{torrent_file.name}: {error_msg}")
+                    continue
                 
-                except Exception as e:
-                    error_msg = str(e)
-                    results.append((str(torrent_file), f"Error: {error_msg}", "", {}))
-                    ui.print_error(f"{torrent_file.name}: {error_msg}")
-        
-        # Save or print results
-        if results:
-            if args.stdout:
-                # Print results to stdout
-                ui.print_results(results, format_type=args.format)
-            else:
-                # Save results to file
-                # Determine input path for output path calculation
-                if is_url(input_str):
-                    # For URL input, use current directory
-                    input_path_for_output = Path.cwd()
-                else:
-                    input_path_for_output = Path(args.input)
+                if ui.progress is not None:
+                    ui.advance_progress(result.file_size)
+                    continue
                 
-                output_path = get_output_path(
-                    input_path_for_output,
-                    Path(args.output) if args.output else None
-                )
-                
-                # Adjust output file extension based on format
-                if args.format == 'json' and output_path.suffix != '.json':
-                    output_path = output_path.with_suffix('.json')
-                elif args.format != 'json' and output_path.suffix == '.json':
-                    output_path = output_path.with_suffix('.txt')
+                ui.print_progress(idx, total, torrent_file.name)
+                ui.print_success(f"{torrent_file.name}")
                 
-                ui.print_header("Saving results...")
-                ui.save_results(results, output_path, format_type=args.format)
+                if args.verbose:
+                    ui.print_verbose(f"  Info Hash: {result.info_hash}")
+                    if result.name:
+                        ui.print_verbose(f"  Name: {result.name}")
+                    if result.trackers:
+                        ui.print_verbose(f"  Trackers: {len(result.trackers)} found")
+            
+            if not writer.count:
+                ui.print_warning(f"No .torrent files found: {input_path}")
+                sys.exit(0)
+            
+            if cache is not None:
+                ui.print_verbose(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+        
+        converter.close()
+        if cache is not None:
+            cache.close()
+            cache = None
+        
+        ui.finish_progress()
+        writer.close()
+        if output_path is not None and writer.count:
+            ui.print_saved(output_path)
+        
+        if duplicates is not None and args.dedupe_report:
+            duplicates.write_report(Path(args.dedupe_report))
         
         # Display summary
         ui.print_summary()
+        if duplicates is not None:
+            ui.print_duplicates(duplicates)
+            if args.dedupe_report:
+                ui.print_info(f"Duplicate report saved to: {args.dedupe_report}")
+        if converter.stats is not None:
+            ui.print_timings(converter.stats)
         
         # Return non-zero exit code if there were errors
         if ui.error_count > 0:
             sys.exit(1)
     
     except KeyboardInterrupt:
+        # Keep what was converted so far
+        if writer is not None:
+            writer.close()
+        if cache is not None:
+            cache.close()
         print("\n\nOperation cancelled", file=sys.stderr)
         sys.exit(130)
     
@@ -0,0 +1,260 @@
+"""
+Network module - Pooled HTTP client with persistent connections
+"""
+import http.client
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Dict, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+
+# Status codes that carry a Location header to follow
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+
+# Most body bytes of a redirect or error response read to keep its connection
+_DRAIN_LIMIT = 64 * 1024
+
+# Errors indicating that a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def split_url(url: str) -> Tuple[Tuple, str]:
+    """
+    Split a URL into its connection key and request target
+    
+    Args:
+        url: HTTP or HTTPS URL
+    
+    Returns:
+        Tuple of ((scheme, host, port), target)
+    
+    Raises:
+        IOError: URL is not an HTTP or HTTPS URL with a host
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https') or not parts.hostname:
+        raise IOError(f"Unsupported URL: {url}")
+    port = parts.port or (443 if scheme == 'https' else 80)
+    target = parts.path or '/'
+    if parts.query:
+        target += '?' + parts.query
+    return (scheme, parts.hostname.lower(), port), target
+
+
+class PooledResponse:
+    """
+    HTTP response whose connection is returned to the pool on close
+    
+    The connection is only reused when the body has been read completely
+    and the server did not ask to close it; otherwise it is discarded.
+    """
+    
+    def __init__(self, pool: 'ConnectionPool', key: Tuple, connection, response):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+    
+    def read(self, amt: Optional[int] = None) -> bytes:
+        """Read up to amt bytes of the body (all remaining bytes if None)"""
+        return self._response.read(amt)
+    
+    def discard(self):
+        """
+        Close a response whose body is not needed
+        
+        A short body is read so the connection can be reused; the
+        connection of a longer one is discarded rather than buffering it.
+        """
+        try:
+            self._response.read(_DRAIN_LIMIT)
+        finally:
+            self.close()
+    
+    def close(self):
+        """Release the connection back to the pool or discard it"""
+        if self._connection is None:
+            return
+        reusable = self._response.isclosed() and not self._response.will_close
+        self._response.close()
+        if reusable:
+            self._pool._release(self._key, self._connection)
+        else:
+            self._connection.close()
+        self._connection = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ConnectionPool:
+    """Thread-safe pool of persistent HTTP/HTTPS connections keyed by host"""
+    
+    def __init__(
+        self,
+        max_size: int = 8,
+        idle_timeout: float = 30.0,
+        max_redirects: int = 5
+    ):
+        """
+        Initialize connection pool
+        
+        Args:
+            max_size: Maximum number of idle connections kept across all hosts
+            idle_timeout: Seconds after which an idle connection is evicted
+            max_redirects: Maximum number of redirects followed per request
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_redirects = max_redirects
+        self._lock = threading.Lock()
+        # (scheme, host, port) -> deque of (connection, last_used)
+        self._idle: Dict[Tuple, deque] = OrderedDict()
+        self._idle_count = 0
+    
+    def open(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30
+    ) -> PooledResponse:
+        """
+        Send a GET request, reusing an idle connection to the host if possible
+        
+        Args:
+            url: HTTP or HTTPS URL to fetch
+            headers: Additional request headers
+            timeout: Socket timeout in seconds
+        
+        Returns:
+            Response object; close it (or use it as a context manager) to
+            return the connection to the pool
+        
+        Raises:
+            IOError: Connection failed, too many redirects or HTTP error status
+        """
+        for _ in range(self.max_redirects + 1):
+            key, target = split_url(url)
+            response = self._send(key, target, headers or {}, timeout)
+            
+            location = response.headers.get('Location')
+            if response.status in _REDIRECT_CODES and location:
+                response.discard()
+                url = urljoin(url, location)
+                continue
+            
+            if response.status >= 400:
+                response.discard()
+                raise IOError(f"HTTP Error {response.status}: {response.reason}")
+            
+            return response
+        
+        raise IOError(f"Too many redirects (more than {self.max_redirects})")
+    
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle = [conn for queue in self._idle.values() for conn, _ in queue]
+            self._idle.clear()
+            self._idle_count = 0
+        for connection in idle:
+            connection.close()
+    
+    @property
+    def idle_count(self) -> int:
+        """Number of idle connections currently held"""
+        return self._idle_count
+    
+    def _send(self, key: Tuple, target: str, headers: Dict[str, str], timeout: float) -> PooledResponse:
+        """Send the request, retrying once on a fresh connection if a reused one went stale"""
+        connection = self._acquire(key, timeout)
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = self._connect(key, timeout)
+            try:
+                connection.request('GET', target, headers=headers)
+                return PooledResponse(self, key, connection, connection.getresponse())
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                if not reused:
+                    raise
+                connection = None
+                reused = False
+            except BaseException:
+                connection.close()
+                raise
+    
+    @staticmethod
+    def _connect(key: Tuple, timeout: float):
+        """Open a new connection for a pool key"""
+        scheme, host, port = key
+        if scheme == 'https':
+            return http.client.HTTPSConnection(host, port, timeout=timeout)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+    
+    def _acquire(self, key: Tuple, timeout: float):
+        """Take the most recently used live connection for key, or None"""
+        expired = []
+        connection = None
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now, expired)
+            queue = self._idle.get(key)
+            if queue:
+                connection, _ = queue.pop()
+                self._idle_count -= 1
+                if not queue:
+                    del self._idle[key]
+        for stale in expired:
+            stale.close()
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+        return connection
+    
+    def _release(self, key: Tuple, connection):
+        """Return a connection to the idle pool, evicting the oldest if full"""
+        evicted = []
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now, evicted)
+            if self.max_size <= 0:
+                evicted.append(connection)
+            else:
+                self._idle.setdefault(key, deque()).append((connection, now))
+                self._idle.move_to_end(key)
+                self._idle_count += 1
+                while self._idle_count > self.max_size:
+                    oldest_key = min(self._idle, key=lambda k: self._idle[k][0][1])
+                    oldest = self._idle[oldest_key]
+                    evicted.append(oldest.popleft()[0])
+                    self._idle_count -= 1
+                    if not oldest:
+                        del self._idle[oldest_key]
+        for stale in evicted:
+            stale.close()
+    
+    def _evict_expired(self, now: float, evicted: list):
+        """Move connections idle for longer than idle_timeout into evicted (lock held)"""
+        for key in list(self._idle):
+            queue = self._idle[key]
+            while queue and now - queue[0][1] >= self.idle_timeout:
+                evicted.append(queue.popleft()[0])
+                self._idle_count -= 1
+            if not queue:
+                del self._idle[key]
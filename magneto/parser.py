@@ -8,6 +8,17 @@ from pathlib import Path
 from . import __version__
 
 
+# Maintenance subcommands, recognized as the first argument
+COMMANDS = ('cache', 'serve', 'watch', 'index', 'search')
+
+
+class _ProbeParser(argparse.ArgumentParser):
+    """Parser that raises ValueError on bad arguments instead of exiting"""
+    
+    def error(self, message):
+        raise ValueError(message)
+
+
 class ArgumentParser:
     """Command-line argument parser"""
     
@@ -28,9 +39,23 @@ Examples:
   %(prog)s file.torrent                    # Convert a single file
   %(prog)s folder/                         # Convert all .torrent files in folder
   %(prog)s http://example.com/file.torrent # Download and convert from URL
+  %(prog)s URL1 URL2 URL3 --concurrency 16 # Download and convert many URLs
+  %(prog)s --url-file urls.txt             # Read URLs from a file, one per line
+  %(prog)s - --stdout < file.torrent       # Convert torrent data read from stdin
   %(prog)s folder/ -o output.txt           # Specify output file
   %(prog)s folder/ -r -f json              # Recursive search and output JSON format
+  %(prog)s folder/ -r -f jsonl             # Output JSON Lines as results arrive
   %(prog)s folder/ -v --include-trackers   # Verbose output with trackers
+  %(prog)s folder/ -r -j 8                 # Convert with 8 worker processes
+  %(prog)s folder/ -r --cache              # Skip files unchanged since the last run
+  %(prog)s folder/ -r --dedupe             # Write each torrent only once
+  %(prog)s cache prune                     # Drop cache entries of changed files
+  %(prog)s serve --port 8080               # Run the HTTP conversion service
+  %(prog)s watch downloads/ -o links.jsonl # Convert torrent files as they arrive
+  %(prog)s index folder/ -r                # Add torrent files to the search catalog
+  %(prog)s search ubuntu server            # Search the catalog by name or info hash
+  %(prog)s ./cache                         # Convert a folder named like a command
+  %(prog)s --batch                         # Answer JSON requests on stdin/stdout
   %(prog)s folder/ --stdout                # Print results to stdout
   %(prog)s folder/ --stdout -f links_only  # Print only magnet links to stdout
   %(prog)s --help                          # Show help information
@@ -46,7 +71,15 @@ For more information, visit: https://github.com/mastaBriX/magneto
             type=str,
             nargs='?',
             default=None,
-            help='Input torrent file, folder path, or URL of torrent file'
+            help='Input torrent file, folder path, URL of torrent file, or - to read '
+                 'torrent data from stdin'
+        )
+        parser.add_argument(
+            'urls',
+            type=str,
+            nargs='*',
+            metavar='URL',
+            help='Additional torrent file URLs (multiple inputs must all be URLs)'
         )
         
         # Output options
@@ -61,15 +94,29 @@ For more information, visit: https://github.com/mastaBriX/magneto
         output_group.add_argument(
             '-f', '--format',
             type=str,
-            choices=['full', 'links_only', 'json'],
+            choices=['full', 'links_only', 'json', 'jsonl'],
             default='full',
-            help='Output format: full (complete), links_only (links only), json (JSON format) (default: full)'
+            help='Output format: full (complete), links_only (links only), json (JSON format), '
+                 'jsonl (JSON Lines, one object per result including errors) (default: full)'
         )
         output_group.add_argument(
             '--stdout',
             action='store_true',
             help='Print results to stdout instead of saving to file'
         )
+        output_group.add_argument(
+            '--dedupe',
+            action='store_true',
+            help='Write each info hash only once, skipping later copies of the same torrent '
+                 'and reporting them in the summary'
+        )
+        output_group.add_argument(
+            '--dedupe-report',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Write the duplicate groups to FILE as JSON Lines (implies --dedupe)'
+        )
         
         # Search options
         search_group = parser.add_argument_group('Search Options')
@@ -83,6 +130,12 @@ For more information, visit: https://github.com/mastaBriX/magneto
             action='store_true',
             help='Case-sensitive search for file extensions'
         )
+        search_group.add_argument(
+            '--sort',
+            action='store_true',
+            help='Collect all files and convert them in path order '
+                 '(default: convert files as they are found)'
+        )
         
         # Conversion options
         convert_group = parser.add_argument_group('Conversion Options')
@@ -91,6 +144,81 @@ For more information, visit: https://github.com/mastaBriX/magneto
             action='store_true',
             help='Include tracker information in magnet links'
         )
+        convert_group.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=1,
+            metavar='N',
+            help='Number of worker processes for batch conversion (default: 1, 0: one per CPU)'
+        )
+        convert_group.add_argument(
+            '--prefetch',
+            type=int,
+            default=0,
+            metavar='N',
+            help='Read up to N files ahead on background threads (single-process mode, default: 0)'
+        )
+        convert_group.add_argument(
+            '--prefetch-memory',
+            type=int,
+            default=64,
+            metavar='MB',
+            help='Memory budget in MB for files read ahead (default: 64)'
+        )
+        convert_group.add_argument(
+            '--batch',
+            action='store_true',
+            help='Co-process mode: read JSON requests (path, url or base64 data) from stdin, '
+                 'one per line, and write a JSON response per request to stdout; '
+                 'requests run concurrently (see --concurrency) and are answered out of order'
+        )
+        
+        # Cache options
+        cache_group = parser.add_argument_group('Cache Options')
+        cache_group.add_argument(
+            '--cache',
+            dest='cache',
+            action='store_true',
+            default=False,
+            help='Reuse cached results for unchanged files and cache new ones'
+        )
+        cache_group.add_argument(
+            '--no-cache',
+            dest='cache',
+            action='store_false',
+            help='Do not use the conversion cache (default)'
+        )
+        cache_group.add_argument(
+            '--cache-path',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Cache database path (default: ~/.cache/magneto/cache.sqlite3)'
+        )
+        
+        # Download options
+        download_group = parser.add_argument_group('Download Options')
+        download_group.add_argument(
+            '--url-file',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Read torrent URLs from FILE, one per line (use - for stdin)'
+        )
+        download_group.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            metavar='N',
+            help='Maximum number of concurrent downloads, or requests in --batch mode (default: 8)'
+        )
+        download_group.add_argument(
+            '--per-host',
+            type=int,
+            default=4,
+            metavar='N',
+            help='Maximum number of concurrent downloads per host (default: 4)'
+        )
         
         # Display options
         display_group = parser.add_argument_group('Display Options')
@@ -109,6 +237,28 @@ For more information, visit: https://github.com/mastaBriX/magneto
             action='store_true',
             help='Disable colored output'
         )
+        display_group.add_argument(
+            '--progress',
+            type=str,
+            choices=['auto', 'line', 'files'],
+            default='auto',
+            help='Progress display: line (one status line with throughput and ETA), '
+                 'files (a line per file), auto (line with --jobs or more than '
+                 '100 files) (default: auto)'
+        )
+        display_group.add_argument(
+            '--progress-rate',
+            type=float,
+            default=4.0,
+            metavar='N',
+            help='Maximum status line redraws per second (default: 4)'
+        )
+        display_group.add_argument(
+            '--timings',
+            action='store_true',
+            help='Print per-stage timings (mean, p50/p95/p99) and the slowest '
+                 'files after the summary'
+        )
         
         # Other options
         other_group = parser.add_argument_group('Other Options')
@@ -120,28 +270,392 @@ For more information, visit: https://github.com/mastaBriX/magneto
         
         return parser
     
+    @staticmethod
+    def create_command_parser(parser_class=argparse.ArgumentParser) -> argparse.ArgumentParser:
+        """
+        Create the parser for maintenance subcommands (magneto COMMAND ...)
+        
+        Args:
+            parser_class: ArgumentParser class of the parser and its subparsers
+        
+        Returns:
+            Configured ArgumentParser instance
+        """
+        parser = parser_class(
+            prog='magneto',
+            description='Magneto maintenance commands'
+        )
+        subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+        subparsers.required = True
+        
+        cache_parser = subparsers.add_parser(
+            'cache',
+            help='Manage the conversion cache',
+            description='Manage the conversion cache'
+        )
+        cache_parser.add_argument(
+            'action',
+            choices=['prune', 'clear'],
+            help='prune: remove entries of deleted or changed files, clear: remove all entries'
+        )
+        cache_parser.add_argument(
+            '--cache-path',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Cache database path (default: ~/.cache/magneto/cache.sqlite3)'
+        )
+        cache_parser.add_argument(
+            '-q', '--quiet',
+            action='store_true',
+            help='Quiet mode, only show error messages'
+        )
+        cache_parser.add_argument(
+            '--no-colors',
+            action='store_true',
+            help='Disable colored output'
+        )
+        cache_parser.set_defaults(verbose=False)
+        
+        serve_parser = subparsers.add_parser(
+            'serve',
+            help='Run the HTTP conversion service',
+            description='Serve conversions over HTTP with a long-lived converter: '
+                        'POST a .torrent body (or a multipart/form-data batch) to '
+                        '/convert for JSON results; GET /metrics for request counts '
+                        'and latency histograms'
+        )
+        serve_parser.add_argument(
+            '--host',
+            type=str,
+            default='127.0.0.1',
+            help='Address to listen on (default: 127.0.0.1)'
+        )
+        serve_parser.add_argument(
+            '--port',
+            type=int,
+            default=8080,
+            help='Port to listen on, 0 picks a free port (default: 8080)'
+        )
+        serve_parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            metavar='N',
+            help='Number of connections handled at the same time; idle keep-alive '
+                 'connections are closed when all workers are busy (default: 8)'
+        )
+        serve_parser.add_argument(
+            '-v', '--verbose',
+            action='store_true',
+            help='Log every request'
+        )
+        serve_parser.add_argument(
+            '-q', '--quiet',
+            action='store_true',
+            help='Quiet mode, only show error messages'
+        )
+        serve_parser.add_argument(
+            '--no-colors',
+            action='store_true',
+            help='Disable colored output'
+        )
+        
+        watch_parser = subparsers.add_parser(
+            'watch',
+            help='Convert torrent files as they are added to a directory',
+            description='Watch a directory (with inotify where available, otherwise by '
+                        'polling) and append the result of each new .torrent file to the '
+                        'output once it has been completely written'
+        )
+        watch_parser.add_argument(
+            'directory',
+            type=str,
+            help='Directory to watch'
+        )
+        watch_parser.add_argument(
+            '-o', '--output',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Output file results are appended to (default: magnet_links.jsonl in the directory)'
+        )
+        watch_parser.add_argument(
+            '-f', '--format',
+            type=str,
+            choices=['links_only', 'jsonl'],
+            default='jsonl',
+            help='Output format: links_only (links only) or jsonl (JSON Lines, '
+                 'including errors) (default: jsonl)'
+        )
+        watch_parser.add_argument(
+            '--stdout',
+            action='store_true',
+            help='Print results to stdout instead of appending to a file'
+        )
+        watch_parser.add_argument(
+            '-r', '--recursive',
+            action='store_true',
+            help='Also watch subdirectories, including ones created later'
+        )
+        watch_parser.add_argument(
+            '--case-sensitive',
+            action='store_true',
+            help='Case-sensitive match of file extensions'
+        )
+        watch_parser.add_argument(
+            '--include-trackers',
+            action='store_true',
+            help='Include tracker information in magnet links'
+        )
+        watch_parser.add_argument(
+            '--existing',
+            action='store_true',
+            help='Also convert the torrent files already in the directory'
+        )
+        watch_parser.add_argument(
+            '--settle',
+            type=float,
+            default=1.0,
+            metavar='SECONDS',
+            help='Seconds a new file must stay unchanged before it is converted (default: 1.0)'
+        )
+        watch_parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            metavar='SECONDS',
+            help='Seconds between directory scans when polling (default: 1.0)'
+        )
+        watch_parser.add_argument(
+            '--polling',
+            action='store_true',
+            help='Poll for changes even where inotify is available'
+        )
+        watch_parser.add_argument(
+            '-v', '--verbose',
+            action='store_true',
+            help='Show verbose output information'
+        )
+        watch_parser.add_argument(
+            '-q', '--quiet',
+            action='store_true',
+            help='Quiet mode, only show error messages'
+        )
+        watch_parser.add_argument(
+            '--no-colors',
+            action='store_true',
+            help='Disable colored output'
+        )
+        
+        index_parser = subparsers.add_parser(
+            'index',
+            help='Add torrent files to the search catalog',
+            description='Convert torrent files and store their info hash, name and trackers '
+                        'in the SQLite catalog searched by magneto search'
+        )
+        index_parser.add_argument(
+            'input',
+            type=str,
+            help='Torrent file or folder to index'
+        )
+        index_parser.add_argument(
+            '-r', '--recursive',
+            action='store_true',
+            help='Recursively search for torrent files in subdirectories'
+        )
+        index_parser.add_argument(
+            '--case-sensitive',
+            action='store_true',
+            help='Case-sensitive search for file extensions'
+        )
+        index_parser.add_argument(
+            '-j', '--jobs',
+            type=int,
+            default=1,
+            metavar='N',
+            help='Number of worker processes for conversion (default: 1, 0: one per CPU)'
+        )
+        index_parser.add_argument(
+            '--catalog',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Catalog database path (default: ~/.local/share/magneto/catalog.sqlite3)'
+        )
+        index_parser.add_argument(
+            '-v', '--verbose',
+            action='store_true',
+            help='Show verbose output information'
+        )
+        index_parser.add_argument(
+            '-q', '--quiet',
+            action='store_true',
+            help='Quiet mode, only show error messages'
+        )
+        index_parser.add_argument(
+            '--no-colors',
+            action='store_true',
+            help='Disable colored output'
+        )
+        
+        search_parser = subparsers.add_parser(
+            'search',
+            help='Search the catalog by name or info hash',
+            description='Print the catalog entries whose name contains words starting with '
+                        'every search word, or the entry of a 40-character info hash'
+        )
+        search_parser.add_argument(
+            'query',
+            type=str,
+            nargs='+',
+            help='Search words, or an info hash'
+        )
+        search_parser.add_argument(
+            '-n', '--limit',
+            type=int,
+            default=20,
+            metavar='N',
+            help='Maximum number of results (default: 20)'
+        )
+        search_parser.add_argument(
+            '-f', '--format',
+            type=str,
+            choices=['full', 'links_only', 'jsonl'],
+            default='full',
+            help='Output format: full (name, info hash and magnet link), links_only '
+                 '(links only), jsonl (JSON Lines) (default: full)'
+        )
+        search_parser.add_argument(
+            '--include-trackers',
+            action='store_true',
+            help='Include tracker information in magnet links'
+        )
+        search_parser.add_argument(
+            '--catalog',
+            type=str,
+            default=None,
+            metavar='FILE',
+            help='Catalog database path (default: ~/.local/share/magneto/catalog.sqlite3)'
+        )
+        search_parser.add_argument(
+            '--no-colors',
+            action='store_true',
+            help='Disable colored output'
+        )
+        search_parser.set_defaults(verbose=False, quiet=False, stdout=True)
+        
+        return parser
+    
+    @staticmethod
+    def is_command(argv) -> bool:
+        """
+        Check whether an argument list selects a maintenance subcommand
+        
+        The first argument must name one of COMMANDS. If it is also an
+        existing path, such as a folder called "cache", the arguments only
+        select the subcommand when they are valid for it, and otherwise
+        convert that path. "./cache" always converts the path.
+        
+        Args:
+            argv: Argument list, without the program name
+        
+        Returns:
+            True for a subcommand, False for a conversion
+        """
+        if not argv or argv[0] not in COMMANDS:
+            return False
+        if not Path(argv[0]).exists():
+            return True
+        try:
+            ArgumentParser.create_command_parser(_ProbeParser).parse_args(argv)
+        except ValueError:
+            return False
+        return True
+    
     @staticmethod
     def parse_args(args=None):
         """
         Parse command-line arguments
         
+        A first argument naming one of COMMANDS selects a maintenance
+        subcommand (see is_command); anything else is a conversion. The
+        returned namespace's command attribute is None for conversions.
+        
         Args:
             args: Argument list to parse, if None uses sys.argv
             
         Returns:
             Parsed argument namespace
         """
+        argv = sys.argv[1:] if args is None else list(args)
+        if ArgumentParser.is_command(argv):
+            parser = ArgumentParser.create_command_parser()
+            parsed_args = parser.parse_args(argv)
+            if parsed_args.command == 'serve':
+                if not 0 <= parsed_args.port <= 65535:
+                    parser.error("argument --port: must be between 0 and 65535")
+                if parsed_args.workers <= 0:
+                    parser.error("argument --workers: must be a positive integer")
+            elif parsed_args.command == 'watch':
+                if not Path(parsed_args.directory).is_dir():
+                    parser.error(f"argument directory: not a directory: {parsed_args.directory}")
+                if parsed_args.settle < 0:
+                    parser.error("argument --settle: must be a non-negative number")
+                if parsed_args.poll_interval <= 0:
+                    parser.error("argument --poll-interval: must be a positive number")
+            elif parsed_args.command == 'index':
+                if not Path(parsed_args.input).exists():
+                    parser.error(f"argument input: path does not exist: {parsed_args.input}")
+                if parsed_args.jobs < 0:
+                    parser.error("argument -j/--jobs: must be a non-negative integer")
+            elif parsed_args.command == 'search':
+                if parsed_args.limit <= 0:
+                    parser.error("argument -n/--limit: must be a positive integer")
+            return parsed_args
+        
         parser = ArgumentParser.create_parser()
-        parsed_args = parser.parse_args(args)
+        parsed_args = parser.parse_args(argv)
+        parsed_args.command = None
         
         # Validate arguments
-        if parsed_args.input is None:
+        if parsed_args.batch:
+            if parsed_args.input is not None or parsed_args.url_file is not None:
+                parser.error("argument --batch: requests are read from stdin, not from inputs")
+        elif parsed_args.input is None and parsed_args.url_file is None:
             parser.print_help()
             sys.exit(1)
         
-        # Check if input is URL - if not, validate path exists
-        from magneto.utils import is_url
-        if not is_url(parsed_args.input):
+        if parsed_args.jobs < 0:
+            parser.error("argument -j/--jobs: must be a non-negative integer")
+        if parsed_args.prefetch < 0:
+            parser.error("argument --prefetch: must be a non-negative integer")
+        if parsed_args.prefetch_memory <= 0:
+            parser.error("argument --prefetch-memory: must be a positive integer")
+        if parsed_args.progress_rate <= 0:
+            parser.error("argument --progress-rate: must be a positive number")
+        if parsed_args.concurrency <= 0:
+            parser.error("argument --concurrency: must be a positive integer")
+        if parsed_args.per_host <= 0:
+            parser.error("argument --per-host: must be a positive integer")
+        if parsed_args.dedupe_report is not None:
+            parsed_args.dedupe = True
+        if parsed_args.batch:
+            return parsed_args
+        
+        from magneto.utils import STDIN_INPUT, is_url
+        
+        # Several inputs, or a URL list, only make sense for URLs
+        inputs = [parsed_args.input] if parsed_args.input is not None else []
+        inputs += parsed_args.urls
+        if len(inputs) > 1 or parsed_args.url_file is not None:
+            for value in inputs:
+                if not is_url(value):
+                    parser.error(f"multiple inputs must all be URLs: {value}")
+            return parsed_args
+        
+        # Check if input is URL or stdin - if not, validate path exists
+        if parsed_args.input != STDIN_INPUT and not is_url(parsed_args.input):
             input_path = Path(parsed_args.input)
             if not input_path.exists():
                 print(f"Error: Path does not exist: {input_path}", file=sys.stderr)
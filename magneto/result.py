@@ -0,0 +1,132 @@
+"""
+Result module - Compact record of one conversion
+"""
+import base64
+from enum import Enum
+from typing import Dict, Iterable, Optional, Union
+
+
+class ConversionStatus(Enum):
+    """Outcome of a conversion"""
+    OK = 'ok'
+    ERROR = 'error'
+
+
+class ConversionResult:
+    """
+    Result of converting one torrent
+    
+    The info hash is kept as its raw 20-byte digest, and its hexadecimal and
+    base32 forms are computed when they are read, so a result is a single
+    small object rather than a tuple, a metadata dictionary and a second
+    copy of the hash. For compatibility the result still unpacks, indexes
+    and compares like the (magnet_link, info_hash, metadata) tuple that
+    convert used to return:
+    
+        magnet_link, info_hash, metadata = converter.convert(path)
+    """
+    
+    __slots__ = ('magnet_link', 'digest', 'name', 'trackers', 'file_size', 'source_url', 'status', 'error')
+    
+    def __init__(
+        self,
+        magnet_link: str,
+        digest: bytes,
+        name: Optional[str] = None,
+        trackers: Iterable[str] = (),
+        file_size: Optional[int] = None,
+        source_url: Optional[str] = None,
+        status: ConversionStatus = ConversionStatus.OK,
+        error: Optional[str] = None
+    ):
+        """
+        Initialize result
+        
+        Args:
+            magnet_link: Magnet link ('' for errors)
+            digest: Raw 20-byte info hash (b'' for errors)
+            name: Torrent name
+            trackers: Trackers returned with the result
+            file_size: Size of the torrent file in bytes
+            source_url: URL the torrent was downloaded from
+            status: Whether the conversion succeeded
+            error: Error message of a failed conversion
+        """
+        self.magnet_link = magnet_link
+        self.digest = digest
+        self.name = name
+        self.trackers = tuple(trackers) if trackers else ()
+        self.file_size = file_size
+        self.source_url = source_url
+        self.status = status
+        self.error = error
+    
+    @classmethod
+    def failed(cls, error: Union[str, Exception], source_url: Optional[str] = None) -> 'ConversionResult':
+        """
+        Create the result of a failed conversion
+        
+        Args:
+            error: Error message or the exception raised
+            source_url: URL the torrent was to be downloaded from
+        
+        Returns:
+            Result with status ERROR
+        """
+        return cls('', b'', source_url=source_url, status=ConversionStatus.ERROR, error=str(error))
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the conversion succeeded"""
+        return self.status is ConversionStatus.OK
+    
+    @property
+    def info_hash(self) -> str:
+        """Info hash as uppercase hexadecimal"""
+        return self.digest.hex().upper()
+    
+    @property
+    def info_hash_base32(self) -> str:
+        """Info hash in base32, the other encoding magnet links accept"""
+        return base64.b32encode(self.digest).decode('ascii')
+    
+    @property
+    def metadata(self) -> Dict:
+        """Metadata dictionary of the tuple form, built on each access"""
+        metadata = {
+            'name': self.name,
+            'trackers': list(self.trackers),
+            'info_hash': self.info_hash,
+            'file_size': self.file_size
+        }
+        if self.source_url is not None:
+            metadata['source_url'] = self.source_url
+        return metadata
+    
+    def _as_tuple(self) -> tuple:
+        return self.magnet_link, self.info_hash, self.metadata
+    
+    def __iter__(self):
+        return iter(self._as_tuple())
+    
+    def __len__(self) -> int:
+        return 3
+    
+    def __getitem__(self, index):
+        return self._as_tuple()[index]
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ConversionResult):
+            return all(
+                getattr(self, name) == getattr(other, name) for name in self.__slots__
+            )
+        if isinstance(other, tuple):
+            return self._as_tuple() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        if not self.ok:
+            return f"ConversionResult(status=ERROR, error={self.error!r})"
+        return f"ConversionResult(info_hash={self.info_hash!r}, name={self.name!r})"
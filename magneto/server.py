@@ -0,0 +1,448 @@
+"""
+Server module - HTTP conversion service with a warm converter
+"""
+import json
+import re
+import socket
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import __version__
+from .core import TorrentConverter
+
+
+# Largest request body accepted (a multipart batch may hold many torrents)
+MAX_BODY_BYTES = 256 * 1024 * 1024
+
+# Seconds an idle keep-alive connection is kept open while workers are free
+IDLE_TIMEOUT = 30.0
+
+# Upper bounds of the request latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Endpoints tracked separately in the metrics; other paths count as "other"
+_ENDPOINTS = frozenset(('/convert', '/metrics', '/health'))
+
+_FILENAME_PATTERN = re.compile(rb'\bfilename="([^"]*)"')
+_FIELD_NAME_PATTERN = re.compile(rb'\bname="([^"]*)"')
+
+
+class ServerMetrics:
+    """
+    Request counters and latency histograms of a conversion server
+    
+    Rendered in the Prometheus text exposition format by render().
+    """
+    
+    def __init__(self):
+        self.started = time.time()
+        self.in_flight = 0
+        self.conversions = {'ok': 0, 'error': 0}
+        self._requests: Dict[Tuple[str, int], int] = {}
+        # Per endpoint: non-cumulative bucket counts (last is +Inf), sum
+        self._latency: Dict[str, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+    
+    def begin(self):
+        """Count a request that started"""
+        with self._lock:
+            self.in_flight += 1
+    
+    def record(self, endpoint: str, status: int, seconds: float):
+        """Count a finished request with its status code and latency"""
+        with self._lock:
+            self.in_flight -= 1
+            key = (endpoint, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            latency = self._latency.get(endpoint)
+            if latency is None:
+                latency = self._latency[endpoint] = ([0] * (len(LATENCY_BUCKETS) + 1), [0.0])
+            latency[0][bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            latency[1][0] += seconds
+    
+    def record_conversions(self, ok: int, errors: int):
+        """Count converted and failed torrents"""
+        with self._lock:
+            self.conversions['ok'] += ok
+            self.conversions['error'] += errors
+    
+    def requests(self, endpoint: str, status: Optional[int] = None) -> int:
+        """Number of finished requests to an endpoint (with a status code)"""
+        with self._lock:
+            return sum(
+                count for (name, code), count in self._requests.items()
+                if name == endpoint and (status is None or code == status)
+            )
+    
+    def render(self) -> str:
+        """
+        Render the metrics
+        
+        Returns:
+            Metrics in the Prometheus text exposition format
+        """
+        with self._lock:
+            lines = [
+                "# HELP magneto_requests_total HTTP requests handled",
+                "# TYPE magneto_requests_total counter",
+            ]
+            for (endpoint, status), count in sorted(self._requests.items()):
+                lines.append(f'magneto_requests_total{{path="{endpoint}",status="{status}"}} {count}')
+            
+            lines += [
+                "# HELP magneto_request_duration_seconds HTTP request latency",
+                "# TYPE magneto_request_duration_seconds histogram",
+            ]
+            for endpoint, (buckets, total) in sorted(self._latency.items()):
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS + (None,), buckets):
+                    cumulative += count
+                    le = "+Inf" if bound is None else repr(bound)
+                    lines.append(
+                        f'magneto_request_duration_seconds_bucket{{path="{endpoint}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(f'magneto_request_duration_seconds_sum{{path="{endpoint}"}} {total[0]:.6f}')
+                lines.append(f'magneto_request_duration_seconds_count{{path="{endpoint}"}} {cumulative}')
+            
+            lines += [
+                "# HELP magneto_conversions_total Torrents converted",
+                "# TYPE magneto_conversions_total counter",
+                f'magneto_conversions_total{{status="ok"}} {self.conversions["ok"]}',
+                f'magneto_conversions_total{{status="error"}} {self.conversions["error"]}',
+                "# HELP magneto_requests_in_flight Requests being handled",
+                "# TYPE magneto_requests_in_flight gauge",
+                f"magneto_requests_in_flight {self.in_flight}",
+                "# HELP magneto_uptime_seconds Seconds since the server started",
+                "# TYPE magneto_uptime_seconds gauge",
+                f"magneto_uptime_seconds {time.time() - self.started:.3f}",
+            ]
+        return "\n".join(lines) + "\n"
+
+
+def _content_type_params(content_type: str) -> Tuple[str, Dict[str, str]]:
+    """Split a Content-Type header into its media type and parameters"""
+    media_type, *params = content_type.split(';')
+    values = {}
+    for param in params:
+        key, _, value = param.strip().partition('=')
+        values[key.lower()] = value.strip().strip('"')
+    return media_type.strip().lower(), values
+
+
+def _parse_multipart(body: bytes, boundary: bytes) -> List[Tuple[str, bytes]]:
+    """
+    Split a multipart/form-data body into its parts
+    
+    Args:
+        body: Request body
+        boundary: Boundary from the Content-Type header
+    
+    Returns:
+        List of (filename, content) per part; the filename falls back to
+        the field name, then to "part-N"
+    
+    Raises:
+        ValueError: Malformed multipart body
+    """
+    delimiter = b'--' + boundary
+    parts = []
+    pos = body.find(delimiter)
+    if pos < 0:
+        raise ValueError("multipart boundary not found")
+    while True:
+        pos += len(delimiter)
+        if body.startswith(b'--', pos):
+            # Closing delimiter
+            return parts
+        line_end = body.find(b'\r\n', pos)
+        header_end = body.find(b'\r\n\r\n', line_end) if line_end >= 0 else -1
+        if header_end < 0:
+            raise ValueError("truncated multipart part")
+        end = body.find(b'\r\n' + delimiter, header_end + 4)
+        if end < 0:
+            raise ValueError("missing closing multipart boundary")
+        headers = body[line_end + 2:header_end]
+        match = _FILENAME_PATTERN.search(headers) or _FIELD_NAME_PATTERN.search(headers)
+        filename = match.group(1).decode('utf-8', 'replace') if match else f"part-{len(parts) + 1}"
+        parts.append((filename, body[header_end + 4:end]))
+        pos = end + 2
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests to a ConversionServer
+    
+    POST /convert (or /) with a torrent file as the body converts it;
+    a multipart/form-data body converts every part. Add ?trackers=1 to
+    include trackers in the magnet links. GET /metrics returns the server
+    metrics and GET /health a liveness check.
+    """
+    
+    protocol_version = 'HTTP/1.1'
+    server_version = f'magneto/{__version__}'
+    
+    def setup(self):
+        # Idle keep-alive connections time out and release their worker
+        self.timeout = self.server.idle_timeout
+        self._idle = False
+        super().setup()
+    
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            # A connection waiting for its next request still holds a
+            # worker, so it gives the worker up if others are queued
+            if not self.server._mark_idle(self.connection):
+                break
+            self._idle = True
+            self.handle_one_request()
+    
+    def parse_request(self):
+        ok = super().parse_request()
+        if self._idle:
+            self._idle = False
+            if not self.server._mark_busy(self.connection):
+                # Closed for a queued connection as the request came in;
+                # answer it, then close
+                self.close_connection = True
+        return ok
+    
+    def do_GET(self):
+        self._begin()
+        if self._endpoint == '/metrics':
+            body = self.server.metrics.render().encode('utf-8')
+            self._respond(200, body, 'text/plain; version=0.0.4; charset=utf-8')
+        elif self._endpoint == '/health':
+            self._respond_json(200, {"status": "ok"})
+        else:
+            self._respond_json(404, {"status": "error", "error": "Not found"})
+    
+    def do_POST(self):
+        self._begin()
+        if self._endpoint not in ('/convert', '/'):
+            self.close_connection = True
+            self._respond_json(404, {"status": "error", "error": "Not found"})
+            return
+        
+        length = self.headers.get('Content-Length', '')
+        if 'chunked' in self.headers.get('Transfer-Encoding', '').lower() or not length.isdigit():
+            self.close_connection = True
+            self._respond_json(411, {"status": "error", "error": "Content-Length required"})
+            return
+        length = int(length)
+        if length > self.server.max_body:
+            self.close_connection = True
+            self._respond_json(413, {
+                "status": "error",
+                "error": f"Request body exceeds maximum size of {self.server.max_body} bytes"
+            })
+            return
+        body = self.rfile.read(length)
+        if len(body) < length:
+            # Client went away mid-body
+            self.close_connection = True
+            self.server.metrics.record(self._endpoint, 400, time.perf_counter() - self._started)
+            return
+        
+        query = parse_qs(urlsplit(self.path).query)
+        include_trackers = query.get('trackers', ['0'])[-1].lower() in ('1', 'true', 'yes')
+        media_type, params = _content_type_params(self.headers.get('Content-Type', ''))
+        
+        if media_type != 'multipart/form-data':
+            result = self._convert(None, body, include_trackers)
+            self._respond_json(200 if result['status'] == 'ok' else 422, result)
+            return
+        
+        boundary = params.get('boundary')
+        try:
+            if not boundary:
+                raise ValueError("multipart boundary missing")
+            parts = _parse_multipart(body, boundary.encode('latin-1'))
+        except (ValueError, UnicodeEncodeError) as e:
+            self._respond_json(400, {"status": "error", "error": f"Invalid multipart body: {e}"})
+            return
+        results = [self._convert(filename, data, include_trackers) for filename, data in parts]
+        self._respond_json(200, {"results": results})
+    
+    def _convert(self, filename: Optional[str], data: bytes, include_trackers: bool) -> Dict:
+        """Convert one torrent into its JSON result record"""
+        record = {"file": filename} if filename is not None else {}
+        try:
+            result = self.server.converter.convert_bytes(data, include_trackers=include_trackers)
+        except ValueError as e:
+            self.server.metrics.record_conversions(0, 1)
+            record.update({"status": "error", "error": str(e)})
+            return record
+        self.server.metrics.record_conversions(1, 0)
+        record.update({
+            "status": "ok",
+            "magnet": result.magnet_link,
+            "info_hash": result.info_hash,
+            "name": result.name or '',
+            "trackers": list(result.trackers),
+            "file_size": result.file_size,
+        })
+        return record
+    
+    def _begin(self):
+        """Start timing the current request"""
+        self._started = time.perf_counter()
+        path = urlsplit(self.path).path
+        self._endpoint = path if path in _ENDPOINTS or path == '/' else 'other'
+        self.server.metrics.begin()
+    
+    def _respond_json(self, status: int, payload):
+        """Send a JSON response"""
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self._respond(status, body, 'application/json')
+    
+    def _respond(self, status: int, body: bytes, content_type: str):
+        """Send a response and record it in the metrics"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.metrics.record(self._endpoint, status, time.perf_counter() - self._started)
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ConversionServer(HTTPServer):
+    """
+    HTTP server converting torrents with one long-lived TorrentConverter
+    
+    Connections are handled on a pool of worker threads and kept alive
+    between requests (HTTP/1.1), so clients pay neither interpreter
+    startup nor a new connection per conversion. An idle keep-alive
+    connection holds its worker, so once connections are queued for a
+    worker the idle ones are closed.
+    """
+    
+    request_queue_size = 128
+    
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        converter: Optional[TorrentConverter] = None,
+        workers: int = 8,
+        idle_timeout: float = IDLE_TIMEOUT,
+        max_body: int = MAX_BODY_BYTES,
+        verbose: bool = False
+    ):
+        """
+        Bind the server
+        
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            converter: Converter to use (default: a new TorrentConverter,
+                closed with the server)
+            workers: Number of connections handled at the same time
+            idle_timeout: Seconds an idle keep-alive connection is kept open
+                while no other connection waits for a worker
+            max_body: Largest request body accepted in bytes
+            verbose: Whether to log every request to stderr
+        """
+        super().__init__(address, ConversionRequestHandler)
+        self._owns_converter = converter is None
+        self.converter = converter if converter is not None else TorrentConverter()
+        self.metrics = ServerMetrics()
+        self.idle_timeout = idle_timeout
+        self.max_body = max_body
+        self.verbose = verbose
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='magneto-serve')
+        self._connections = set()
+        # Keep-alive connections waiting for their next request, oldest first
+        self._idle: Dict[socket.socket, None] = {}
+        self._connections_lock = threading.Lock()
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the server"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def process_request(self, request, client_address):
+        idle = None
+        with self._connections_lock:
+            self._connections.add(request)
+            if len(self._connections) > self.workers and self._idle:
+                idle = next(iter(self._idle))
+                del self._idle[idle]
+        if idle is not None:
+            # Wake the worker waiting on the oldest idle connection; it sees
+            # the end of the stream and moves on to the queued connection
+            try:
+                idle.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        self._executor.submit(self._process_request_worker, request, client_address)
+    
+    def _mark_idle(self, connection) -> bool:
+        """
+        Record that a keep-alive connection waits for its next request
+        
+        Returns:
+            False if connections are queued for a worker and this one
+            should close instead
+        """
+        with self._connections_lock:
+            if len(self._connections) > self.workers:
+                return False
+            self._idle[connection] = None
+            return True
+    
+    def _mark_busy(self, connection) -> bool:
+        """
+        Record that an idle connection received a request
+        
+        Returns:
+            False if the connection was closed to free its worker
+        """
+        with self._connections_lock:
+            if connection in self._idle:
+                del self._idle[connection]
+                return True
+            return False
+    
+    def _process_request_worker(self, request, client_address):
+        """Handle one connection on a worker thread"""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+                self._idle.pop(request, None)
+            self.shutdown_request(request)
+    
+    def handle_error(self, request, client_address):
+        if self.verbose:
+            super().handle_error(request, client_address)
+    
+    def server_close(self):
+        """Stop listening, close open connections and wait for the workers"""
+        super().server_close()
+        with self._connections_lock:
+            connections = list(self._connections)
+        # Wake up workers waiting on idle keep-alive connections
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._executor.shutdown(wait=True)
+        if self._owns_converter:
+            self.converter.close()
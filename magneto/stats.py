@@ -0,0 +1,192 @@
+"""
+Stats module - Per-stage timing statistics for conversions
+"""
+import heapq
+import math
+import threading
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+
+# Stages in report order; other stages are reported after these
+STAGES = ('download', 'cache', 'read', 'parse', 'info_hash', 'magnet', 'write', 'total')
+
+
+def _rank(ordered, percent: float) -> float:
+    """Nearest-rank percentile of sorted samples"""
+    index = max(math.ceil(percent / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+class StageStats:
+    """Durations recorded for one stage"""
+    
+    __slots__ = ('name', 'count', 'total', 'samples')
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        # Compact float array: 8 bytes per sample
+        self.samples = array('d')
+    
+    def add(self, seconds: float):
+        """Record one duration in seconds"""
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+    
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds"""
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Duration below which percent of the samples fall (nearest rank)
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Duration in seconds (0.0 without samples)
+        """
+        if not self.samples:
+            return 0.0
+        return _rank(sorted(self.samples), percent)
+    
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the stage
+        
+        Returns:
+            Dictionary with count, total, mean, p50, p95, p99 and max
+        """
+        if not self.samples:
+            return dict.fromkeys(('count', 'total', 'mean', 'p50', 'p95', 'p99', 'max'), 0.0)
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'total': self.total,
+            'mean': self.mean,
+            'p50': _rank(ordered, 50),
+            'p95': _rank(ordered, 95),
+            'p99': _rank(ordered, 99),
+            'max': ordered[-1],
+        }
+
+
+class ConversionStats:
+    """
+    Timing statistics collected by a TorrentConverter
+    
+    Each stage of a conversion (reading, parsing, hashing, ...) records its
+    duration, and the total time per file is kept along with the slowest
+    files. Recording is thread-safe; statistics from worker processes are
+    combined with merge().
+    """
+    
+    def __init__(self, slowest: int = 10):
+        """
+        Initialize statistics
+        
+        Args:
+            slowest: Number of slowest files to keep
+        """
+        self.stages: Dict[str, StageStats] = {}
+        self.slowest_count = slowest
+        # Min-heap of (seconds, path) holding the slowest files
+        self._slowest: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+    
+    def __getstate__(self):
+        # Locks cannot be pickled; worker processes send their stats back
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def _stage(self, stage: str) -> StageStats:
+        """Get the statistics of a stage, creating them if needed"""
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats(stage)
+        return stats
+    
+    def add(self, stage: str, seconds: float):
+        """Record the duration of one stage"""
+        with self._lock:
+            self._stage(stage).add(seconds)
+    
+    def add_file(self, path, seconds: float):
+        """Record the total conversion time of one file"""
+        with self._lock:
+            self._stage('total').add(seconds)
+            self._push_slowest((seconds, str(path)))
+    
+    def _push_slowest(self, entry: Tuple[float, str]):
+        """Keep entry if it is among the slowest files"""
+        if len(self._slowest) < self.slowest_count:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+    
+    def merge(self, other: 'ConversionStats'):
+        """Add the statistics of another instance to this one"""
+        with self._lock:
+            for name, stats in other.stages.items():
+                mine = self._stage(name)
+                mine.count += stats.count
+                mine.total += stats.total
+                mine.samples.extend(stats.samples)
+            for entry in other._slowest:
+                self._push_slowest(entry)
+    
+    def get(self, stage: str) -> Optional[StageStats]:
+        """Get the statistics of a stage, or None if it was never recorded"""
+        return self.stages.get(stage)
+    
+    @property
+    def slowest(self) -> List[Tuple[str, float]]:
+        """Slowest files as (path, seconds), slowest first"""
+        return [(path, seconds) for seconds, path in sorted(self._slowest, reverse=True)]
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize all stages
+        
+        Returns:
+            Dictionary mapping stage name to its summary (see
+            StageStats.summary), in report order
+        """
+        names = [name for name in STAGES if name in self.stages]
+        names += sorted(name for name in self.stages if name not in STAGES)
+        return {name: self.stages[name].summary() for name in names}
+    
+    def format_report(self) -> List[str]:
+        """
+        Format the statistics as a table
+        
+        Returns:
+            Report lines (durations in milliseconds)
+        """
+        lines = [
+            f"{'Stage':<10} {'Count':>9} {'Total s':>10} {'Mean ms':>9} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'Max ms':>9}"
+        ]
+        for name, summary in self.summary().items():
+            lines.append(
+                f"{name:<10} {summary['count']:>9} {summary['total']:>10.3f} "
+                f"{summary['mean'] * 1000:>9.3f} {summary['p50'] * 1000:>9.3f} "
+                f"{summary['p95'] * 1000:>9.3f} {summary['p99'] * 1000:>9.3f} "
+                f"{summary['max'] * 1000:>9.3f}"
+            )
+        if self._slowest:
+            lines.append("")
+            lines.append("Slowest files:")
+            for path, seconds in self.slowest:
+                lines.append(f"  {seconds * 1000:>9.3f} ms  {path}")
+        return lines
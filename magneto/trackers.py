@@ -0,0 +1,94 @@
+"""
+Trackers module - Tracker URL interning and encoding shared across a batch
+"""
+import threading
+import urllib.parse
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+
+# Default number of tracker URLs remembered
+TRACKER_CACHE_SIZE = 4096
+
+
+class TrackerRegistry:
+    """
+    Interns tracker URLs and remembers their percent-encoded form
+    
+    Large batches tend to repeat the same few hundred trackers across
+    every torrent. The registry hands out one shared string per tracker,
+    so results do not each hold their own copies, and encodes each tracker
+    for magnet links once. The most recently used max_size trackers are
+    kept; the registry is safe to share between threads.
+    """
+    
+    def __init__(self, max_size: int = TRACKER_CACHE_SIZE):
+        """
+        Initialize registry
+        
+        Args:
+            max_size: Maximum number of tracker URLs remembered
+        """
+        self.max_size = max(max_size, 1)
+        # raw value -> (tracker, encoded tracker), least recently used first
+        self._entries: 'OrderedDict[Union[str, bytes], Tuple[str, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _lookup(self, raw: Union[str, bytes]) -> Tuple[str, str]:
+        """Interned and encoded forms of a raw tracker value"""
+        # Hits skip the lock: a lookup is atomic, and a tracker evicted by
+        # another thread in between is simply not moved
+        entry = self._entries.get(raw)
+        if entry is not None:
+            try:
+                self._entries.move_to_end(raw)
+            except KeyError:
+                pass
+            return entry
+        
+        text = raw.decode('utf-8', errors='ignore') if isinstance(raw, bytes) else raw
+        text = text.strip()
+        with self._lock:
+            # The decoded text is a key too, so encoding an interned tracker
+            # finds the same entry
+            entry = self._entries.get(text)
+            if entry is None:
+                entry = (text, urllib.parse.quote(text, safe=''))
+                self._entries[text] = entry
+            self._entries[raw] = entry
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return entry
+    
+    def intern(self, raw: Union[str, bytes]) -> Optional[str]:
+        """
+        Normalize a tracker URL and return its shared instance
+        
+        Args:
+            raw: Tracker URL as decoded from a torrent (str, or bytes if it
+                is not valid UTF-8)
+        
+        Returns:
+            The URL without surrounding whitespace, or None if it is empty
+        """
+        return self._lookup(raw)[0] or None
+    
+    def encode(self, tracker: Union[str, bytes]) -> str:
+        """
+        Percent-encode a tracker URL for the tr parameter of a magnet link
+        
+        Args:
+            tracker: Tracker URL
+        
+        Returns:
+            Encoded tracker URL
+        """
+        return self._lookup(tracker)[1]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def clear(self):
+        """Forget all tracker URLs"""
+        with self._lock:
+            self._entries.clear()
@@ -2,35 +2,185 @@
 User interface module - Handles output and user interaction
 """
 import sys
+import time
 from pathlib import Path
-from typing import List, Tuple
-
-try:
-    # Try to import colorama for Windows color output support
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    HAS_COLORAMA = True
-except ImportError:
-    HAS_COLORAMA = False
-    # Create empty color classes
-    class Fore:
-        GREEN = ""
-        RED = ""
-        YELLOW = ""
-        BLUE = ""
-        CYAN = ""
-        MAGENTA = ""
-        RESET = ""
-    
-    class Style:
-        BRIGHT = ""
-        RESET_ALL = ""
+from typing import Iterable, Optional, Sequence, TextIO
+
+from .result import ConversionResult
+from .writers import create_writer
+
+
+class Fore:
+    """ANSI foreground colors (the codes colorama.Fore provides)"""
+    GREEN = "\033[32m"
+    RED = "\033[31m"
+    YELLOW = "\033[33m"
+    BLUE = "\033[34m"
+    CYAN = "\033[36m"
+    MAGENTA = "\033[35m"
+    RESET = "\033[39m"
+
+
+class Style:
+    """ANSI text styles (the codes colorama.Style provides)"""
+    BRIGHT = "\033[1m"
+    RESET_ALL = "\033[0m"
+
+
+# Whether the Windows console understands ANSI colors (None: not checked yet)
+_windows_colors: Optional[bool] = None
+
+
+def _supports_color(stream: TextIO) -> bool:
+    """
+    Check whether colors can be written to a stream
+    
+    Colors are only written to terminals. Windows consoles need colorama,
+    which is imported the first time colored output is printed, so runs
+    that print nothing in color never load it.
+    """
+    global _windows_colors
+    try:
+        if not stream.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+    if sys.platform != 'win32':
+        return True
+    if _windows_colors is None:
+        try:
+            import colorama
+        except ImportError:
+            _windows_colors = False
+        else:
+            if hasattr(colorama, 'just_fix_windows_console'):
+                colorama.just_fix_windows_console()
+            else:
+                colorama.init()
+            _windows_colors = True
+    return _windows_colors
+
+
+# Batches with more files than this default to the single-line progress display
+LARGE_BATCH = 100
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration as H:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+class ProgressLine:
+    """
+    Throttled progress display with throughput and ETA
+    
+    On a terminal a single status line is redrawn in place at most rate
+    times per second. On other streams (pipes, log files) a summary line is
+    printed every summary_interval seconds instead.
+    """
+    
+    def __init__(
+        self,
+        stream: TextIO,
+        total: Optional[int] = None,
+        rate: float = 4.0,
+        summary_interval: float = 5.0,
+        tty: Optional[bool] = None,
+        done: int = 0
+    ):
+        """
+        Initialize progress display
+        
+        Args:
+            stream: Stream to draw on
+            total: Number of files in the batch, or None if unknown
+            rate: Maximum number of redraws per second on a terminal
+            summary_interval: Seconds between summary lines when the stream
+                is not a terminal
+            tty: Whether to draw in place (default: detect from stream)
+            done: Number of files already finished before the display started
+        """
+        if tty is None:
+            isatty = getattr(stream, 'isatty', None)
+            tty = bool(isatty and isatty())
+        self.stream = stream
+        self.total = total
+        self.tty = tty
+        self.interval = 1.0 / rate if tty and rate > 0 else summary_interval
+        self.done = done
+        self.errors = 0
+        self.bytes = 0
+        self._base = done
+        self._start = time.monotonic()
+        self._next_draw = self._start + self.interval
+        self._width = 0
+    
+    def update(self, file_size: int = 0, error: bool = False):
+        """Record one finished file and redraw if the interval has passed"""
+        self.done += 1
+        self.bytes += file_size
+        if error:
+            self.errors += 1
+        now = time.monotonic()
+        if now >= self._next_draw:
+            self._next_draw = now + self.interval
+            self._draw(now)
+    
+    def status(self, now: Optional[float] = None) -> str:
+        """Format the current status"""
+        elapsed = max((now or time.monotonic()) - self._start, 1e-9)
+        files_rate = (self.done - self._base) / elapsed
+        if self.total is not None:
+            percentage = (self.done / self.total * 100) if self.total > 0 else 100.0
+            parts = [f"[{self.done}/{self.total}] {percentage:.1f}%"]
+        else:
+            parts = [f"[{self.done}]"]
+        parts.append(f"{files_rate:.1f} files/s")
+        parts.append(f"{self.bytes / elapsed / (1024 * 1024):.2f} MB/s")
+        parts.append(f"{self.errors} error(s)")
+        if self.total is not None and files_rate > 0:
+            remaining = max(self.total - self.done, 0)
+            parts.append(f"ETA {_format_duration(remaining / files_rate)}")
+        return " | ".join(parts)
+    
+    def clear(self):
+        """Erase the status line so that other output can be printed"""
+        if self.tty and self._width:
+            self.stream.write("\r" + " " * self._width + "\r")
+            self.stream.flush()
+            self._width = 0
+    
+    def finish(self):
+        """Draw the final status and end the line"""
+        self._draw(time.monotonic())
+        if self.tty:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._width = 0
+    
+    def _draw(self, now: float):
+        """Write the status line"""
+        line = self.status(now)
+        if self.tty:
+            padding = " " * max(self._width - len(line), 0)
+            self.stream.write(f"\r{line}{padding}")
+            self._width = len(line)
+        else:
+            self.stream.write(f"Progress: {line}\n")
+        self.stream.flush()
 
 
 class UI:
     """User interface handler"""
     
-    def __init__(self, verbose: bool = False, quiet: bool = False, use_colors: bool = True):
+    def __init__(
+        self,
+        verbose: bool = False,
+        quiet: bool = False,
+        use_colors: bool = True,
+        stream: Optional[TextIO] = None
+    ):
         """
         Initialize UI
         
@@ -38,75 +188,190 @@ class UI:
             verbose: Whether to show detailed information
             quiet: Whether to use quiet mode (only show errors)
             use_colors: Whether to use colored output
+            stream: Stream for progress and status messages (default:
+                stdout; use stderr when results are written to stdout)
         """
         self.verbose = verbose
         self.quiet = quiet
-        self.use_colors = use_colors and HAS_COLORAMA
+        self._stream = stream
+        self.use_colors = use_colors
         self.success_count = 0
         self.error_count = 0
+        self.progress: Optional[ProgressLine] = None
     
-    def _colorize(self, text: str, color: str) -> str:
-        """Add color to text (if supported)"""
-        if self.use_colors:
+    @property
+    def stream(self) -> TextIO:
+        """Stream that status messages are printed to"""
+        return self._stream if self._stream is not None else sys.stdout
+    
+    def _colorize(self, text: str, color: str, stream: Optional[TextIO] = None) -> str:
+        """Add color to text (if supported by the stream it is printed to)"""
+        if self.use_colors and _supports_color(stream if stream is not None else self.stream):
             return f"{color}{text}{Style.RESET_ALL}"
         return text
     
     def print_success(self, message: str):
         """Print success message"""
         if not self.quiet:
-            print(self._colorize(f"✓ {message}", Fore.GREEN))
+            print(self._colorize(f"✓ {message}", Fore.GREEN), file=self.stream)
         self.success_count += 1
     
     def print_error(self, message: str):
         """Print error message"""
-        print(self._colorize(f"✗ {message}", Fore.RED), file=sys.stderr)
+        if self.progress is not None:
+            self.progress.clear()
+        print(self._colorize(f"✗ {message}", Fore.RED, sys.stderr), file=sys.stderr)
         self.error_count += 1
     
     def print_warning(self, message: str):
         """Print warning message"""
         if not self.quiet:
-            print(self._colorize(f"⚠ {message}", Fore.YELLOW))
+            print(self._colorize(f"⚠ {message}", Fore.YELLOW), file=self.stream)
     
     def print_info(self, message: str):
         """Print info message"""
         if not self.quiet:
-            print(self._colorize(f"ℹ {message}", Fore.CYAN))
+            print(self._colorize(f"ℹ {message}", Fore.CYAN), file=self.stream)
     
     def print_verbose(self, message: str):
         """Print verbose message"""
         if self.verbose and not self.quiet:
-            print(self._colorize(f"  {message}", Fore.BLUE))
+            print(self._colorize(f"  {message}", Fore.BLUE), file=self.stream)
     
     def print_header(self, message: str):
         """Print header"""
         if not self.quiet:
-            print(self._colorize(f"\n{message}", Style.BRIGHT + Fore.MAGENTA))
+            print(self._colorize(f"\n{message}", Style.BRIGHT + Fore.MAGENTA), file=self.stream)
     
     def print_separator(self):
         """Print separator line"""
         if not self.quiet:
-            print("-" * 80)
+            print("-" * 80, file=self.stream)
     
-    def print_progress(self, current: int, total: int, filename: str):
-        """Print progress information"""
+    def print_progress(self, current: int, total: Optional[int], filename: str):
+        """Print progress information (total is None while still unknown)"""
         if not self.quiet:
+            if total is None:
+                print(f"[{current}] {filename}", file=self.stream)
+                return
             percentage = (current / total * 100) if total > 0 else 0
-            print(f"[{current}/{total}] ({percentage:.1f}%) {filename}")
+            print(f"[{current}/{total}] ({percentage:.1f}%) {filename}", file=self.stream)
+    
+    def start_progress(self, total: Optional[int] = None, rate: float = 4.0, done: int = 0):
+        """
+        Switch to the single-line progress display
+        
+        While it is active, finished files are reported with advance_progress
+        instead of print_progress and print_success.
+        
+        Args:
+            total: Number of files in the batch, or None if unknown
+            rate: Maximum number of redraws per second
+            done: Number of files already reported
+        """
+        if not self.quiet:
+            self.progress = ProgressLine(self.stream, total=total, rate=rate, done=done)
+    
+    def advance_progress(self, file_size: int = 0, error: Optional[str] = None):
+        """
+        Record one finished file
+        
+        Args:
+            file_size: Size of the converted file in bytes
+            error: Error message if the file failed (it is printed)
+        """
+        if error is not None:
+            self.print_error(error)
+        else:
+            self.success_count += 1
+        if self.progress is not None:
+            self.progress.update(file_size, error is not None)
+    
+    def finish_progress(self):
+        """Draw the final progress status and leave the progress display"""
+        if self.progress is not None:
+            self.progress.finish()
+            self.progress = None
     
     def print_summary(self):
         """Print processing summary"""
+        self.finish_progress()
         if not self.quiet:
             total = self.success_count + self.error_count
-            print("\n" + "=" * 80)
-            print(f"Processing complete: {total} file(s) total")
-            print(self._colorize(f"Success: {self.success_count}", Fore.GREEN))
+            print("\n" + "=" * 80, file=self.stream)
+            print(f"Processing complete: {total} file(s) total", file=self.stream)
+            print(self._colorize(f"Success: {self.success_count}", Fore.GREEN), file=self.stream)
             if self.error_count > 0:
-                print(self._colorize(f"Failed: {self.error_count}", Fore.RED))
-            print("=" * 80)
+                print(self._colorize(f"Failed: {self.error_count}", Fore.RED), file=self.stream)
+            print("=" * 80, file=self.stream)
+    
+    def print_timings(self, stats):
+        """
+        Print the per-stage timing report
+        
+        Args:
+            stats: ConversionStats collected by the converter
+        """
+        if not self.quiet:
+            print("\nTimings:", file=self.stream)
+            for line in stats.format_report():
+                print(f"  {line}" if line else line, file=self.stream)
+    
+    def print_duplicates(self, duplicates):
+        """
+        Print the number of duplicates skipped, and the groups in verbose mode
+        
+        Args:
+            duplicates: DuplicateFilter used while writing the results
+        """
+        if self.quiet:
+            return
+        print(
+            self._colorize(
+                f"Duplicates skipped: {duplicates.duplicate_count} "
+                f"({duplicates.group_count} torrent(s) found more than once)",
+                Fore.YELLOW if duplicates.duplicate_count else Fore.GREEN
+            ),
+            file=self.stream
+        )
+        if self.verbose:
+            for info_hash, name, kept, paths in duplicates.groups():
+                print(f"  {info_hash} {name}".rstrip(), file=self.stream)
+                if kept is not None:
+                    print(f"    {kept} (kept)", file=self.stream)
+                for path in paths:
+                    print(f"    {path}", file=self.stream)
+    
+    def print_saved(self, output_file: Path):
+        """Print the location results were saved to"""
+        if not self.quiet:
+            print(self._colorize(f"\nResults saved to: {output_file}", Fore.GREEN), file=self.stream)
+    
+    @staticmethod
+    def _write_results(writer, results: Iterable[Sequence]):
+        """
+        Write results given as (file_path, result) pairs or as the older
+        (file_path, magnet_link, info_hash, metadata) tuples
+        
+        In the tuple form a magnet link that is not a magnet URI is the
+        error message of a failed conversion.
+        """
+        for item in results:
+            if len(item) == 4:
+                file_path, magnet_link, info_hash, metadata = item
+                if magnet_link.startswith("magnet:"):
+                    writer.write(file_path, magnet_link, info_hash, metadata)
+                else:
+                    if magnet_link.startswith("Error: "):
+                        magnet_link = magnet_link[len("Error: "):]
+                    writer.write_result(file_path, ConversionResult.failed(magnet_link))
+            else:
+                file_path, result = item
+                writer.write_result(file_path, result)
     
     def save_results(
         self,
-        results: List[Tuple[str, str, str, dict]],
+        results: Iterable[Sequence],
         output_file: Path,
         format_type: str = "full"
     ):
@@ -114,129 +379,37 @@ class UI:
         Save results to file
         
         Args:
-            results: Results list, each element is (file_path, magnet_link, info_hash, metadata)
+            results: Results, each element is (file_path, result) where
+                result is a ConversionResult or the exception raised, or
+                (file_path, magnet_link, info_hash, metadata)
             output_file: Output file path
-            format_type: Output format type ("full", "links_only", "json")
+            format_type: Output format type ("full", "links_only", "json", "jsonl")
         """
         try:
-            if format_type == "json":
-                import json
-                output_data = []
-                for torrent_path, magnet_link, info_hash, metadata in results:
-                    if not magnet_link.startswith("Error"):
-                        output_data.append({
-                            "file": str(torrent_path),
-                            "magnet": magnet_link,
-                            "info_hash": info_hash,
-                            "name": metadata.get('name', ''),
-                            "trackers": metadata.get('trackers', [])
-                        })
-                
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, ensure_ascii=False, indent=2)
-            
-            elif format_type == "links_only":
-                # Save magnet links only
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    for torrent_path, magnet_link, info_hash, metadata in results:
-                        if not magnet_link.startswith("Error"):
-                            f.write(f"{magnet_link}\n")
-            
-            else:  # full format
-                # Full format
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write("=" * 80 + "\n")
-                    f.write("Torrent to Magnet Link Conversion Results\n")
-                    f.write("=" * 80 + "\n\n")
-                    
-                    for torrent_path, magnet_link, info_hash, metadata in results:
-                        f.write(f"File: {torrent_path}\n")
-                        f.write(f"Magnet Link: {magnet_link}\n")
-                        if info_hash:
-                            f.write(f"Info Hash: {info_hash}\n")
-                        if metadata.get('name'):
-                            f.write(f"Name: {metadata['name']}\n")
-                        if metadata.get('trackers'):
-                            f.write(f"Trackers: {len(metadata['trackers'])} found\n")
-                        f.write("-" * 80 + "\n\n")
-                    
-                    # Magnet link list
-                    f.write("\n" + "=" * 80 + "\n")
-                    f.write("Magnet Link List (Links Only)\n")
-                    f.write("=" * 80 + "\n\n")
-                    
-                    for torrent_path, magnet_link, info_hash, metadata in results:
-                        if not magnet_link.startswith("Error"):
-                            f.write(f"{magnet_link}\n")
-            
-            if not self.quiet:
-                print(self._colorize(f"\nResults saved to: {output_file}", Fore.GREEN))
+            with create_writer(format_type, output_file) as writer:
+                self._write_results(writer, results)
+            self.print_saved(output_file)
         
         except Exception as e:
             self.print_error(f"Error saving file: {e}")
     
     def print_results(
         self,
-        results: List[Tuple[str, str, str, dict]],
+        results: Iterable[Sequence],
         format_type: str = "full"
     ):
         """
         Print results to stdout
         
         Args:
-            results: Results list, each element is (file_path, magnet_link, info_hash, metadata)
-            format_type: Output format type ("full", "links_only", "json")
+            results: Results, each element is (file_path, result) where
+                result is a ConversionResult or the exception raised, or
+                (file_path, magnet_link, info_hash, metadata)
+            format_type: Output format type ("full", "links_only", "json", "jsonl")
         """
         try:
-            if format_type == "json":
-                import json
-                output_data = []
-                for torrent_path, magnet_link, info_hash, metadata in results:
-                    if not magnet_link.startswith("Error"):
-                        output_data.append({
-                            "file": str(torrent_path),
-                            "magnet": magnet_link,
-                            "info_hash": info_hash,
-                            "name": metadata.get('name', ''),
-                            "trackers": metadata.get('trackers', [])
-                        })
-                
-                print(json.dumps(output_data, ensure_ascii=False, indent=2))
-            
-            elif format_type == "links_only":
-                # Print magnet links only
-                for torrent_path, magnet_link, info_hash, metadata in results:
-                    if not magnet_link.startswith("Error"):
-                        print(magnet_link)
-            
-            else:  # full format
-                # Full format
-                print("=" * 80)
-                print("Torrent to Magnet Link Conversion Results")
-                print("=" * 80)
-                print()
-                
-                for torrent_path, magnet_link, info_hash, metadata in results:
-                    print(f"File: {torrent_path}")
-                    print(f"Magnet Link: {magnet_link}")
-                    if info_hash:
-                        print(f"Info Hash: {info_hash}")
-                    if metadata.get('name'):
-                        print(f"Name: {metadata['name']}")
-                    if metadata.get('trackers'):
-                        print(f"Trackers: {len(metadata['trackers'])} found")
-                    print("-" * 80)
-                    print()
-                
-                # Magnet link list
-                print("=" * 80)
-                print("Magnet Link List (Links Only)")
-                print("=" * 80)
-                print()
-                
-                for torrent_path, magnet_link, info_hash, metadata in results:
-                    if not magnet_link.startswith("Error"):
-                        print(magnet_link)
+            with create_writer(format_type, stream=sys.stdout) as writer:
+                self._write_results(writer, results)
         
         except Exception as e:
             self.print_error(f"Error printing results: {e}")
@@ -1,12 +1,72 @@
 """
 Utility functions module
 """
+import os
 import re
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from urllib.parse import urlparse
 
 
+def _is_torrent_name(name: str, case_sensitive: bool) -> bool:
+    """Check whether a file name has the .torrent extension"""
+    if case_sensitive:
+        return name.endswith('.torrent')
+    return name[-8:].lower() == '.torrent'
+
+
+def iter_torrent_files(
+    input_path: Path,
+    recursive: bool = False,
+    case_sensitive: bool = False
+) -> Iterator[Path]:
+    """
+    Find torrent files in a single pass, yielding each as soon as it is found
+    
+    Directories are walked with os.scandir, so no directory is listed more
+    than once and nothing is collected up front. Paths come out in directory
+    listing order; use collect_torrent_files for a sorted list. Symbolic
+    links to directories are not followed, and directories that cannot be
+    listed are skipped.
+    
+    Args:
+        input_path: Input path (file or directory)
+        recursive: Whether to recursively search subdirectories
+        case_sensitive: Whether to only match the lowercase .torrent
+            extension (otherwise .TORRENT, .Torrent etc. match too)
+        
+    Yields:
+        Torrent file paths
+    """
+    if input_path.is_file():
+        if _is_torrent_name(input_path.name, case_sensitive):
+            yield input_path
+        return
+    if not input_path.is_dir():
+        return
+    
+    pending = [str(input_path)]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                try:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif _is_torrent_name(entry.name, case_sensitive) and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+        # Visit subdirectories depth-first in listing order
+        pending.extend(reversed(subdirs))
+
+
 def collect_torrent_files(
     input_path: Path, 
     recursive: bool = False,
@@ -21,31 +81,9 @@ def collect_torrent_files(
         case_sensitive: Whether to be case-sensitive
         
     Returns:
-        List of torrent file paths
+        Sorted list of torrent file paths
     """
-    torrent_files = []
-    
-    if input_path.is_file():
-        # Single file
-        suffix = input_path.suffix.lower() if not case_sensitive else input_path.suffix
-        if suffix == '.torrent':
-            torrent_files.append(input_path)
-    elif input_path.is_dir():
-        # Directory
-        if recursive:
-            # Recursive search
-            pattern = '**/*.torrent' if not case_sensitive else '**/*.TORRENT'
-            torrent_files.extend(list(input_path.glob(pattern)))
-            if case_sensitive:
-                torrent_files.extend(list(input_path.glob('**/*.torrent')))
-        else:
-            # Current directory only
-            torrent_files.extend(list(input_path.glob('*.torrent')))
-            torrent_files.extend(list(input_path.glob('*.TORRENT')))
-    
-    # Remove duplicates and sort
-    torrent_files = sorted(set(torrent_files))
-    return torrent_files
+    return sorted(iter_torrent_files(input_path, recursive, case_sensitive))
 
 
 def get_output_path(
@@ -94,6 +132,10 @@ def format_file_size(size: int) -> str:
     return f"{size:.2f} PB"
 
 
+# Input argument that stands for torrent data on standard input
+STDIN_INPUT = '-'
+
+
 def is_url(input_string: str) -> bool:
     """
     Check if input string is a valid URL
@@ -128,3 +170,30 @@ def is_url(input_string: str) -> bool:
         return all([result.scheme in ['http', 'https'], result.netloc])
     except Exception:
         return False
+
+
+def read_url_list(source: str) -> List[str]:
+    """
+    Read torrent URLs from a file, one per line
+    
+    Blank lines and lines starting with '#' are ignored.
+    
+    Args:
+        source: Path of the URL list file, or '-' to read from stdin
+        
+    Returns:
+        List of URLs in file order
+        
+    Raises:
+        IOError: File read failed
+    """
+    if source == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    
+    return [
+        line.strip() for line in lines
+        if line.strip() and not line.strip().startswith('#')
+    ]
@@ -0,0 +1,422 @@
+"""
+Watch module - Detect torrent files as they land in a directory
+"""
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .utils import _is_torrent_name
+
+
+# Seconds a file's size and modification time must stay unchanged before it
+# is considered completely written
+SETTLE_SECONDS = 1.0
+
+# Seconds between directory scans when polling
+POLL_INTERVAL = 1.0
+
+# Directories modified this recently are listed again on the next scan, in
+# case an entry was added within the file system's timestamp granularity
+_RECENT_SECONDS = 2.0
+
+# inotify constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT = struct.Struct('iIII')
+
+
+class _WatchLimitReached(Exception):
+    """Raised when inotify cannot add more watches"""
+
+
+def _scan(directory: str, recursive: bool, is_torrent: Callable[[str], bool]) -> Tuple[List[str], List[str]]:
+    """
+    List a directory
+    
+    Returns:
+        Tuple of (torrent file paths, subdirectory paths); subdirectories
+        are only listed when recursive, and not followed through symlinks
+    """
+    files, directories = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if recursive and entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif is_torrent(entry.name) and entry.is_file():
+                        files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, directories
+
+
+class _PollingBackend:
+    """Finds new files by listing directories whose modification time changed"""
+    
+    name = 'polling'
+    
+    def __init__(self, root: str, recursive: bool, is_torrent: Callable[[str], bool], interval: float):
+        self.root = root
+        self.recursive = recursive
+        self.is_torrent = is_torrent
+        self.interval = interval
+        # directory -> (mtime_ns when listed, torrent file names, subdirectory names)
+        self._dirs: Dict[str, Tuple[int, Set[str], Set[str]]] = {}
+        self._next_scan = time.monotonic() + interval
+        self.initial_files: List[str] = []
+        pending = [root]
+        while pending:
+            files, directories = self._list(pending.pop())
+            self.initial_files += files
+            pending += directories
+    
+    def _list(self, directory: str) -> Tuple[List[str], List[str]]:
+        """List a directory and remember its entries"""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._dirs.pop(directory, None)
+            return [], []
+        files, directories = _scan(directory, self.recursive, self.is_torrent)
+        self._dirs[directory] = (
+            mtime,
+            {os.path.basename(path) for path in files},
+            {os.path.basename(path) for path in directories},
+        )
+        return files, directories
+    
+    def changes(self, timeout: float) -> List[str]:
+        """Wait up to timeout, then report files added since the last scan"""
+        now = time.monotonic()
+        if now + timeout < self._next_scan:
+            time.sleep(timeout)
+            return []
+        time.sleep(max(self._next_scan - now, 0))
+        self._next_scan = time.monotonic() + self.interval
+        
+        added = []
+        recent = (time.time() - _RECENT_SECONDS) * 1e9
+        for directory in list(self._dirs):
+            if directory not in self._dirs:
+                continue
+            mtime, names, subdirectories = self._dirs[directory]
+            try:
+                current = os.stat(directory).st_mtime_ns
+            except OSError:
+                if directory == self.root:
+                    raise IOError(f"Watched directory is gone: {directory}")
+                del self._dirs[directory]
+                continue
+            if current == mtime and current < recent:
+                continue
+            
+            files, directories = self._list(directory)
+            added += [path for path in files if os.path.basename(path) not in names]
+            # Files in new subdirectories are new too
+            pending = [path for path in directories if os.path.basename(path) not in subdirectories]
+            while pending:
+                files, directories = self._list(pending.pop())
+                added += files
+                pending += directories
+        return added
+    
+    def close(self):
+        """Nothing to release"""
+
+
+class _InotifyBackend:
+    """Reports file activity from Linux inotify, called through ctypes"""
+    
+    name = 'inotify'
+    
+    def __init__(self, root: str, recursive: bool, is_torrent: Callable[[str], bool]):
+        import ctypes
+        
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(None, use_errno=True)
+        try:
+            self._add_watch = libc.inotify_add_watch
+            init = libc.inotify_init1
+        except AttributeError:
+            raise OSError("inotify is not available")
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._add_watch.restype = ctypes.c_int
+        self._get_errno = ctypes.get_errno
+        
+        self.root = root
+        self.recursive = recursive
+        self.is_torrent = is_torrent
+        self._fd = init(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            error = self._get_errno()
+            raise OSError(error, os.strerror(error))
+        self._watches: Dict[int, str] = {}
+        try:
+            self.initial_files = self._watch_tree(root)
+        except _WatchLimitReached:
+            self.close()
+            raise OSError(errno.ENOSPC, "inotify watch limit reached")
+        except OSError:
+            self.close()
+            raise
+        self._last_read = time.time()
+    
+    def _watch_tree(self, directory: str) -> List[str]:
+        """
+        Watch a directory (and its subdirectories when recursive)
+        
+        Returns:
+            Torrent files found in the watched directories
+        
+        Raises:
+            OSError: The root directory cannot be watched
+            _WatchLimitReached: No more watches can be added
+        """
+        found = []
+        pending = [directory]
+        while pending:
+            path = pending.pop()
+            wd = self._add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+            if wd < 0:
+                error = self._get_errno()
+                if error == errno.ENOSPC:
+                    raise _WatchLimitReached()
+                if path == self.root:
+                    raise OSError(error, f"Unable to watch {path}: {os.strerror(error)}")
+                # Removed before it could be watched
+                continue
+            self._watches[wd] = path
+            files, directories = _scan(path, self.recursive, self.is_torrent)
+            found += files
+            pending += directories
+        return found
+    
+    def changes(self, timeout: float) -> List[str]:
+        """Wait up to timeout for events and report the torrent files they touch"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        since = self._last_read
+        self._last_read = time.time()
+        
+        changed = []
+        offset = 0
+        while offset + _EVENT.size <= len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            
+            if mask & _IN_Q_OVERFLOW:
+                # Events were lost: report files changed since the last read
+                changed += self._recently_changed(since)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & _IN_IGNORED:
+                del self._watches[wd]
+                continue
+            if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                if directory == self.root:
+                    raise IOError(f"Watched directory is gone: {directory}")
+                continue
+            
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & _IN_ISDIR:
+                if self.recursive and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    # Files may have landed before the watch was added
+                    changed += self._watch_tree(path)
+            elif self.is_torrent(os.fsdecode(name)):
+                changed.append(path)
+        return changed
+    
+    def _recently_changed(self, since: float) -> List[str]:
+        """Torrent files in watched directories modified at or after since"""
+        changed = []
+        for directory in list(self._watches.values()):
+            files, _ = _scan(directory, False, self.is_torrent)
+            for path in files:
+                try:
+                    if os.stat(path).st_mtime >= since - 1:
+                        changed.append(path)
+                except OSError:
+                    continue
+        return changed
+    
+    def close(self):
+        """Close the inotify descriptor"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class DirectoryWatcher:
+    """
+    Detects torrent files as they are added to a directory
+    
+    Uses inotify on Linux and otherwise polls, listing only directories
+    whose modification time changed. New files are held back until their
+    size and modification time have stayed unchanged for settle seconds,
+    so files still being written are not picked up half-way.
+    """
+    
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        recursive: bool = False,
+        case_sensitive: bool = False,
+        settle: float = SETTLE_SECONDS,
+        poll_interval: float = POLL_INTERVAL,
+        use_inotify: bool = True,
+        existing: bool = False
+    ):
+        """
+        Start watching
+        
+        Args:
+            directory: Directory to watch
+            recursive: Whether to watch subdirectories too
+            case_sensitive: Whether to only match the lowercase .torrent
+                extension
+            settle: Seconds a new file must stay unchanged before it is
+                reported
+            poll_interval: Seconds between scans when polling
+            use_inotify: Whether to use inotify where available
+            existing: Whether to also report torrent files already present
+        
+        Raises:
+            IOError: directory is not a directory
+        """
+        self.directory = Path(directory)
+        if not self.directory.is_dir():
+            raise IOError(f"Not a directory: {self.directory}")
+        self.settle = settle
+        self.poll_interval = poll_interval
+        self.recursive = recursive
+        self._is_torrent = partial(_is_torrent_name, case_sensitive=case_sensitive)
+        self._pending: Dict[str, Tuple[Optional[Tuple[int, int]], float]] = {}
+        self._closed = False
+        
+        self._backend = None
+        if use_inotify:
+            try:
+                self._backend = _InotifyBackend(str(self.directory), recursive, self._is_torrent)
+            except OSError:
+                self._backend = None
+        if self._backend is None:
+            self._backend = self._polling_backend()
+        
+        if existing:
+            self._add(self._backend.initial_files)
+        self._backend.initial_files = []
+    
+    def _polling_backend(self) -> _PollingBackend:
+        """Create the polling backend for this watcher"""
+        return _PollingBackend(str(self.directory), self.recursive, self._is_torrent, self.poll_interval)
+    
+    @property
+    def mode(self) -> str:
+        """Change detection in use, 'inotify' or 'polling'"""
+        return self._backend.name
+    
+    def _add(self, paths: List[str]):
+        """Hold back reported files until they settle"""
+        now = time.monotonic()
+        for path in paths:
+            self._pending[path] = (None, now)
+    
+    def poll(self, timeout: Optional[float] = None) -> List[Path]:
+        """
+        Wait for activity and return the files that have settled
+        
+        Args:
+            timeout: Maximum seconds to wait (default: poll_interval); the
+                wait is shorter when a pending file is due to settle
+        
+        Returns:
+            Sorted paths of new torrent files that are completely written
+        
+        Raises:
+            IOError: The watched directory was removed
+        """
+        if self._closed:
+            return []
+        if timeout is None:
+            timeout = self.poll_interval
+        if self._pending:
+            due = min(since for _, since in self._pending.values()) + self.settle
+            timeout = max(min(timeout, due - time.monotonic()), 0)
+        try:
+            self._add(self._backend.changes(timeout))
+        except _WatchLimitReached:
+            # Too many directories for inotify: poll from here on
+            self._backend.close()
+            self._backend = self._polling_backend()
+            self._backend.initial_files = []
+        return self._settled()
+    
+    def _settled(self) -> List[Path]:
+        """Remove and return the pending files unchanged for settle seconds"""
+        now = time.monotonic()
+        ready = []
+        for path, (signature, since) in list(self._pending.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                del self._pending[path]
+                continue
+            current = (stat.st_size, stat.st_mtime_ns)
+            if current != signature:
+                self._pending[path] = (current, now)
+            elif now - since >= self.settle and stat.st_size > 0:
+                del self._pending[path]
+                ready.append(Path(path))
+        return sorted(ready)
+    
+    def __iter__(self):
+        """Yield new torrent files until closed"""
+        while not self._closed:
+            yield from self.poll()
+    
+    def close(self):
+        """Stop watching"""
+        if not self._closed:
+            self._closed = True
+            self._backend.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,333 @@
+"""
+Writers module - Incremental result writers for each output format
+"""
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, TextIO, Type, Union
+
+from .result import ConversionResult
+
+if TYPE_CHECKING:
+    from .dedupe import DuplicateFilter
+
+
+# Seconds between flushes of buffered output
+FLUSH_INTERVAL = 1.0
+
+# Write buffer size for output files
+_BUFFER_SIZE = 1024 * 1024
+
+
+class ResultWriter:
+    """
+    Base class of incremental result writers
+    
+    Results are passed to write() one at a time as they are produced and
+    close() finishes the output, so memory use does not grow with the batch.
+    Output is buffered and flushed at most every flush_interval seconds,
+    which lets other programs follow the file while a batch is running.
+    When writing to a path, the file is only created once the first result
+    arrives.
+    """
+    
+    def __init__(
+        self,
+        output_file: Optional[Path] = None,
+        stream: Optional[TextIO] = None,
+        flush_interval: float = FLUSH_INTERVAL,
+        stats=None,
+        duplicates: Optional['DuplicateFilter'] = None
+    ):
+        """
+        Initialize writer
+        
+        Args:
+            output_file: Output file path (used when stream is None)
+            stream: Text stream to write to instead of a file, such as
+                sys.stdout; it is flushed but not closed
+            flush_interval: Seconds between flushes of buffered output
+            stats: ConversionStats that records the time spent in write()
+                as the "write" stage
+            duplicates: DuplicateFilter that drops results whose info hash
+                was already written
+        """
+        if output_file is None and stream is None:
+            stream = sys.stdout
+        self.output_file = output_file
+        self.flush_interval = flush_interval
+        self.count = 0
+        self.stats = stats
+        self.duplicates = duplicates
+        self._stream = stream
+        self._owns_stream = stream is None
+        self._started = False
+        self._last_flush = time.monotonic()
+    
+    def write(self, torrent_path: str, magnet_link: str, info_hash: str, metadata: dict):
+        """
+        Write one successful conversion given as the fields of the tuple form
+        
+        Failed conversions are written with write_result.
+        
+        Args:
+            torrent_path: Source file path or URL
+            magnet_link: Magnet link
+            info_hash: Info hash
+            metadata: Metadata dictionary of the conversion
+        """
+        self._add(
+            str(torrent_path),
+            magnet_link,
+            info_hash,
+            metadata.get('name'),
+            metadata.get('trackers') or (),
+            None
+        )
+    
+    def write_result(self, torrent_path: str, result: Union[ConversionResult, Exception]):
+        """
+        Write one result as returned by the converter
+        
+        Args:
+            torrent_path: Source file path or URL
+            result: ConversionResult (failed results have status ERROR), or
+                the exception raised for the file
+        """
+        if isinstance(result, Exception):
+            result = ConversionResult.failed(result)
+        if not result.ok:
+            self._add(str(torrent_path), '', '', None, (), result.error)
+        else:
+            self._add(
+                str(torrent_path),
+                result.magnet_link,
+                result.info_hash,
+                result.name,
+                result.trackers,
+                None
+            )
+    
+    def _add(
+        self,
+        torrent_path: str,
+        magnet_link: str,
+        info_hash: str,
+        name: Optional[str],
+        trackers: Sequence[str],
+        error: Optional[str]
+    ):
+        """Write one result unless it is a duplicate"""
+        if self.stats is not None:
+            started = time.perf_counter()
+        if (self.duplicates is not None and error is None
+                and not self.duplicates.add(info_hash, torrent_path, name)):
+            if self.stats is not None:
+                self.stats.add('write', time.perf_counter() - started)
+            return
+        if not self._started:
+            if self._stream is None:
+                self._stream = open(
+                    self.output_file, 'w', encoding='utf-8', buffering=_BUFFER_SIZE
+                )
+            self._started = True
+            self._begin()
+        self.count += 1
+        self._write_result(torrent_path, magnet_link, info_hash, name, trackers, error)
+        
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._stream.flush()
+            self._last_flush = now
+        if self.stats is not None:
+            self.stats.add('write', time.perf_counter() - started)
+    
+    def close(self):
+        """Finish the output and release the file"""
+        if not self._started:
+            return
+        self._started = False
+        try:
+            self._end()
+            self._stream.flush()
+        finally:
+            if self._owns_stream:
+                self._stream.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _begin(self):
+        """Write anything that precedes the first result"""
+    
+    def _write_result(
+        self,
+        torrent_path: str,
+        magnet_link: str,
+        info_hash: str,
+        name: Optional[str],
+        trackers: Sequence[str],
+        error: Optional[str]
+    ):
+        """Write one result, which failed if error is set (implemented by each format)"""
+        raise NotImplementedError
+    
+    def _end(self):
+        """Write anything that follows the last result"""
+
+
+class LinksOnlyWriter(ResultWriter):
+    """Writes one magnet link per line, skipping errors"""
+    
+    def _write_result(self, torrent_path, magnet_link, info_hash, name, trackers, error):
+        if error is None:
+            self._stream.write(f"{magnet_link}\n")
+
+
+class FullWriter(ResultWriter):
+    """
+    Writes a block per result followed by a list of all magnet links
+    
+    The trailing link list is spooled to a temporary file while results
+    arrive and copied to the output on close.
+    """
+    
+    def _begin(self):
+        import tempfile
+        
+        self._spool = tempfile.TemporaryFile('w+', encoding='utf-8')
+        self._stream.write("=" * 80 + "\n")
+        self._stream.write("Torrent to Magnet Link Conversion Results\n")
+        self._stream.write("=" * 80 + "\n\n")
+    
+    def _write_result(self, torrent_path, magnet_link, info_hash, name, trackers, error):
+        if error is not None:
+            self._stream.write(f"File: {torrent_path}\nMagnet Link: Error: {error}\n" + "-" * 80 + "\n\n")
+            return
+        lines = [f"File: {torrent_path}\n", f"Magnet Link: {magnet_link}\n"]
+        if info_hash:
+            lines.append(f"Info Hash: {info_hash}\n")
+        if name:
+            lines.append(f"Name: {name}\n")
+        if trackers:
+            lines.append(f"Trackers: {len(trackers)} found\n")
+        lines.append("-" * 80 + "\n\n")
+        self._stream.write(''.join(lines))
+        self._spool.write(f"{magnet_link}\n")
+    
+    def _end(self):
+        import shutil
+        
+        try:
+            # Magnet link list
+            self._stream.write("\n" + "=" * 80 + "\n")
+            self._stream.write("Magnet Link List (Links Only)\n")
+            self._stream.write("=" * 80 + "\n\n")
+            self._spool.seek(0)
+            shutil.copyfileobj(self._spool, self._stream)
+        finally:
+            self._spool.close()
+
+
+class JsonWriter(ResultWriter):
+    """Writes a JSON array of successful results, one element at a time"""
+    
+    def _begin(self):
+        import json
+        
+        self._dumps = json.dumps
+        self._stream.write("[")
+        self._separator = "\n"
+    
+    def _write_result(self, torrent_path, magnet_link, info_hash, name, trackers, error):
+        if error is not None:
+            return
+        element = self._dumps({
+            "file": torrent_path,
+            "magnet": magnet_link,
+            "info_hash": info_hash,
+            "name": name if name is not None else '',
+            "trackers": list(trackers)
+        }, ensure_ascii=False, indent=2)
+        self._stream.write(self._separator + "  " + element.replace("\n", "\n  "))
+        self._separator = ",\n"
+    
+    def _end(self):
+        # An array without elements is written as []
+        self._stream.write("\n]\n" if self._separator != "\n" else "]\n")
+
+
+class JsonLinesWriter(ResultWriter):
+    """
+    Writes one compact JSON object per line (NDJSON), including errors
+    
+    Every record has a status field: "ok" records carry the conversion
+    result, "error" records carry the error message instead.
+    """
+    
+    def _begin(self):
+        import json
+        
+        self._dumps = json.dumps
+    
+    def _write_result(self, torrent_path, magnet_link, info_hash, name, trackers, error):
+        if error is not None:
+            record = {"file": torrent_path, "status": "error", "error": error}
+        else:
+            record = {
+                "file": torrent_path,
+                "status": "ok",
+                "magnet": magnet_link,
+                "info_hash": info_hash,
+                "name": name if name is not None else '',
+                "trackers": list(trackers)
+            }
+        self._stream.write(self._dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+
+
+WRITERS: Dict[str, Type[ResultWriter]] = {
+    'full': FullWriter,
+    'links_only': LinksOnlyWriter,
+    'json': JsonWriter,
+    'jsonl': JsonLinesWriter,
+}
+
+# Output file extensions of formats that have their own
+EXTENSIONS: Dict[str, str] = {
+    'json': '.json',
+    'jsonl': '.jsonl',
+}
+
+
+def create_writer(
+    format_type: str,
+    output_file: Optional[Path] = None,
+    stream: Optional[TextIO] = None,
+    flush_interval: float = FLUSH_INTERVAL,
+    stats=None,
+    duplicates: Optional['DuplicateFilter'] = None
+) -> ResultWriter:
+    """
+    Create the incremental writer for an output format
+    
+    Args:
+        format_type: Output format type ("full", "links_only", "json", "jsonl")
+        output_file: Output file path; stdout is used if neither
+            output_file nor stream is given
+        stream: Text stream to write to instead of a file
+        flush_interval: Seconds between flushes of buffered output
+        stats: ConversionStats that records the time spent writing
+        duplicates: DuplicateFilter that drops repeated info hashes
+    
+    Returns:
+        ResultWriter for the format
+    
+    Raises:
+        ValueError: Unknown format type
+    """
+    if format_type not in WRITERS:
+        raise ValueError(f"Unknown output format: {format_type}")
+    return WRITERS[format_type](output_file, stream, flush_interval, stats, duplicates)
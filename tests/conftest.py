@@ -2,6 +2,10 @@
 Pytest configuration and fixtures
 """
 import hashlib
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import bencode
 import pytest
@@ -117,3 +121,104 @@ def sample_torrent_dir(tmp_path, mock_torrent_bytes):
     
     return torrent_dir
 
+
+
+class TorrentHTTPServer(ThreadingHTTPServer):
+    """Local HTTP server serving in-memory torrent files"""
+    
+    daemon_threads = True
+    
+    def __init__(self, routes, delay=0.0):
+        super().__init__(('127.0.0.1', 0), TorrentRequestHandler)
+        self.routes = routes
+        self.redirects = {}
+        self.errors = {}
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.request_count = 0
+        self.connection_count = 0
+    
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    def handle_error(self, request, client_address):
+        # Clients that hang up mid-request are expected in the tests
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+
+class TorrentRequestHandler(BaseHTTPRequestHandler):
+    """Serve routes registered on TorrentHTTPServer, 404 otherwise"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connection_count += 1
+    
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.request_count += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if server.delay:
+                time.sleep(server.delay)
+            location = server.redirects.get(self.path)
+            if location is not None:
+                self.send_response(302)
+                self.send_header('Location', location)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            error = server.errors.get(self.path)
+            if error is not None:
+                status, body = error
+                self.send_response(status)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self._write_body(body)
+                return
+            body = server.routes.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/x-bittorrent')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self._write_body(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+    
+    def _write_body(self, body: bytes):
+        """Write a response body; clients may hang up before reading it all"""
+        try:
+            self.wfile.write(body)
+        except (ConnectionResetError, BrokenPipeError):
+            self.close_connection = True
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def torrent_http_server(mock_torrent_bytes):
+    """Start a local HTTP server serving mock torrent files"""
+    routes = {f"/file_{i}.torrent": mock_torrent_bytes for i in range(8)}
+    server = TorrentHTTPServer(routes)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.05},
+        daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
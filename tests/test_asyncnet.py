@@ -0,0 +1,107 @@
+"""
+Unit tests for non-blocking HTTP client module
+"""
+import asyncio
+import http.client
+
+import pytest
+
+from magneto.asyncnet import AsyncResponse, open_url
+
+
+def read_response(raw, amt=None):
+    """Parse a raw HTTP response and read its body"""
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        response = AsyncResponse(reader, None, timeout=5)
+        await response._begin()
+        if amt is None:
+            return response, await response.read()
+        parts = []
+        while True:
+            chunk = await response.read(amt)
+            if not chunk:
+                return response, b''.join(parts)
+            parts.append(chunk)
+    return asyncio.run(run())
+
+
+@pytest.mark.unit
+class TestAsyncResponse:
+    """Test cases for AsyncResponse body decoding"""
+    
+    def test_content_length(self):
+        """Test that the body stops at Content-Length"""
+        response, body = read_response(
+            b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhelloEXTRA'
+        )
+        assert response.status == 200
+        assert response.reason == 'OK'
+        assert response.headers['Content-Length'] == '5'
+        assert body == b'hello'
+    
+    @pytest.mark.parametrize("amt", [None, 1, 3])
+    def test_chunked(self, amt):
+        """Test decoding a chunked body with extensions and trailers"""
+        response, body = read_response(
+            b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+            b'4;ext=1\r\nwiki\r\n5\r\npedia\r\n0\r\nTrailer: x\r\n\r\n',
+            amt
+        )
+        assert body == b'wikipedia'
+    
+    def test_until_close(self):
+        """Test reading a body without length until the connection closes"""
+        _, body = read_response(b'HTTP/1.0 200 OK\r\n\r\nall of it')
+        assert body == b'all of it'
+    
+    def test_skips_interim_response(self):
+        """Test that 100 Continue is skipped"""
+        response, body = read_response(
+            b'HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok'
+        )
+        assert response.status == 200
+        assert body == b'ok'
+    
+    def test_truncated_body(self):
+        """Test that a body shorter than Content-Length is an error"""
+        with pytest.raises(http.client.IncompleteRead):
+            read_response(b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort')
+
+
+@pytest.mark.unit
+class TestOpenUrl:
+    """Test cases for open_url against a local HTTP server"""
+    
+    def test_get(self, torrent_http_server, mock_torrent_bytes):
+        """Test fetching a file"""
+        async def run():
+            async with await open_url(f"{torrent_http_server.base_url}/file_0.torrent") as response:
+                return await response.read()
+        assert asyncio.run(run()) == mock_torrent_bytes
+    
+    def test_follows_redirect(self, torrent_http_server, mock_torrent_bytes):
+        """Test that redirects are followed"""
+        torrent_http_server.redirects['/latest.torrent'] = '/file_0.torrent'
+        async def run():
+            async with await open_url(f"{torrent_http_server.base_url}/latest.torrent") as response:
+                return await response.read()
+        assert asyncio.run(run()) == mock_torrent_bytes
+    
+    def test_redirect_loop(self, torrent_http_server):
+        """Test that redirect loops are cut off"""
+        torrent_http_server.redirects['/loop.torrent'] = '/loop.torrent'
+        with pytest.raises(IOError, match="Too many redirects"):
+            asyncio.run(open_url(f"{torrent_http_server.base_url}/loop.torrent", max_redirects=2))
+    
+    def test_http_error(self, torrent_http_server):
+        """Test that error statuses raise IOError"""
+        with pytest.raises(IOError, match="HTTP Error 404"):
+            asyncio.run(open_url(f"{torrent_http_server.base_url}/missing.torrent"))
+    
+    def test_unsupported_url(self):
+        """Test that non-HTTP URLs are rejected"""
+        with pytest.raises(IOError, match="Unsupported URL"):
+            asyncio.run(open_url("ftp://example.com/file.torrent"))
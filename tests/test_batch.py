@@ -0,0 +1,107 @@
+"""
+Unit tests for the batch co-process mode
+"""
+import base64
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from magneto.batch import BatchSession
+
+
+def run_session(lines, **kwargs):
+    """Run a session over request lines and return its responses by id"""
+    output = io.BytesIO()
+    requests = io.BytesIO(b''.join(
+        (line if isinstance(line, bytes) else json.dumps(line).encode('utf-8')) + b'\n'
+        for line in lines
+    ))
+    with BatchSession(output, **kwargs) as session:
+        answered = session.run(requests)
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert answered == len(responses)
+    return {response['id']: response for response in responses}
+
+
+@pytest.mark.unit
+class TestBatchSession:
+    """Test cases for BatchSession"""
+    
+    def test_path_request(self, mock_torrent_file, expected_info_hash):
+        """Test converting a torrent file named by path"""
+        responses = run_session([{"id": 1, "path": str(mock_torrent_file)}])
+        assert responses[1]['status'] == 'ok'
+        assert responses[1]['info_hash'] == expected_info_hash
+        assert responses[1]['magnet'].startswith(f"magnet:?xt=urn:btih:{expected_info_hash}")
+    
+    def test_data_request(self, mock_torrent_bytes, expected_info_hash):
+        """Test converting a base64 torrent body with trackers"""
+        data = base64.b64encode(mock_torrent_bytes).decode('ascii')
+        responses = run_session([{"id": "a", "data": data, "trackers": True}])
+        assert responses['a']['info_hash'] == expected_info_hash
+        assert responses['a']['trackers']
+        assert '&tr=' in responses['a']['magnet']
+    
+    def test_url_request(self, torrent_http_server, expected_info_hash):
+        """Test converting a torrent downloaded from a URL"""
+        url = f"{torrent_http_server.base_url}/file_0.torrent"
+        responses = run_session([{"id": 7, "url": url}])
+        assert responses[7]['status'] == 'ok'
+        assert responses[7]['info_hash'] == expected_info_hash
+    
+    def test_errors_keep_session_alive(self, mock_torrent_file, tmp_path):
+        """Test that bad requests are answered and do not stop the session"""
+        responses = run_session([
+            b'not json',
+            {"id": 1, "path": str(tmp_path / "missing.torrent")},
+            {"id": 2},
+            {"id": 3, "data": "***"},
+            {"id": 4, "path": str(mock_torrent_file), "trackers": "yes"},
+            {"id": 5, "path": str(mock_torrent_file)},
+        ])
+        assert responses[None]['status'] == 'error'
+        for request_id in (1, 2, 3, 4):
+            assert responses[request_id]['status'] == 'error'
+            assert responses[request_id]['error']
+        assert responses[5]['status'] == 'ok'
+    
+    def test_many_requests(self, sample_torrent_dir):
+        """Test that every one of many concurrent requests is answered once"""
+        paths = sorted(Path(sample_torrent_dir).glob('*.torrent'))
+        lines = [{"id": index, "path": str(paths[index % len(paths)])} for index in range(100)]
+        output = io.BytesIO()
+        requests = io.BytesIO(b''.join(json.dumps(line).encode('utf-8') + b'\n' for line in lines))
+        with BatchSession(output, workers=4) as session:
+            session.run(requests)
+        ids = [json.loads(line)['id'] for line in output.getvalue().splitlines()]
+        assert sorted(ids) == list(range(100))
+        assert session.ok_count == 100
+        assert session.error_count == 0
+    
+    def test_coprocess(self, mock_torrent_file, expected_info_hash):
+        """Test that a running magneto --batch answers each request before the next is sent"""
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'magneto.main', '--batch'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=Path(__file__).resolve().parent.parent
+        )
+        try:
+            for request_id in range(3):
+                request = {"id": request_id, "path": str(mock_torrent_file)}
+                process.stdin.write(json.dumps(request).encode('utf-8') + b'\n')
+                process.stdin.flush()
+                response = json.loads(process.stdout.readline())
+                assert response['id'] == request_id
+                assert response['info_hash'] == expected_info_hash
+            process.stdin.close()
+            assert process.wait(timeout=10) == 0
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
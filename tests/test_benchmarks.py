@@ -0,0 +1,117 @@
+"""
+Unit tests for benchmark corpus and runner
+"""
+import bencode
+import pytest
+
+from benchmarks.bench import benchmark_names, compare, load_results, run_benchmark, save_results
+from benchmarks.corpus import PROFILES, Profile, bencode as corpus_bencode, generate_corpus, make_torrent
+from magneto.core import TorrentConverter
+
+
+SMALL_PROFILES = [
+    Profile('single', 3, 10, 1, 1),
+    Profile('multi', 2, 10, 5, 20),
+    Profile('broken', 5, 10, 1, 2, malformed=True),
+]
+
+
+@pytest.mark.unit
+class TestCorpus:
+    """Test cases for the synthetic corpus generator"""
+    
+    def test_bencode(self):
+        """Test encoding matches the reference bencode implementation"""
+        value = {'b': [1, -2, b'\x00\xff'], 'a': {'name': 'café'}}
+        assert corpus_bencode(value) == bencode.bencode(value)
+    
+    def test_deterministic(self):
+        """Test that a profile and index always give the same file"""
+        profile = SMALL_PROFILES[1]
+        assert make_torrent(profile, 1) == make_torrent(profile, 1)
+        assert make_torrent(profile, 0) != make_torrent(profile, 1)
+    
+    def test_profile_shape(self):
+        """Test pieces, files and trackers of a generated torrent"""
+        torrent = bencode.bdecode(make_torrent(SMALL_PROFILES[1], 0))
+        assert len(torrent['info']['pieces']) == 10 * 20
+        assert len(torrent['info']['files']) == 5
+        assert len(torrent['announce-list']) == 20
+    
+    def test_profiles_cover_range(self):
+        """Test that the default profiles span 10 to 1M pieces and 1 to 200 trackers"""
+        assert min(profile.pieces for profile in PROFILES) == 10
+        assert max(profile.pieces for profile in PROFILES) == 1_000_000
+        assert {1, 200} <= {profile.trackers for profile in PROFILES}
+        assert any(profile.files > 1 for profile in PROFILES)
+        assert any(profile.malformed for profile in PROFILES)
+    
+    def test_generated_files_convert(self, tmp_path):
+        """Test that valid profiles convert and malformed ones fail"""
+        corpus = generate_corpus(tmp_path, SMALL_PROFILES)
+        converter = TorrentConverter()
+        for path in corpus['single'] + corpus['multi']:
+            converter.convert(path)
+        for path in corpus['broken']:
+            with pytest.raises(ValueError):
+                converter.convert(path)
+    
+    def test_scale(self, tmp_path):
+        """Test that scale changes the number of files, keeping at least one"""
+        corpus = generate_corpus(tmp_path, SMALL_PROFILES, scale=0.01)
+        assert [len(paths) for paths in corpus.values()] == [1, 1, 1]
+
+
+@pytest.mark.unit
+class TestBenchmarkRunner:
+    """Test cases for running and comparing benchmarks"""
+    
+    def test_benchmark_names(self):
+        """Test that conversion, collection and every output format are covered"""
+        names = benchmark_names()
+        assert 'convert/huge' in names
+        assert 'collect_torrent_files' in names
+        assert {'write/full', 'write/links_only', 'write/json', 'write/jsonl'} <= set(names)
+    
+    def test_run_benchmark(self, tmp_path):
+        """Test measuring one benchmark in this process"""
+        result = run_benchmark('convert/tiny', tmp_path, scale=0.001, repeat=2)
+        assert result['files'] == 2
+        assert result['files_per_second'] > 0
+        with pytest.raises(ValueError, match="Unknown benchmark"):
+            run_benchmark('convert/missing', tmp_path, scale=0.001)
+    
+    @pytest.mark.parametrize('format_type', ['full', 'jsonl'])
+    def test_run_write_benchmark(self, tmp_path, format_type):
+        """Test measuring an output format benchmark, including malformed files"""
+        result = run_benchmark(f"write/{format_type}", tmp_path, scale=0.001, repeat=1)
+        assert result['files'] >= 3
+        assert result['files_per_second'] > 0
+    
+    def test_compare(self, tmp_path):
+        """Test regressions against a saved baseline"""
+        path = tmp_path / "baseline.json"
+        save_results(path, {'benchmarks': {
+            'a': {'files_per_second': 100.0, 'peak_rss': 1000},
+            'b': {'files_per_second': 100.0, 'peak_rss': None},
+        }})
+        baseline = load_results(path)
+        results = {'benchmarks': {
+            'a': {'files_per_second': 80.0, 'peak_rss': 1100},
+            'b': {'files_per_second': 95.0, 'peak_rss': None},
+            'c': {'files_per_second': 1.0, 'peak_rss': None},
+        }}
+        
+        rows = compare(results, baseline, threshold=10.0)
+        assert [row['name'] for row in rows] == ['a', 'b']
+        assert rows[0]['files_per_second'] == pytest.approx(-20.0)
+        assert rows[0]['peak_rss'] == pytest.approx(10.0)
+        assert [row['regressed'] for row in rows] == [True, False]
+        assert rows[1]['peak_rss'] is None
+    
+    def test_load_invalid_results(self, tmp_path):
+        """Test loading a file that is not a results document"""
+        path = tmp_path / "results.json"
+        path.write_text("[]")
+        with pytest.raises(ValueError, match="Unable to parse results"):
+            load_results(path)
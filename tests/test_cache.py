@@ -0,0 +1,150 @@
+"""
+Unit tests for conversion cache module
+"""
+import os
+from unittest.mock import patch
+
+import pytest
+
+from magneto.cache import ConversionCache, default_cache_path
+from magneto.core import TorrentConverter
+
+
+TRACKERS = ['http://tracker.example.com/announce', 'udp://tracker.example.org:80']
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a conversion cache in a temporary directory"""
+    with ConversionCache(tmp_path / "cache" / "cache.sqlite3") as conversion_cache:
+        yield conversion_cache
+
+
+@pytest.mark.unit
+class TestConversionCache:
+    """Test cases for ConversionCache class"""
+    
+    def test_default_cache_path(self, monkeypatch, tmp_path):
+        """Test that the default location follows XDG_CACHE_HOME"""
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+        assert default_cache_path() == tmp_path / 'magneto' / 'cache.sqlite3'
+    
+    def test_put_and_get(self, cache, mock_torrent_file):
+        """Test that a stored entry is returned for an unchanged file"""
+        stat = os.stat(mock_torrent_file)
+        cache.put(mock_torrent_file, stat, 'ABCD', 'Name', TRACKERS)
+        
+        assert cache.get(mock_torrent_file, os.stat(mock_torrent_file)) == (
+            'ABCD', 'Name', TRACKERS, stat.st_size
+        )
+        assert cache.hits == 1
+        assert len(cache) == 1
+    
+    def test_get_missing(self, cache, mock_torrent_file):
+        """Test lookup of a file that was never stored"""
+        assert cache.get(mock_torrent_file, os.stat(mock_torrent_file)) is None
+        assert cache.misses == 1
+    
+    def test_get_changed_file(self, cache, mock_torrent_file):
+        """Test that an entry is ignored once the file changes"""
+        cache.put(mock_torrent_file, os.stat(mock_torrent_file), 'ABCD', None, [])
+        mock_torrent_file.write_bytes(mock_torrent_file.read_bytes() + b'x')
+        
+        assert cache.get(mock_torrent_file, os.stat(mock_torrent_file)) is None
+    
+    def test_persistence(self, tmp_path, mock_torrent_file):
+        """Test that entries survive reopening the database"""
+        path = tmp_path / "cache.sqlite3"
+        with ConversionCache(path) as cache:
+            cache.put(mock_torrent_file, os.stat(mock_torrent_file), 'ABCD', 'Name', [])
+        
+        with ConversionCache(path) as cache:
+            entry = cache.get(mock_torrent_file, os.stat(mock_torrent_file))
+        assert entry[:3] == ('ABCD', 'Name', [])
+    
+    def test_prune(self, cache, sample_torrent_dir):
+        """Test that prune removes entries of deleted and changed files"""
+        paths = sorted(sample_torrent_dir.glob('*.torrent'))
+        for path in paths:
+            cache.put(path, os.stat(path), 'ABCD', None, [])
+        paths[0].unlink()
+        paths[1].write_bytes(b'changed')
+        
+        assert cache.prune() == 2
+        assert len(cache) == 1
+        assert cache.get(paths[2], os.stat(paths[2])) is not None
+    
+    def test_clear(self, cache, mock_torrent_file):
+        """Test that clear removes all entries"""
+        cache.put(mock_torrent_file, os.stat(mock_torrent_file), 'ABCD', None, [])
+        assert cache.clear() == 1
+        assert len(cache) == 0
+    
+    def test_open_error(self, tmp_path):
+        """Test opening a cache at an unusable path"""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        with pytest.raises(IOError, match="Unable to open cache"):
+            ConversionCache(blocker / "cache.sqlite3")
+
+
+@pytest.mark.unit
+class TestTorrentConverterCache:
+    """Test cases for TorrentConverter with a conversion cache"""
+    
+    def test_convert_uses_cache(self, cache, mock_torrent_file):
+        """Test that an unchanged file is converted without being read"""
+        converter = TorrentConverter(cache=cache)
+        first = converter.convert(mock_torrent_file)
+        
+        with patch.object(TorrentConverter, 'read_torrent_file', side_effect=AssertionError):
+            second = converter.convert(mock_torrent_file)
+        
+        assert second == first
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_cached_trackers(self, cache, mock_torrent_file):
+        """Test that trackers are cached even when not requested"""
+        converter = TorrentConverter(cache=cache)
+        without_trackers = converter.convert(mock_torrent_file)
+        with_trackers = converter.convert(mock_torrent_file, include_trackers=True)
+        
+        assert cache.hits == 1
+        assert without_trackers[2]['trackers'] == []
+        assert with_trackers == TorrentConverter().convert(mock_torrent_file, include_trackers=True)
+    
+    def test_changed_file_is_reconverted(self, cache, mock_torrent_file, mock_torrent_file_no_trackers):
+        """Test that a modified file is read again"""
+        converter = TorrentConverter(cache=cache)
+        converter.convert(mock_torrent_file)
+        mock_torrent_file.write_bytes(mock_torrent_file_no_trackers.read_bytes())
+        
+        magnet_link, _, metadata = converter.convert(mock_torrent_file)
+        assert metadata['name'] == 'No Tracker Torrent'
+        assert cache.misses == 2
+    
+    def test_errors_are_not_cached(self, cache, mock_torrent_file_invalid):
+        """Test that failed conversions are retried"""
+        converter = TorrentConverter(cache=cache)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                converter.convert(mock_torrent_file_invalid)
+        assert len(cache) == 0
+    
+    @pytest.mark.parametrize("options", [{}, {'prefetch': 2}, {'jobs': 2, 'chunksize': 2}])
+    def test_convert_many_uses_cache(self, cache, sample_torrent_dir, mock_torrent_file_invalid, options):
+        """Test that batch conversion returns cached results in input order"""
+        converter = TorrentConverter(cache=cache)
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) + [mock_torrent_file_invalid]
+        expected = list(TorrentConverter().convert_many(paths, include_trackers=True))
+        
+        # Warm the cache with half of the files
+        list(converter.convert_many(paths[:2], **options))
+        results = list(converter.convert_many(paths, include_trackers=True, **options))
+        
+        assert [path for path, _ in results] == paths
+        assert [result for _, result in results[:-1]] == [result for _, result in expected[:-1]]
+        assert results[-1][1] == expected[-1][1]
+        assert not results[-1][1].ok
+        assert cache.hits == 2
+        assert len(cache) == 3
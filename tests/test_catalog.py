@@ -0,0 +1,104 @@
+"""
+Unit tests for the torrent catalog module
+"""
+import pytest
+
+from magneto.catalog import TorrentCatalog, default_catalog_path
+from magneto.core import TorrentConverter
+
+
+HASH_A = 'AB' * 20
+HASH_B = 'CD' * 20
+TRACKERS = ['http://tracker.example.com/announce', 'udp://tracker.example.org:80']
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    """Create a catalog in a temporary directory"""
+    with TorrentCatalog(tmp_path / "data" / "catalog.sqlite3") as torrent_catalog:
+        yield torrent_catalog
+
+
+@pytest.mark.unit
+class TestTorrentCatalog:
+    """Test cases for TorrentCatalog class"""
+    
+    def test_default_catalog_path(self, monkeypatch, tmp_path):
+        """Test that the default location follows XDG_DATA_HOME"""
+        monkeypatch.setenv('XDG_DATA_HOME', str(tmp_path))
+        assert default_catalog_path() == tmp_path / 'magneto' / 'catalog.sqlite3'
+    
+    def test_add_and_get(self, catalog):
+        """Test that an added torrent is returned with its trackers in order"""
+        catalog.add(HASH_A.lower(), 'Ubuntu Server', TRACKERS, 1234, '/data/a.torrent')
+        assert catalog.get(HASH_A) == {
+            "info_hash": HASH_A,
+            "name": 'Ubuntu Server',
+            "file_size": 1234,
+            "source": '/data/a.torrent',
+            "trackers": TRACKERS,
+        }
+        assert catalog.get(HASH_B) is None
+        assert len(catalog) == 1
+    
+    def test_search_by_name(self, catalog):
+        """Test that every search word must prefix a word of the name"""
+        catalog.add(HASH_A, 'Ubuntu 24.04 Server amd64')
+        catalog.add(HASH_B, 'Debian Netinst Café')
+        assert [entry['info_hash'] for entry in catalog.search('ubu serv')] == [HASH_A]
+        assert [entry['info_hash'] for entry in catalog.search('cafe DEBIAN')] == [HASH_B]
+        assert catalog.search('ubuntu debian') == []
+        assert catalog.search('"') == []
+    
+    def test_search_by_info_hash(self, catalog):
+        """Test that a 40-character hex query is looked up as an info hash"""
+        catalog.add(HASH_A, 'Name')
+        assert [entry['name'] for entry in catalog.search(HASH_A.lower())] == ['Name']
+    
+    def test_search_limit(self, catalog):
+        """Test that the number of results is limited"""
+        for index in range(10):
+            catalog.add(f"{index:040X}", f"Album part {index}")
+        assert len(catalog.search('album', limit=3)) == 3
+    
+    def test_search_without_fts(self, catalog):
+        """Test the LIKE fallback used when SQLite lacks FTS5"""
+        catalog.add(HASH_A, 'Ubuntu 24.04 Server')
+        catalog.add(HASH_B, 'Ubuntu_Desktop 100%')
+        catalog.full_text = False
+        assert [entry['info_hash'] for entry in catalog.search('24.04 serv')] == [HASH_A]
+        assert [entry['info_hash'] for entry in catalog.search('_desk 100%')] == [HASH_B]
+    
+    def test_readd_replaces_entry(self, catalog):
+        """Test that adding an info hash again replaces its entry and trackers"""
+        catalog.add(HASH_A, 'Old Name', TRACKERS)
+        catalog.flush()
+        catalog.add(HASH_A, 'New Name', TRACKERS[1:])
+        assert catalog.search('old') == []
+        assert [entry['trackers'] for entry in catalog.search('new')] == [TRACKERS[1:]]
+        assert len(catalog) == 1
+    
+    def test_persistence(self, tmp_path):
+        """Test that entries survive reopening the database"""
+        path = tmp_path / "catalog.sqlite3"
+        with TorrentCatalog(path) as catalog:
+            catalog.add(HASH_A, 'Name', TRACKERS)
+        with TorrentCatalog(path) as catalog:
+            assert catalog.get(HASH_A)['trackers'] == TRACKERS
+    
+    def test_add_result(self, catalog, mock_torrent_file, expected_info_hash):
+        """Test adding the result of TorrentConverter.convert"""
+        converter = TorrentConverter()
+        result = converter.convert(mock_torrent_file, include_trackers=True)
+        catalog.add_result(str(mock_torrent_file), result)
+        entry = catalog.get(expected_info_hash)
+        assert entry['name'] == result.name
+        assert entry['trackers'] == list(result.trackers)
+        assert entry['source'] == str(mock_torrent_file)
+    
+    def test_open_failure(self, tmp_path):
+        """Test that an unusable database path raises IOError"""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        with pytest.raises(IOError):
+            TorrentCatalog(blocker / "catalog.sqlite3")
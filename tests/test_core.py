@@ -1,12 +1,20 @@
 """
 Unit tests for core conversion module
 """
+import asyncio
+import hashlib
+import io
+import mmap
+import socket
+import sys
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
-from magneto.core import TorrentConverter
+from magneto.core import TorrentConverter, _StreamScanner
+from magneto.result import ConversionStatus
 
 
 @pytest.mark.unit
@@ -18,11 +26,12 @@ class TestTorrentConverter:
         converter = TorrentConverter()
         assert converter is not None
     
-    def test_init_missing_bencode(self, monkeypatch):
-        """Test initialization when bencode is not available"""
-        monkeypatch.setattr('magneto.core.bencode', None)
-        with pytest.raises(ImportError, match="bencode module is not installed"):
-            TorrentConverter()
+    def test_init_without_bencode(self, monkeypatch, mock_torrent_file, expected_info_hash):
+        """Test that conversion does not depend on the bencode package"""
+        monkeypatch.setitem(sys.modules, 'bencode', None)
+        converter = TorrentConverter()
+        _, info_hash, _ = converter.convert(mock_torrent_file)
+        assert info_hash == expected_info_hash
     
     def test_read_torrent_file(self, mock_torrent_file):
         """Test reading torrent file"""
@@ -31,6 +40,29 @@ class TestTorrentConverter:
         assert isinstance(data, bytes)
         assert len(data) > 0
     
+    def test_read_torrent_file_mmap(self, mock_torrent_file, mock_torrent_bytes):
+        """Test memory-mapped read of a file above the threshold"""
+        converter = TorrentConverter(mmap_threshold=0)
+        data = converter.read_torrent_file(mock_torrent_file, use_mmap=True)
+        try:
+            assert isinstance(data, mmap.mmap)
+            assert data[:] == mock_torrent_bytes
+        finally:
+            data.close()
+    
+    def test_read_torrent_file_mmap_below_threshold(self, mock_torrent_file):
+        """Test that small files keep the plain read in mmap mode"""
+        converter = TorrentConverter()
+        data = converter.read_torrent_file(mock_torrent_file, use_mmap=True)
+        assert isinstance(data, bytes)
+    
+    def test_read_torrent_file_mmap_empty(self, tmp_path):
+        """Test that empty files are never memory-mapped"""
+        empty_file = tmp_path / "empty.torrent"
+        empty_file.write_bytes(b'')
+        converter = TorrentConverter(mmap_threshold=0)
+        assert converter.read_torrent_file(empty_file, use_mmap=True) == b''
+    
     def test_read_torrent_file_not_found(self):
         """Test reading non-existent torrent file"""
         converter = TorrentConverter()
@@ -49,6 +81,34 @@ class TestTorrentConverter:
         info_key = 'info' if 'info' in parsed else b'info'
         assert info_key in parsed
     
+    def test_parse_torrent_skips_unused_keys(self, mock_torrent_bytes):
+        """Test that only the fields used for conversion are decoded"""
+        converter = TorrentConverter()
+        parsed = converter.parse_torrent(mock_torrent_bytes)
+        assert set(parsed) == {'announce', 'announce-list', 'info'}
+        assert parsed['info'] == {'name': 'Test Torrent File'}
+        assert parsed['announce-list'] == [
+            ['http://tracker1.example.com/announce'],
+            ['http://tracker2.example.com/announce'],
+        ]
+    
+    def test_parse_torrent_include_files(self):
+        """Test decoding info.files on request"""
+        converter = TorrentConverter()
+        torrent_bytes = (
+            b'd4:infod5:filesld6:lengthi5e4:pathl5:a.txteee'
+            b'4:name3:dir6:pieces20:' + b'0' * 20 + b'ee'
+        )
+        assert 'files' not in converter.parse_torrent(torrent_bytes)['info']
+        parsed = converter.parse_torrent(torrent_bytes, include_files=True)
+        assert parsed['info']['files'] == [{'length': 5, 'path': ['a.txt']}]
+    
+    def test_parse_torrent_truncated(self, mock_torrent_bytes):
+        """Test parsing truncated torrent data"""
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="Unable to parse torrent file"):
+            converter.parse_torrent(mock_torrent_bytes[:-10])
+    
     def test_parse_torrent_invalid(self):
         """Test parsing invalid torrent data"""
         converter = TorrentConverter()
@@ -67,6 +127,57 @@ class TestTorrentConverter:
         assert info_hash.isupper()
         assert info_hash == expected_info_hash
     
+    def test_get_info_hash_from_bytes(self, mock_torrent_bytes, expected_info_hash):
+        """Test hashing the info span of raw torrent bytes"""
+        converter = TorrentConverter()
+        info_hash = converter.get_info_hash(mock_torrent_bytes)
+        assert info_hash == expected_info_hash
+    
+    def test_get_info_hash_non_canonical_key_order(self):
+        """Test that the hash covers the info bytes exactly as stored"""
+        converter = TorrentConverter()
+        # Keys deliberately out of order: re-encoding would sort them
+        info_raw = b'd6:pieces20:' + b'0' * 20 + b'4:name4:test12:piece lengthi16384ee'
+        torrent_bytes = b'd4:info' + info_raw + b'e'
+        info_hash = converter.get_info_hash(torrent_bytes)
+        assert info_hash == hashlib.sha1(info_raw).hexdigest().upper()
+    
+    def test_get_info_hash_from_parsed_non_canonical(self):
+        """Test that parsed data keeps the hash of the original info bytes"""
+        converter = TorrentConverter()
+        info_raw = b'd6:pieces20:' + b'0' * 20 + b'4:name4:test12:piece lengthi16384ee'
+        parsed = converter.parse_torrent(b'd4:info' + info_raw + b'e')
+        info_hash = converter.get_info_hash(parsed)
+        assert info_hash == hashlib.sha1(info_raw).hexdigest().upper()
+    
+    def test_get_info_hash_plain_dict(self, mock_torrent_data, expected_info_hash):
+        """Test hashing a dictionary that was not produced by parse_torrent"""
+        converter = TorrentConverter()
+        info_hash = converter.get_info_hash({'info': mock_torrent_data[b'info']})
+        assert info_hash == expected_info_hash
+    
+    def test_get_info_hash_partial_copy(self, mock_torrent_bytes):
+        """Test that copies of parsed data are not re-encoded into a wrong hash"""
+        converter = TorrentConverter()
+        torrent_data = converter.parse_torrent(mock_torrent_bytes)
+        with pytest.raises(ValueError, match="partially decoded"):
+            converter.get_info_hash(dict(torrent_data))
+        torrent_data.info_hash = None
+        with pytest.raises(ValueError, match="partially decoded"):
+            converter.get_info_hash(torrent_data)
+    
+    def test_get_info_hash_bytes_missing_info(self):
+        """Test hashing raw bytes without an info field"""
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="Torrent file is missing info field"):
+            converter.get_info_hash(b'd8:announce3:urle')
+    
+    def test_get_info_hash_bytes_truncated(self):
+        """Test hashing truncated raw bytes"""
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="Unable to parse torrent file"):
+            converter.get_info_hash(b'd4:infod4:name10:shorte')
+    
     def test_get_info_hash_missing_info(self):
         """Test extracting info hash when info field is missing"""
         converter = TorrentConverter()
@@ -194,6 +305,25 @@ class TestTorrentConverter:
         assert 'trackers' in metadata
         assert 'info_hash' in metadata
     
+    def test_convert_mmap(self, mock_torrent_file, mock_torrent_bytes, expected_info_hash):
+        """Test conversion through a memory-mapped buffer"""
+        converter = TorrentConverter(mmap_threshold=0)
+        magnet_link, info_hash, metadata = converter.convert(
+            mock_torrent_file,
+            include_trackers=True
+        )
+        
+        assert info_hash == expected_info_hash
+        assert metadata['file_size'] == len(mock_torrent_bytes)
+        assert metadata['name'] == "Test Torrent File"
+        assert "&tr=" in magnet_link
+    
+    def test_convert_mmap_invalid_file(self, mock_torrent_file_invalid):
+        """Test that memory-mapped conversion errors are still reported"""
+        converter = TorrentConverter(mmap_threshold=0)
+        with pytest.raises(ValueError, match="Unable to parse torrent file"):
+            converter.convert(mock_torrent_file_invalid)
+    
     def test_convert_with_trackers(self, mock_torrent_file):
         """Test conversion with trackers included"""
         converter = TorrentConverter()
@@ -228,6 +358,192 @@ class TestTorrentConverter:
         with pytest.raises(ValueError, match="Torrent file is missing info field"):
             converter.convert(mock_torrent_file_missing_info)
 
+    
+    def test_convert_many_serial(self, sample_torrent_dir, mock_torrent_file_invalid, expected_info_hash):
+        """Test batch conversion in the current process"""
+        converter = TorrentConverter()
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) + [mock_torrent_file_invalid]
+        results = list(converter.convert_many(paths))
+        
+        assert [path for path, _ in results] == paths
+        for _, result in results[:-1]:
+            assert result[1] == expected_info_hash
+        assert results[-1][1].status is ConversionStatus.ERROR
+        assert results[-1][1].error.startswith("Unable to parse torrent file")
+    
+    @pytest.mark.parametrize("chunksize", [1, 2, 16])
+    def test_convert_many_processes(self, sample_torrent_dir, mock_torrent_file_invalid, chunksize):
+        """Test that parallel batch conversion matches serial conversion"""
+        converter = TorrentConverter()
+        paths = [mock_torrent_file_invalid] + sorted(sample_torrent_dir.glob('*.torrent'))
+        serial = list(converter.convert_many(paths, include_trackers=True))
+        parallel = list(converter.convert_many(
+            paths,
+            include_trackers=True,
+            jobs=2,
+            chunksize=chunksize
+        ))
+        
+        assert [path for path, _ in parallel] == paths
+        assert not parallel[0][1].ok
+        assert parallel[0][1] == serial[0][1]
+        assert [result for _, result in parallel[1:]] == [result for _, result in serial[1:]]
+    
+    def test_iter_prefetched(self, sample_torrent_dir, mock_torrent_bytes, tmp_path):
+        """Test that read-ahead yields file contents in input order"""
+        converter = TorrentConverter()
+        missing = tmp_path / "missing.torrent"
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) + [missing]
+        results = list(converter.iter_prefetched(paths, depth=2))
+        
+        assert [path for path, _ in results] == paths
+        assert all(data == mock_torrent_bytes for _, data in results[:-1])
+        assert isinstance(results[-1][1], IOError)
+    
+    def test_iter_prefetched_bad_path(self, mock_torrent_file, mock_torrent_bytes):
+        """Test that a path failing before its read does not block later files"""
+        converter = TorrentConverter()
+        paths = [mock_torrent_file, Path("bad\0name.torrent"), mock_torrent_file, mock_torrent_file]
+        results = list(converter.iter_prefetched(paths, depth=4))
+        
+        assert [path for path, _ in results] == paths
+        assert isinstance(results[1][1], IOError)
+        assert [bytes(data) for _, data in results[2:]] == [mock_torrent_bytes] * 2
+    
+    def test_iter_prefetched_lookup_error(self, sample_torrent_dir, mock_torrent_file):
+        """Test that a failing cache lookup is reported and later files still convert"""
+        converter = TorrentConverter()
+        paths = [mock_torrent_file] + sorted(sample_torrent_dir.glob('*.torrent'))
+        calls = []
+        lookup = converter._lookup
+        
+        def failing_lookup(torrent_path):
+            calls.append(torrent_path)
+            if len(calls) == 1:
+                raise RuntimeError("cache unavailable")
+            return lookup(torrent_path)
+        
+        with patch.object(converter, '_lookup', failing_lookup):
+            results = list(converter._prefetch(paths, 4, 1024 * 1024, True, lookup=True))
+        
+        assert isinstance(results[0][1], RuntimeError)
+        assert [bytes(data) for _, data, _, _, _ in results[1:]] == [
+            path.read_bytes() for path in paths[1:]
+        ]
+    
+    def test_iter_prefetched_pages_in_mmap(self, sample_torrent_dir, mock_torrent_bytes, monkeypatch):
+        """Test that memory-mapped files are paged in on the reader threads"""
+        import magneto.core
+        
+        populated = []
+        populate = magneto.core._populate
+        
+        def record(mapping):
+            populated.append(threading.current_thread() is threading.main_thread())
+            populate(mapping)
+        
+        monkeypatch.setattr(magneto.core, '_populate', record)
+        converter = TorrentConverter(mmap_threshold=1)
+        paths = sorted(sample_torrent_dir.glob('*.torrent'))
+        results = [bytes(data) for _, data in converter.iter_prefetched(paths, depth=2)]
+        
+        assert results == [mock_torrent_bytes] * len(paths)
+        assert populated == [False] * len(paths)
+    
+    def test_iter_prefetched_small_budget(self, sample_torrent_dir, mock_torrent_bytes):
+        """Test that files larger than the budget are still read one at a time"""
+        converter = TorrentConverter(mmap_threshold=0)
+        paths = sorted(sample_torrent_dir.glob('*.torrent'))
+        results = [
+            bytes(data) for _, data in converter.iter_prefetched(paths, depth=8, max_bytes=1)
+        ]
+        assert results == [mock_torrent_bytes] * len(paths)
+    
+    def test_iter_prefetched_early_close(self, sample_torrent_dir):
+        """Test that abandoning the iterator does not block"""
+        converter = TorrentConverter()
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) * 10
+        prefetched = converter.iter_prefetched(paths, depth=4, max_bytes=1)
+        next(prefetched)
+        prefetched.close()
+    
+    def test_convert_many_prefetch(self, sample_torrent_dir, mock_torrent_file_invalid):
+        """Test that read-ahead conversion matches plain serial conversion"""
+        converter = TorrentConverter()
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) + [mock_torrent_file_invalid]
+        serial = list(converter.convert_many(paths))
+        prefetched = list(converter.convert_many(paths, prefetch=2))
+        
+        assert [path for path, _ in prefetched] == paths
+        assert [result for _, result in prefetched[:-1]] == [result for _, result in serial[:-1]]
+        assert prefetched[-1][1] == serial[-1][1]
+        assert not prefetched[-1][1].ok
+
+
+@pytest.mark.unit
+class TestTorrentConverterInMemory:
+    """Test cases for converting torrent data without a file"""
+    
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_convert_bytes(self, mock_torrent_file, mock_torrent_bytes, wrap):
+        """Test that in-memory data converts like the file it came from"""
+        converter = TorrentConverter()
+        expected = converter.convert(mock_torrent_file, include_trackers=True)
+        assert converter.convert_bytes(wrap(mock_torrent_bytes), include_trackers=True) == expected
+    
+    def test_convert_bytes_partial_view(self, mock_torrent_bytes):
+        """Test a memoryview over part of a larger buffer"""
+        buffer = b'junk' + mock_torrent_bytes + b'junk'
+        view = memoryview(buffer)[4:-4]
+        converter = TorrentConverter()
+        assert converter.convert_bytes(view) == converter.convert_bytes(mock_torrent_bytes)
+    
+    def test_convert_bytes_errors(self):
+        """Test invalid and non-bytes input"""
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="Unable to parse torrent file"):
+            converter.convert_bytes(b'not a torrent')
+        with pytest.raises(TypeError):
+            converter.convert_bytes("d4:infoe")
+    
+    def test_convert_stream(self, mock_torrent_file, mock_torrent_bytes):
+        """Test reading torrent data from a binary file object"""
+        converter = TorrentConverter()
+        expected = converter.convert(mock_torrent_file, include_trackers=True)
+        
+        stream = io.BytesIO(mock_torrent_bytes)
+        assert converter.convert_stream(stream, include_trackers=True) == expected
+        assert stream.read() == b''
+    
+    def test_convert_stream_errors(self, mock_torrent_bytes):
+        """Test empty, invalid, oversized and text streams"""
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="no data"):
+            converter.convert_stream(io.BytesIO(b''))
+        with pytest.raises(ValueError, match="not a bencoded dictionary"):
+            converter.convert_stream(io.BytesIO(b'l4:spame'))
+        with pytest.raises(IOError, match="exceeds maximum size"):
+            converter.convert_stream(io.BytesIO(mock_torrent_bytes), max_bytes=10)
+        with pytest.raises(TypeError):
+            converter.convert_stream(io.StringIO('d4:infoe'))
+    
+    def test_convert_stream_truncated(self, mock_torrent_bytes):
+        """Test that a stream ending before the top-level dictionary closes fails like convert_bytes"""
+        converter = TorrentConverter()
+        truncated = mock_torrent_bytes[:-1]
+        with pytest.raises(ValueError, match="Unexpected end of data"):
+            converter.convert_bytes(truncated)
+        with pytest.raises(ValueError, match="Unexpected end of data"):
+            converter.convert_stream(io.BytesIO(truncated))
+    
+    def test_torrent_to_magnet_in_memory(self, mock_torrent_file, mock_torrent_bytes):
+        """Test the convenience function with bytes and file objects"""
+        from magneto import torrent_to_magnet
+        
+        expected = torrent_to_magnet(mock_torrent_file)
+        assert torrent_to_magnet(mock_torrent_bytes) == expected
+        assert torrent_to_magnet(io.BytesIO(mock_torrent_bytes)) == expected
+
 
 @pytest.mark.unit
 class TestTorrentConverterDownload:
@@ -239,12 +555,9 @@ class TestTorrentConverterDownload:
         test_url = "http://example.com/file.torrent"
         
         # Mock urlopen to return torrent bytes
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             data = converter.download_torrent_file(test_url)
         
         assert isinstance(data, bytes)
@@ -256,12 +569,9 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/empty.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = b''
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(b'')
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             with pytest.raises(IOError, match="Downloaded file is empty"):
                 converter.download_torrent_file(test_url)
     
@@ -270,8 +580,7 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        from urllib.error import URLError
-        with patch('magneto.core.urllib.request.urlopen', side_effect=URLError("Connection failed")):
+        with patch('magneto.network.ConnectionPool.open', side_effect=ConnectionRefusedError("Connection failed")):
             with pytest.raises(IOError, match="Unable to download from URL"):
                 converter.download_torrent_file(test_url)
     
@@ -280,46 +589,42 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        import socket
-        with patch('magneto.core.urllib.request.urlopen', side_effect=socket.timeout("Timeout")):
-            with pytest.raises(IOError, match="Error downloading torrent file"):
+        with patch('magneto.network.ConnectionPool.open', side_effect=socket.timeout("Timeout")):
+            with pytest.raises(IOError, match="Unable to download from URL.*Timeout"):
                 converter.download_torrent_file(test_url, timeout=1)
     
+    def test_download_torrent_file_unexpected_error(self):
+        """Test download with an unexpected non-network error"""
+        converter = TorrentConverter()
+        test_url = "http://example.com/file.torrent"
+        
+        with patch('magneto.network.ConnectionPool.open', side_effect=RuntimeError("Boom")):
+            with pytest.raises(IOError, match="Error downloading torrent file"):
+                converter.download_torrent_file(test_url)
+    
     def test_download_torrent_file_user_agent(self, mock_torrent_bytes):
         """Test that User-Agent header is set"""
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response) as mock_urlopen:
-            with patch('magneto.core.urllib.request.Request') as mock_request:
-                mock_req_instance = MagicMock()
-                mock_request.return_value = mock_req_instance
-                
-                converter.download_torrent_file(test_url)
-                
-                # Verify Request was created with URL
-                mock_request.assert_called_once_with(test_url)
-                # Verify User-Agent header was added
-                mock_req_instance.add_header.assert_called_once()
-                call_args = mock_req_instance.add_header.call_args[0]
-                assert call_args[0] == 'User-Agent'
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response) as mock_open:
+            converter.download_torrent_file(test_url, timeout=5)
+        
+        mock_open.assert_called_once()
+        assert mock_open.call_args[0][0] == test_url
+        assert 'User-Agent' in mock_open.call_args[1]['headers']
+        assert mock_open.call_args[1]['timeout'] == 5
     
     def test_convert_from_url_success(self, mock_torrent_bytes, expected_info_hash):
         """Test successful conversion from URL"""
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             magnet_link, info_hash, metadata = converter.convert_from_url(test_url)
         
         assert isinstance(magnet_link, str)
@@ -337,12 +642,9 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             magnet_link, info_hash, metadata = converter.convert_from_url(
                 test_url,
                 include_trackers=True
@@ -356,12 +658,9 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             magnet_link, info_hash, metadata = converter.convert_from_url(
                 test_url,
                 include_trackers=False
@@ -374,8 +673,7 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/file.torrent"
         
-        from urllib.error import URLError
-        with patch('magneto.core.urllib.request.urlopen', side_effect=URLError("Connection failed")):
+        with patch('magneto.network.ConnectionPool.open', side_effect=ConnectionRefusedError("Connection failed")):
             with pytest.raises(IOError, match="Unable to download from URL"):
                 converter.convert_from_url(test_url)
     
@@ -384,12 +682,267 @@ class TestTorrentConverterDownload:
         converter = TorrentConverter()
         test_url = "http://example.com/invalid.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'Invalid torrent data'
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(b'Invalid torrent data')
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             with pytest.raises(ValueError, match="Unable to parse torrent file"):
                 converter.convert_from_url(test_url)
 
+
+
+@pytest.mark.integration
+class TestTorrentConverterConcurrentUrls:
+    """Test cases for concurrent URL conversion against a local HTTP server"""
+    
+    def test_convert_urls(self, torrent_http_server, expected_info_hash):
+        """Test that every URL is yielded as it completes, errors included"""
+        converter = TorrentConverter()
+        urls = [f"{torrent_http_server.base_url}/file_{i}.torrent" for i in range(8)]
+        urls.insert(3, f"{torrent_http_server.base_url}/missing.torrent")
+        completed = []
+        
+        results = list(converter.convert_urls(
+            urls,
+            concurrency=4,
+            on_result=lambda url, result: completed.append(url)
+        ))
+        
+        assert completed == [url for url, _ in results]
+        assert sorted(completed) == sorted(urls)
+        results = dict(results)
+        missing = results.pop(urls[3])
+        assert not missing.ok
+        assert "HTTP Error 404" in missing.error
+        assert missing.source_url == urls[3]
+        for url, result in results.items():
+            magnet_link, info_hash, metadata = result
+            assert info_hash == expected_info_hash
+            assert metadata['source_url'] == url
+    
+    def test_convert_urls_per_host_limit(self, torrent_http_server):
+        """Test that the per-host limit caps concurrent requests"""
+        torrent_http_server.delay = 0.05
+        converter = TorrentConverter()
+        urls = [f"{torrent_http_server.base_url}/file_{i}.torrent" for i in range(8)]
+        
+        results = list(converter.convert_urls(urls, concurrency=8, per_host=2))
+        
+        assert all(result.ok for _, result in results)
+        assert torrent_http_server.max_active <= 2
+    
+    def test_convert_urls_reuses_connections(self, torrent_http_server):
+        """Test that downloads share keep-alive connections to a host"""
+        converter = TorrentConverter()
+        urls = [f"{torrent_http_server.base_url}/file_{i % 8}.torrent" for i in range(20)]
+        
+        results = list(converter.convert_urls(urls, concurrency=2))
+        converter.close()
+        
+        assert all(result.ok for _, result in results)
+        assert torrent_http_server.connection_count <= 2
+    
+    def test_convert_urls_empty(self):
+        """Test converting an empty URL list"""
+        converter = TorrentConverter()
+        assert list(converter.convert_urls([])) == []
+    
+    def test_convert_urls_close_early(self, torrent_http_server):
+        """Test that closing the iterator cancels the downloads still queued"""
+        torrent_http_server.delay = 0.05
+        converter = TorrentConverter()
+        urls = [f"{torrent_http_server.base_url}/file_{i}.torrent" for i in range(8)]
+        
+        conversions = converter.convert_urls(urls, concurrency=1)
+        url, result = next(conversions)
+        conversions.close()
+        
+        assert result.ok
+        assert torrent_http_server.request_count < len(urls)
+    
+    def test_convert_from_url_reuses_connection(self, torrent_http_server, expected_info_hash):
+        """Test that sequential URL conversions share a keep-alive connection"""
+        with TorrentConverter() as converter:
+            for i in range(3):
+                _, info_hash, _ = converter.convert_from_url(
+                    f"{torrent_http_server.base_url}/file_{i}.torrent"
+                )
+                assert info_hash == expected_info_hash
+        
+        assert torrent_http_server.connection_count == 1
+
+
+@pytest.mark.unit
+class TestStreamingDownload:
+    """Test cases for streaming torrent downloads"""
+    
+    @staticmethod
+    def _torrent_with_trailer(mock_torrent_bytes):
+        """Mock torrent with a large key sorting after info"""
+        return mock_torrent_bytes[:-1] + b'8:url-list' + b'100000:' + b'x' * 100000 + b'e'
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1 << 20])
+    def test_scanner_hashes_info_incrementally(self, mock_torrent_bytes, expected_info_hash, chunk_size):
+        """Test that the info hash is the same however the data is split"""
+        scanner = _StreamScanner()
+        for i in range(0, len(mock_torrent_bytes), chunk_size):
+            scanner.feed(mock_torrent_bytes[i:i + chunk_size])
+        
+        assert scanner.closed
+        assert scanner.info_hash == expected_info_hash
+    
+    def test_scanner_complete_after_info(self, mock_torrent_bytes, expected_info_hash):
+        """Test that canonical torrents are complete once info is received"""
+        data = self._torrent_with_trailer(mock_torrent_bytes)
+        info_end = len(mock_torrent_bytes) - 1
+        scanner = _StreamScanner()
+        scanner.feed(data[:info_end - 1])
+        assert not scanner.info_complete
+        scanner.feed(data[info_end - 1:info_end + 10])
+        
+        assert scanner.info_complete
+        assert not scanner.closed
+        assert scanner.info_end == info_end
+        assert scanner.info_hash == expected_info_hash
+    
+    def test_scanner_non_canonical_waits_for_close(self):
+        """Test that unsorted keys require the whole dictionary"""
+        data = b'd4:infod4:name1:ae8:announce3:urle'
+        scanner = _StreamScanner()
+        scanner.feed(data[:-1])
+        assert scanner.info_end is not None
+        assert not scanner.info_complete
+        scanner.feed(data[-1:])
+        assert scanner.info_complete
+    
+    def test_scanner_rejects_html(self):
+        """Test that non-bencode content fails on the first chunk"""
+        scanner = _StreamScanner()
+        with pytest.raises(ValueError, match="not a bencoded dictionary"):
+            scanner.feed(b'<!DOCTYPE html>')
+    
+    def test_download_max_bytes(self, mock_torrent_bytes):
+        """Test that downloads larger than max_bytes are aborted"""
+        converter = TorrentConverter()
+        with patch('magneto.network.ConnectionPool.open', return_value=io.BytesIO(mock_torrent_bytes)):
+            with pytest.raises(IOError, match="exceeds maximum size"):
+                converter.download_torrent_file("http://example.com/file.torrent", max_bytes=10)
+    
+    def test_download_max_bytes_content_length(self, torrent_http_server):
+        """Test that an oversized Content-Length is rejected before reading"""
+        converter = TorrentConverter(max_download_bytes=10)
+        with pytest.raises(IOError, match="exceeds maximum size"):
+            converter.convert_from_url(f"{torrent_http_server.base_url}/file_0.torrent")
+    
+    def test_download_html_error_page(self, torrent_http_server):
+        """Test that an HTML page served with status 200 is rejected"""
+        torrent_http_server.routes['/page.torrent'] = b'<html><body>Not found</body></html>'
+        converter = TorrentConverter()
+        with pytest.raises(ValueError, match="Unable to parse torrent file"):
+            converter.convert_from_url(f"{torrent_http_server.base_url}/page.torrent")
+    
+    def test_convert_from_url_stops_after_info(self, torrent_http_server, mock_torrent_bytes, expected_info_hash):
+        """Test converting a torrent whose trailing keys are never read"""
+        data = self._torrent_with_trailer(mock_torrent_bytes)
+        torrent_http_server.routes['/big.torrent'] = data
+        converter = TorrentConverter()
+        magnet_link, info_hash, metadata = converter.convert_from_url(
+            f"{torrent_http_server.base_url}/big.torrent",
+            include_trackers=True
+        )
+        
+        assert info_hash == expected_info_hash
+        assert metadata['file_size'] == len(data)
+        assert len(metadata['trackers']) == 3
+        # The partially read connection must not be reused
+        assert converter.http.idle_count == 0
+    
+    def test_download_torrent_file_full_body(self, torrent_http_server, mock_torrent_bytes):
+        """Test that download_torrent_file still returns the whole file"""
+        data = self._torrent_with_trailer(mock_torrent_bytes)
+        torrent_http_server.routes['/big.torrent'] = data
+        converter = TorrentConverter()
+        assert converter.download_torrent_file(f"{torrent_http_server.base_url}/big.torrent") == data
+    
+    def test_convert_from_url_truncated(self, mock_torrent_bytes):
+        """Test converting a download that ends before the info value"""
+        converter = TorrentConverter()
+        truncated = io.BytesIO(mock_torrent_bytes[:40])
+        with patch('magneto.network.ConnectionPool.open', return_value=truncated):
+            with pytest.raises(ValueError, match="Unable to parse torrent file"):
+                converter.convert_from_url("http://example.com/file.torrent")
+
+
+@pytest.mark.integration
+class TestTorrentConverterAsync:
+    """Test cases for the asyncio conversion API"""
+    
+    def test_aconvert(self, mock_torrent_file, expected_info_hash):
+        """Test converting a file without blocking the event loop"""
+        converter = TorrentConverter()
+        magnet_link, info_hash, metadata = asyncio.run(converter.aconvert(mock_torrent_file))
+        assert (magnet_link, info_hash, metadata) == converter.convert(mock_torrent_file)
+        assert info_hash == expected_info_hash
+    
+    def test_aconvert_from_url(self, torrent_http_server, expected_info_hash):
+        """Test converting a URL over non-blocking sockets"""
+        converter = TorrentConverter()
+        url = f"{torrent_http_server.base_url}/file_0.torrent"
+        magnet_link, info_hash, metadata = asyncio.run(
+            converter.aconvert_from_url(url, include_trackers=True)
+        )
+        assert (magnet_link, info_hash, metadata) == converter.convert_from_url(url, include_trackers=True)
+        assert info_hash == expected_info_hash
+        assert metadata['source_url'] == url
+        # The synchronous connection pool is never created
+        converter = TorrentConverter()
+        asyncio.run(converter.aconvert_from_url(url))
+        assert converter._http is None
+    
+    def test_aconvert_from_url_errors(self, torrent_http_server):
+        """Test that download errors match the synchronous API"""
+        converter = TorrentConverter()
+        with pytest.raises(IOError, match="HTTP Error 404"):
+            asyncio.run(converter.aconvert_from_url(f"{torrent_http_server.base_url}/missing.torrent"))
+        torrent_http_server.routes['/page.torrent'] = b'<!DOCTYPE html>'
+        with pytest.raises(ValueError, match="Unable to parse torrent file from"):
+            asyncio.run(converter.aconvert_from_url(f"{torrent_http_server.base_url}/page.torrent"))
+    
+    def test_aconvert_many(self, torrent_http_server, sample_torrent_dir, tmp_path, expected_info_hash):
+        """Test that files and URLs are all yielded, errors included"""
+        torrent_http_server.delay = 0.05
+        urls = [f"{torrent_http_server.base_url}/file_{i}.torrent" for i in range(6)]
+        paths = sorted(sample_torrent_dir.glob('*.torrent'))
+        sources = urls + paths + [tmp_path / "missing.torrent"]
+        
+        async def collect():
+            return [item async for item in TorrentConverter().aconvert_many(sources, concurrency=3)]
+        
+        results = dict(asyncio.run(collect()))
+        assert set(results) == set(sources)
+        assert results[tmp_path / "missing.torrent"].error.startswith("Unable to read file")
+        for source in urls + paths:
+            assert results[source][1] == expected_info_hash
+        assert torrent_http_server.max_active <= 3
+    
+    def test_aconvert_many_completion_order(self, torrent_http_server, mock_torrent_file):
+        """Test that fast conversions are not held back by slow ones"""
+        torrent_http_server.delay = 0.2
+        sources = [f"{torrent_http_server.base_url}/file_0.torrent", mock_torrent_file]
+        
+        async def collect():
+            return [source async for source, _ in TorrentConverter().aconvert_many(sources)]
+        
+        assert asyncio.run(collect()) == [mock_torrent_file, sources[0]]
+    
+    def test_torrent_to_magnet_async(self, torrent_http_server, mock_torrent_file, mock_torrent_bytes):
+        """Test the asynchronous entry point with every kind of input"""
+        from magneto import torrent_to_magnet, torrent_to_magnet_async
+        
+        expected = torrent_to_magnet(mock_torrent_file)
+        assert asyncio.run(torrent_to_magnet_async(mock_torrent_file)) == expected
+        assert asyncio.run(torrent_to_magnet_async(mock_torrent_bytes)) == expected
+        assert asyncio.run(torrent_to_magnet_async(io.BytesIO(mock_torrent_bytes))) == expected
+        url = f"{torrent_http_server.base_url}/file_0.torrent"
+        _, info_hash, metadata = asyncio.run(torrent_to_magnet_async(url))
+        assert info_hash == expected[1]
+        assert metadata['source_url'] == url
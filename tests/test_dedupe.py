@@ -0,0 +1,81 @@
+"""
+Unit tests for duplicate detection module
+"""
+import io
+import json
+
+import pytest
+
+from magneto.dedupe import DuplicateFilter
+from magneto.result import ConversionResult
+from magneto.writers import create_writer
+
+
+HASH_A = "58356A62D3171B5D058E7A9CB8B2B6D944266E1F"
+HASH_B = "BB364EB8396DBFF02ED807ABCFCF428FEE5D5C59"
+
+
+@pytest.mark.unit
+class TestDuplicateFilter:
+    """Test cases for DuplicateFilter class"""
+    
+    def test_add(self):
+        """Test that only the first copy of an info hash is new"""
+        duplicates = DuplicateFilter(track_kept=True)
+        assert duplicates.add(HASH_A, "a.torrent", "A") is True
+        assert duplicates.add(HASH_B, "b.torrent", "B") is True
+        assert duplicates.add(HASH_A, "a2.torrent", "A") is False
+        assert duplicates.add(HASH_A.lower(), "a3.torrent", "A") is False
+        
+        assert len(duplicates) == 2
+        assert HASH_B in duplicates
+        assert duplicates.duplicate_count == 2
+        assert duplicates.group_count == 1
+        assert list(duplicates.groups()) == [(HASH_A, "A", "a.torrent", ["a2.torrent", "a3.torrent"])]
+    
+    def test_stores_digests(self):
+        """Test that info hashes are kept as 20-byte digests"""
+        duplicates = DuplicateFilter()
+        duplicates.add(HASH_A, "a.torrent")
+        assert duplicates._seen == {bytes.fromhex(HASH_A)}
+        assert duplicates._kept is None
+    
+    def test_kept_untracked(self):
+        """Test that groups report no kept path unless it is tracked"""
+        duplicates = DuplicateFilter()
+        duplicates.add(HASH_A, "a.torrent", "A")
+        duplicates.add(HASH_A, "a2.torrent", "A")
+        assert list(duplicates.groups()) == [(HASH_A, "A", None, ["a2.torrent"])]
+    
+    def test_write_report(self, tmp_path):
+        """Test writing duplicate groups as JSON Lines"""
+        duplicates = DuplicateFilter(track_kept=True)
+        for path in ("a.torrent", "a2.torrent", "b.torrent", "b2.torrent", "b3.torrent"):
+            duplicates.add(HASH_A if path.startswith("a") else HASH_B, path, path[0])
+        report = tmp_path / "duplicates.jsonl"
+        duplicates.write_report(report)
+        
+        records = [json.loads(line) for line in report.read_text(encoding='utf-8').splitlines()]
+        assert records == [
+            {"info_hash": HASH_A, "name": "a", "kept": "a.torrent", "duplicates": ["a2.torrent"]},
+            {"info_hash": HASH_B, "name": "b", "kept": "b.torrent", "duplicates": ["b2.torrent", "b3.torrent"]},
+        ]
+    
+    def test_write_report_error(self, tmp_path):
+        """Test that an unwritable report raises IOError"""
+        with pytest.raises(IOError, match="Unable to write duplicate report"):
+            DuplicateFilter().write_report(tmp_path / "missing" / "duplicates.jsonl")
+    
+    def test_writer_skips_duplicates(self):
+        """Test that a writer with a filter writes each info hash once, errors always"""
+        duplicates = DuplicateFilter()
+        stream = io.StringIO()
+        with create_writer('links_only', stream=stream, duplicates=duplicates) as writer:
+            writer.write("a.torrent", f"magnet:?xt=urn:btih:{HASH_A}", HASH_A, {})
+            writer.write_result("bad.torrent", ConversionResult.failed("Invalid file"))
+            writer.write("a2.torrent", f"magnet:?xt=urn:btih:{HASH_A}", HASH_A, {})
+            writer.write_result("bad2.torrent", ConversionResult.failed("Invalid file"))
+        
+        assert stream.getvalue().splitlines() == [f"magnet:?xt=urn:btih:{HASH_A}"]
+        assert writer.count == 3
+        assert duplicates.duplicate_count == 1
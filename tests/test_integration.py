@@ -1,8 +1,9 @@
 """
 Integration tests for the complete workflow
 """
+import io
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -88,8 +89,9 @@ class TestIntegration:
         converter = TorrentConverter()
         ui = UI(quiet=True)  # Quiet to avoid extra output
         
-        magnet_link, info_hash, metadata = converter.convert(mock_torrent_file)
-        results = [(str(mock_torrent_file), magnet_link, info_hash, metadata)]
+        result = converter.convert(mock_torrent_file)
+        magnet_link = result.magnet_link
+        results = [(str(mock_torrent_file), result)]
         
         ui.print_results(results, args.format)
         captured = capsys.readouterr()
@@ -106,8 +108,9 @@ class TestIntegration:
         converter = TorrentConverter()
         ui = UI(quiet=True)
         
-        magnet_link, info_hash, metadata = converter.convert(mock_torrent_file)
-        results = [(str(mock_torrent_file), magnet_link, info_hash, metadata)]
+        result = converter.convert(mock_torrent_file)
+        magnet_link = result.magnet_link
+        results = [(str(mock_torrent_file), result)]
         
         output_file = Path(args.output)
         ui.save_results(results, output_file, args.format)
@@ -123,12 +126,9 @@ class TestIntegration:
         test_url = "http://example.com/file.torrent"
         
         # Mock urlopen to return torrent bytes
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             # Parse arguments with URL
             args = ArgumentParser.parse_args([test_url])
             
@@ -157,12 +157,9 @@ class TestIntegration:
         """Test URL input workflow with trackers"""
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             args = ArgumentParser.parse_args([test_url, '--include-trackers'])
             
             converter = TorrentConverter()
@@ -178,12 +175,9 @@ class TestIntegration:
         """Test URL input workflow with stdout output"""
         test_url = "http://example.com/file.torrent"
         
-        mock_response = MagicMock()
-        mock_response.read.return_value = mock_torrent_bytes
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=None)
+        mock_response = io.BytesIO(mock_torrent_bytes)
         
-        with patch('magneto.core.urllib.request.urlopen', return_value=mock_response):
+        with patch('magneto.network.ConnectionPool.open', return_value=mock_response):
             args = ArgumentParser.parse_args([
                 test_url,
                 '--stdout',
@@ -193,8 +187,9 @@ class TestIntegration:
             converter = TorrentConverter()
             ui = UI(quiet=True)
             
-            magnet_link, info_hash, metadata = converter.convert_from_url(test_url)
-            results = [(test_url, magnet_link, info_hash, metadata)]
+            result = converter.convert_from_url(test_url)
+            magnet_link = result.magnet_link
+            results = [(test_url, result)]
             
             ui.print_results(results, args.format)
             captured = capsys.readouterr()
@@ -0,0 +1,105 @@
+"""
+Unit tests for pooled HTTP client module
+"""
+import pytest
+
+from magneto.network import ConnectionPool
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """Test cases for ConnectionPool class"""
+    
+    def test_reuses_connection(self, torrent_http_server, mock_torrent_bytes):
+        """Test that sequential requests to one host share a connection"""
+        pool = ConnectionPool()
+        for i in range(3):
+            with pool.open(f"{torrent_http_server.base_url}/file_{i}.torrent") as response:
+                assert response.read() == mock_torrent_bytes
+        pool.close()
+        
+        assert torrent_http_server.request_count == 3
+        assert torrent_http_server.connection_count == 1
+    
+    def test_partial_read_discards_connection(self, torrent_http_server):
+        """Test that a connection with unread body is not reused"""
+        pool = ConnectionPool()
+        with pool.open(f"{torrent_http_server.base_url}/file_0.torrent") as response:
+            response.read(5)
+        assert pool.idle_count == 0
+        pool.close()
+    
+    def test_idle_timeout_eviction(self, torrent_http_server):
+        """Test that idle connections older than the timeout are not reused"""
+        pool = ConnectionPool(idle_timeout=0)
+        for i in range(2):
+            with pool.open(f"{torrent_http_server.base_url}/file_{i}.torrent") as response:
+                response.read()
+        pool.close()
+        
+        assert torrent_http_server.connection_count == 2
+    
+    def test_max_size(self, torrent_http_server):
+        """Test that the pool keeps at most max_size idle connections"""
+        pool = ConnectionPool(max_size=1)
+        first = pool.open(f"{torrent_http_server.base_url}/file_0.torrent")
+        second = pool.open(f"{torrent_http_server.base_url}/file_1.torrent")
+        for response in (first, second):
+            response.read()
+            response.close()
+        
+        assert pool.idle_count == 1
+        pool.close()
+        assert pool.idle_count == 0
+    
+    def test_pool_disabled(self, torrent_http_server):
+        """Test that max_size=0 disables connection reuse"""
+        pool = ConnectionPool(max_size=0)
+        for i in range(2):
+            with pool.open(f"{torrent_http_server.base_url}/file_{i}.torrent") as response:
+                response.read()
+        
+        assert pool.idle_count == 0
+        assert torrent_http_server.connection_count == 2
+    
+    def test_follows_redirect(self, torrent_http_server, mock_torrent_bytes):
+        """Test that redirects are followed"""
+        torrent_http_server.redirects['/latest.torrent'] = '/file_0.torrent'
+        pool = ConnectionPool()
+        with pool.open(f"{torrent_http_server.base_url}/latest.torrent") as response:
+            assert response.read() == mock_torrent_bytes
+        pool.close()
+    
+    def test_redirect_loop(self, torrent_http_server):
+        """Test that redirect loops are cut off"""
+        torrent_http_server.redirects['/loop.torrent'] = '/loop.torrent'
+        pool = ConnectionPool(max_redirects=2)
+        with pytest.raises(IOError, match="Too many redirects"):
+            pool.open(f"{torrent_http_server.base_url}/loop.torrent")
+        pool.close()
+    
+    def test_http_error(self, torrent_http_server):
+        """Test that error statuses raise IOError"""
+        pool = ConnectionPool()
+        with pytest.raises(IOError, match="HTTP Error 404"):
+            pool.open(f"{torrent_http_server.base_url}/missing.torrent")
+        pool.close()
+    
+    def test_http_error_body_drained(self, torrent_http_server):
+        """Test that only short error pages are read to reuse their connection"""
+        torrent_http_server.errors['/small.torrent'] = (500, b'x' * 1024)
+        torrent_http_server.errors['/huge.torrent'] = (500, b'x' * (4 * 1024 * 1024))
+        pool = ConnectionPool()
+        with pytest.raises(IOError, match="HTTP Error 500"):
+            pool.open(f"{torrent_http_server.base_url}/small.torrent")
+        assert pool.idle_count == 1
+        with pytest.raises(IOError, match="HTTP Error 500"):
+            pool.open(f"{torrent_http_server.base_url}/huge.torrent")
+        assert pool.idle_count == 0
+        pool.close()
+    
+    def test_unsupported_url(self):
+        """Test that non-HTTP URLs are rejected"""
+        pool = ConnectionPool()
+        with pytest.raises(IOError, match="Unsupported URL"):
+            pool.open("ftp://example.com/file.torrent")
@@ -32,6 +32,11 @@ class TestArgumentParser:
         ])
         assert args.format == 'json'
     
+    def test_parse_args_with_jsonl_format(self, mock_torrent_file):
+        """Test parsing arguments with JSON Lines format"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file), '-f', 'jsonl'])
+        assert args.format == 'jsonl'
+    
     def test_parse_args_with_recursive(self, sample_torrent_dir):
         """Test parsing arguments with recursive option"""
         args = ArgumentParser.parse_args([
@@ -64,6 +69,217 @@ class TestArgumentParser:
         ])
         assert args.include_trackers is True
     
+    def test_parse_args_with_jobs(self, mock_torrent_file):
+        """Test parsing arguments with jobs option"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file)])
+        assert args.jobs == 1
+        args = ArgumentParser.parse_args([str(mock_torrent_file), '-j', '4'])
+        assert args.jobs == 4
+    
+    def test_parse_args_negative_jobs(self, mock_torrent_file):
+        """Test parsing arguments with a negative jobs value"""
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args([str(mock_torrent_file), '--jobs', '-1'])
+    
+    def test_parse_args_with_prefetch(self, mock_torrent_file):
+        """Test parsing arguments with prefetch options"""
+        args = ArgumentParser.parse_args([
+            str(mock_torrent_file),
+            '--prefetch', '64',
+            '--prefetch-memory', '16'
+        ])
+        assert args.prefetch == 64
+        assert args.prefetch_memory == 16
+    
+    def test_parse_args_invalid_prefetch_memory(self, mock_torrent_file):
+        """Test parsing arguments with a non-positive prefetch budget"""
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args([str(mock_torrent_file), '--prefetch-memory', '0'])
+    
+    def test_parse_args_multiple_urls(self):
+        """Test parsing several URL inputs"""
+        args = ArgumentParser.parse_args([
+            'http://example.com/a.torrent',
+            'http://example.com/b.torrent',
+            '--concurrency', '16',
+            '--per-host', '2'
+        ])
+        assert args.input == 'http://example.com/a.torrent'
+        assert args.urls == ['http://example.com/b.torrent']
+        assert args.concurrency == 16
+        assert args.per_host == 2
+    
+    def test_parse_args_multiple_inputs_not_urls(self, mock_torrent_file):
+        """Test that several inputs must all be URLs"""
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args([
+                'http://example.com/a.torrent',
+                str(mock_torrent_file)
+            ])
+    
+    def test_parse_args_url_file(self, tmp_path):
+        """Test parsing a URL list file without positional input"""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text("http://example.com/a.torrent\n")
+        args = ArgumentParser.parse_args(['--url-file', str(url_file)])
+        assert args.input is None
+        assert args.url_file == str(url_file)
+    
+    def test_parse_args_with_progress(self, mock_torrent_file):
+        """Test parsing progress display options"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file)])
+        assert args.progress == 'auto'
+        assert args.progress_rate == 4.0
+        args = ArgumentParser.parse_args([
+            str(mock_torrent_file), '--progress', 'line', '--progress-rate', '10'
+        ])
+        assert args.progress == 'line'
+        assert args.progress_rate == 10.0
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args([str(mock_torrent_file), '--progress-rate', '0'])
+    
+    def test_parse_args_with_sort(self, sample_torrent_dir):
+        """Test parsing arguments with sort option"""
+        args = ArgumentParser.parse_args([str(sample_torrent_dir)])
+        assert args.sort is False
+        args = ArgumentParser.parse_args([str(sample_torrent_dir), '--sort'])
+        assert args.sort is True
+    
+    def test_parse_args_with_timings(self, mock_torrent_file):
+        """Test parsing arguments with timings option"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file)])
+        assert args.timings is False
+        args = ArgumentParser.parse_args([str(mock_torrent_file), '--timings'])
+        assert args.timings is True
+    
+    def test_parse_args_with_cache(self, mock_torrent_file, tmp_path):
+        """Test parsing cache options"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file)])
+        assert args.cache is False
+        assert args.command is None
+        
+        cache_path = tmp_path / "cache.sqlite3"
+        args = ArgumentParser.parse_args([
+            str(mock_torrent_file),
+            '--cache',
+            '--cache-path', str(cache_path)
+        ])
+        assert args.cache is True
+        assert args.cache_path == str(cache_path)
+        
+        args = ArgumentParser.parse_args([str(mock_torrent_file), '--cache', '--no-cache'])
+        assert args.cache is False
+    
+    def test_parse_args_cache_command(self):
+        """Test parsing the cache maintenance command"""
+        args = ArgumentParser.parse_args(['cache', 'prune'])
+        assert args.command == 'cache'
+        assert args.action == 'prune'
+        assert args.cache_path is None
+        
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['cache', 'unknown'])
+    
+    def test_parse_args_serve_command(self):
+        """Test parsing the serve command and its validation"""
+        args = ArgumentParser.parse_args(['serve'])
+        assert args.command == 'serve'
+        assert args.host == '127.0.0.1'
+        assert args.port == 8080
+        assert args.workers == 8
+        
+        args = ArgumentParser.parse_args(['serve', '--port', '0', '--workers', '2', '-v'])
+        assert args.port == 0
+        assert args.workers == 2
+        assert args.verbose is True
+        
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['serve', '--port', '70000'])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['serve', '--workers', '0'])
+    
+    def test_parse_args_watch_command(self, tmp_path, mock_torrent_file):
+        """Test parsing the watch command and its validation"""
+        args = ArgumentParser.parse_args(['watch', str(tmp_path)])
+        assert args.command == 'watch'
+        assert args.format == 'jsonl'
+        assert args.settle == 1.0
+        assert args.polling is False
+        
+        args = ArgumentParser.parse_args([
+            'watch', str(tmp_path), '-r', '--existing', '--polling',
+            '--settle', '0', '--poll-interval', '0.5', '-f', 'links_only'
+        ])
+        assert args.recursive is True
+        assert args.existing is True
+        assert args.settle == 0
+        assert args.poll_interval == 0.5
+        assert args.format == 'links_only'
+        
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['watch', str(mock_torrent_file)])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['watch', str(tmp_path), '--settle', '-1'])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['watch', str(tmp_path), '--poll-interval', '0'])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['watch', str(tmp_path), '-f', 'json'])
+    
+    def test_parse_args_index_and_search_commands(self, sample_torrent_dir, tmp_path):
+        """Test parsing the index and search commands and their validation"""
+        args = ArgumentParser.parse_args(['index', str(sample_torrent_dir), '-r', '-j', '2'])
+        assert args.command == 'index'
+        assert args.recursive is True
+        assert args.jobs == 2
+        assert args.catalog is None
+        
+        args = ArgumentParser.parse_args(['search', 'ubuntu', 'server', '--catalog', 'c.db'])
+        assert args.command == 'search'
+        assert args.query == ['ubuntu', 'server']
+        assert args.limit == 20
+        assert args.format == 'full'
+        assert args.catalog == 'c.db'
+        
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['index', str(tmp_path / "missing")])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['search'])
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['search', 'x', '--limit', '0'])
+    
+    def test_parse_args_path_named_like_command(self, tmp_path, monkeypatch):
+        """Test that an existing path named like a command converts unless valid command arguments follow"""
+        (tmp_path / "cache").mkdir()
+        monkeypatch.chdir(tmp_path)
+        
+        args = ArgumentParser.parse_args(['cache', '-r'])
+        assert args.command is None
+        assert args.input == 'cache'
+        assert args.recursive is True
+        assert ArgumentParser.parse_args(['./cache']).command is None
+        assert ArgumentParser.parse_args(['cache', 'prune']).command == 'cache'
+        assert ArgumentParser.parse_args(['serve']).command == 'serve'
+    
+    def test_parse_args_batch(self, mock_torrent_file):
+        """Test that batch mode needs no input and accepts none"""
+        args = ArgumentParser.parse_args(['--batch', '--concurrency', '4'])
+        assert args.batch is True
+        assert args.input is None
+        assert args.concurrency == 4
+        
+        with pytest.raises(SystemExit):
+            ArgumentParser.parse_args(['--batch', str(mock_torrent_file)])
+    
+    def test_parse_args_dedupe(self, mock_torrent_file, tmp_path):
+        """Test parsing dedupe options"""
+        args = ArgumentParser.parse_args([str(mock_torrent_file)])
+        assert args.dedupe is False
+        
+        report = tmp_path / "duplicates.jsonl"
+        args = ArgumentParser.parse_args([str(mock_torrent_file), '--dedupe-report', str(report)])
+        assert args.dedupe is True
+        assert args.dedupe_report == str(report)
+    
     def test_parse_args_with_stdout(self, mock_torrent_file):
         """Test parsing arguments with stdout option"""
         args = ArgumentParser.parse_args([
@@ -91,6 +307,11 @@ class TestArgumentParser:
         with pytest.raises(SystemExit):
             ArgumentParser.parse_args(['/nonexistent/path'])
     
+    def test_parse_args_stdin(self):
+        """Test parsing arguments with - for stdin"""
+        args = ArgumentParser.parse_args(['-', '--stdout'])
+        assert args.input == '-'
+    
     def test_parse_args_invalid_format(self, mock_torrent_file):
         """Test parsing arguments with invalid format"""
         with pytest.raises(SystemExit):
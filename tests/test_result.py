@@ -0,0 +1,74 @@
+"""
+Unit tests for the conversion result module
+"""
+import pickle
+
+import pytest
+
+from magneto.core import TorrentConverter
+from magneto.result import ConversionResult, ConversionStatus
+
+
+DIGEST = bytes(range(20))
+HEX = DIGEST.hex().upper()
+
+
+@pytest.mark.unit
+class TestConversionResult:
+    """Test cases for ConversionResult class"""
+    
+    def test_hash_encodings(self):
+        """Test the hexadecimal and base32 forms of the digest"""
+        result = ConversionResult("magnet:?xt=urn:btih:" + HEX, DIGEST)
+        assert result.info_hash == HEX
+        assert result.info_hash_base32 == 'AAAQEAYEAUDAOCAJBIFQYDIOB4IBCEQT'
+        assert result.ok
+        assert result.status is ConversionStatus.OK
+    
+    def test_tuple_unpacking(self):
+        """Test that a result unpacks and indexes like (magnet_link, info_hash, metadata)"""
+        result = ConversionResult("magnet:x", DIGEST, "Name", ["udp://t"], 42, "http://a/b.torrent")
+        magnet_link, info_hash, metadata = result
+        assert magnet_link == "magnet:x"
+        assert info_hash == HEX
+        assert metadata == {
+            'name': "Name",
+            'trackers': ["udp://t"],
+            'info_hash': HEX,
+            'file_size': 42,
+            'source_url': "http://a/b.torrent",
+        }
+        assert len(result) == 3
+        assert result[2]['file_size'] == 42
+        assert result == (magnet_link, info_hash, metadata)
+    
+    def test_compact(self):
+        """Test that results keep no per-instance dictionary"""
+        result = ConversionResult("magnet:x", DIGEST)
+        assert not hasattr(result, '__dict__')
+        assert result.trackers == ()
+        with pytest.raises(AttributeError):
+            result.extra = 1
+    
+    def test_failed(self):
+        """Test the result of a failed conversion"""
+        result = ConversionResult.failed(ValueError("bad data"))
+        assert not result.ok
+        assert result.status is ConversionStatus.ERROR
+        assert result.error == "bad data"
+        assert result.info_hash == ''
+    
+    def test_equality_and_pickle(self):
+        """Test comparing results and sending them between processes"""
+        result = ConversionResult("magnet:x", DIGEST, "Name", ("udp://t",), 42)
+        copy = pickle.loads(pickle.dumps(result))
+        assert copy == result
+        assert copy != ConversionResult("magnet:x", DIGEST, "Other", ("udp://t",), 42)
+    
+    def test_returned_by_converter(self, mock_torrent_file, expected_info_hash):
+        """Test that the converter returns results carrying the raw digest"""
+        result = TorrentConverter().convert(mock_torrent_file, include_trackers=True)
+        assert isinstance(result, ConversionResult)
+        assert result.digest == bytes.fromhex(expected_info_hash)
+        assert isinstance(result.trackers, tuple)
+        assert result.metadata['trackers'] == list(result.trackers)
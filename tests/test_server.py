@@ -0,0 +1,192 @@
+"""
+Unit tests for the HTTP conversion service
+"""
+import http.client
+import json
+import threading
+
+import pytest
+
+from magneto.server import ConversionServer, ServerMetrics, _parse_multipart
+
+
+BOUNDARY = 'magnetoBoundary'
+
+
+def multipart_body(files):
+    """Encode (filename, data) pairs as a multipart/form-data body"""
+    parts = []
+    for index, (filename, data) in enumerate(files):
+        parts.append(
+            f'--{BOUNDARY}\r\n'
+            f'Content-Disposition: form-data; name="file{index}"; filename="{filename}"\r\n'
+            f'Content-Type: application/x-bittorrent\r\n\r\n'.encode('utf-8')
+            + data + b'\r\n'
+        )
+    parts.append(f'--{BOUNDARY}--\r\n'.encode('utf-8'))
+    return b''.join(parts)
+
+
+@pytest.fixture
+def conversion_server():
+    """Start a conversion server on a free local port"""
+    server = ConversionServer(('127.0.0.1', 0), workers=2)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.05},
+        daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def connection(conversion_server):
+    """Keep-alive client connection to the conversion server"""
+    host, port = conversion_server.server_address[:2]
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    yield conn
+    conn.close()
+
+
+def request(conn, method, path, body=None, headers=None):
+    """Send a request and return (status, headers, body)"""
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    return response.status, response.headers, response.read()
+
+
+@pytest.mark.unit
+class TestConversionServer:
+    """Test cases for ConversionServer"""
+    
+    def test_convert_single(self, connection, mock_torrent_bytes, expected_info_hash):
+        """Test converting a raw torrent body"""
+        status, headers, body = request(connection, 'POST', '/convert', mock_torrent_bytes)
+        assert status == 200
+        assert headers['Content-Type'].startswith('application/json')
+        result = json.loads(body)
+        assert result['status'] == 'ok'
+        assert result['info_hash'] == expected_info_hash
+        assert result['magnet'].startswith(f"magnet:?xt=urn:btih:{expected_info_hash}")
+        assert '&tr=' not in result['magnet']
+    
+    def test_convert_with_trackers(self, connection, mock_torrent_bytes):
+        """Test that trackers=1 includes trackers in the result"""
+        status, _, body = request(connection, 'POST', '/convert?trackers=1', mock_torrent_bytes)
+        assert status == 200
+        result = json.loads(body)
+        assert result['trackers']
+        assert '&tr=' in result['magnet']
+    
+    def test_convert_invalid(self, connection):
+        """Test that an unparsable body is reported as 422"""
+        status, _, body = request(connection, 'POST', '/convert', b'not a torrent')
+        assert status == 422
+        result = json.loads(body)
+        assert result['status'] == 'error'
+        assert 'Unable to parse torrent file' in result['error']
+    
+    def test_convert_multipart(self, connection, mock_torrent_bytes, expected_info_hash):
+        """Test converting a multipart batch with a broken file"""
+        body = multipart_body([('a.torrent', mock_torrent_bytes), ('b.torrent', b'garbage')])
+        status, _, response = request(connection, 'POST', '/convert', body, {
+            'Content-Type': f'multipart/form-data; boundary={BOUNDARY}',
+        })
+        assert status == 200
+        results = json.loads(response)['results']
+        assert [result['file'] for result in results] == ['a.torrent', 'b.torrent']
+        assert results[0]['info_hash'] == expected_info_hash
+        assert results[1]['status'] == 'error'
+    
+    def test_keep_alive(self, conversion_server, connection, mock_torrent_bytes):
+        """Test that one connection serves several requests"""
+        for _ in range(3):
+            status, _, _ = request(connection, 'POST', '/convert', mock_torrent_bytes)
+            assert status == 200
+        status, _, body = request(connection, 'GET', '/health')
+        assert status == 200
+        assert json.loads(body) == {'status': 'ok'}
+        assert conversion_server.metrics.requests('/convert', 200) == 3
+    
+    def test_length_required(self, connection):
+        """Test that a body without Content-Length is refused"""
+        connection.putrequest('POST', '/convert')
+        connection.putheader('Transfer-Encoding', 'chunked')
+        connection.endheaders()
+        connection.send(b'0\r\n\r\n')
+        response = connection.getresponse()
+        response.read()
+        assert response.status == 411
+    
+    def test_body_too_large(self, conversion_server, connection):
+        """Test that bodies over the limit are refused"""
+        conversion_server.max_body = 16
+        status, _, _ = request(connection, 'POST', '/convert', b'x' * 32)
+        assert status == 413
+    
+    def test_not_found(self, connection):
+        """Test unknown paths"""
+        status, _, _ = request(connection, 'GET', '/unknown')
+        assert status == 404
+    
+    def test_metrics(self, connection, mock_torrent_bytes):
+        """Test that /metrics reports request counts and latency histograms"""
+        request(connection, 'POST', '/convert', mock_torrent_bytes)
+        request(connection, 'POST', '/convert', b'broken')
+        status, headers, body = request(connection, 'GET', '/metrics')
+        assert status == 200
+        assert headers['Content-Type'].startswith('text/plain')
+        text = body.decode('utf-8')
+        assert 'magneto_requests_total{path="/convert",status="200"} 1' in text
+        assert 'magneto_requests_total{path="/convert",status="422"} 1' in text
+        assert 'magneto_request_duration_seconds_bucket{path="/convert",le="+Inf"} 2' in text
+        assert 'magneto_conversions_total{status="ok"} 1' in text
+    
+    def test_idle_connections_free_workers(self, conversion_server, mock_torrent_bytes):
+        """Test that idle keep-alive connections are closed when connections wait for a worker"""
+        host, port = conversion_server.server_address[:2]
+        idle = [http.client.HTTPConnection(host, port, timeout=5) for _ in range(2)]
+        waiting = http.client.HTTPConnection(host, port, timeout=5)
+        try:
+            # Both workers now hold an idle keep-alive connection
+            for conn in idle:
+                assert request(conn, 'GET', '/health')[0] == 200
+            status, _, _ = request(waiting, 'POST', '/convert', mock_torrent_bytes)
+            assert status == 200
+        finally:
+            for conn in (*idle, waiting):
+                conn.close()
+    
+    def test_shared_converter(self, conversion_server):
+        """Test that the server keeps one converter and closes it on shutdown"""
+        assert conversion_server.converter is conversion_server.converter
+
+
+@pytest.mark.unit
+class TestServerHelpers:
+    """Test cases for multipart parsing and metrics"""
+    
+    def test_parse_multipart(self):
+        """Test splitting a multipart body into files"""
+        body = multipart_body([('one.torrent', b'd1:ae'), ('two.torrent', b'\r\n--x\r\n')])
+        parts = _parse_multipart(body, BOUNDARY.encode('ascii'))
+        assert parts == [('one.torrent', b'd1:ae'), ('two.torrent', b'\r\n--x\r\n')]
+    
+    def test_parse_multipart_invalid(self):
+        """Test that a body without the boundary is rejected"""
+        with pytest.raises(ValueError):
+            _parse_multipart(b'no parts here', b'boundary')
+    
+    def test_metrics_histogram(self):
+        """Test that latencies land in cumulative buckets"""
+        metrics = ServerMetrics()
+        metrics.record('/convert', 200, 0.002)
+        metrics.record('/convert', 200, 3.0)
+        text = metrics.render()
+        assert 'magneto_request_duration_seconds_bucket{path="/convert",le="0.0025"} 1' in text
+        assert 'magneto_request_duration_seconds_bucket{path="/convert",le="5.0"} 2' in text
+        assert 'magneto_request_duration_seconds_count{path="/convert"} 2' in text
+        assert metrics.requests('/convert') == 2
@@ -0,0 +1,107 @@
+"""
+Startup tests - Import cost of the package and the CLI
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must not be loaded just to start the CLI on local files
+DEFERRED_MODULES = (
+    'asyncio',
+    'colorama',
+    'concurrent.futures',
+    'email',
+    'http.client',
+    'json',
+    'magneto.cache',
+    'magneto.network',
+    'magneto.stats',
+    'sqlite3',
+    'ssl',
+    'tempfile',
+    'urllib.request',
+)
+
+# Standard library modules the CLI builds on, imported first as the reference
+REFERENCE_MODULES = ('argparse', 'hashlib', 'pathlib', 'typing', 'urllib.parse')
+
+# Import time of magneto.main on top of the reference modules, as a multiple
+# of the import time of the reference modules themselves
+IMPORT_BUDGET_RATIO = 1.0
+
+
+def import_times(module: str, preload: tuple = ()) -> dict:
+    """
+    Import a module in a fresh interpreter with -X importtime
+    
+    Args:
+        module: Module to import
+        preload: Modules imported before it
+    
+    Returns:
+        Dictionary mapping each imported module to its cumulative import
+        time in microseconds
+    """
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', '; '.join(f'import {name}' for name in (*preload, module))],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            times[fields[2].strip()] = int(fields[1])
+    return times
+
+
+@pytest.mark.unit
+class TestStartup:
+    """Test cases for lazy imports at startup"""
+    
+    def test_cli_defers_heavy_modules(self):
+        """Test that starting the CLI does not load the network stack, SQLite, JSON or colorama"""
+        loaded = [
+            name for name in import_times('magneto.main')
+            if any(name == module or name.startswith(module + '.') for module in DEFERRED_MODULES)
+        ]
+        assert loaded == []
+    
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not load the converter"""
+        assert 'magneto.core' not in import_times('magneto')
+    
+    @pytest.mark.skipif(
+        bool(os.environ.get('MAGNETO_SKIP_IMPORT_BUDGET')),
+        reason="MAGNETO_SKIP_IMPORT_BUDGET is set"
+    )
+    def test_import_budget(self):
+        """Test that the CLI imports in no more time than the standard library modules it builds on"""
+        import_times('magneto.main')  # write bytecode caches first
+        ratios = []
+        for _ in range(3):
+            times = import_times('magneto.main', preload=REFERENCE_MODULES)
+            reference = sum(times[name] for name in REFERENCE_MODULES)
+            ratios.append(times['magneto.main'] / reference)
+        assert min(ratios) <= IMPORT_BUDGET_RATIO
+    
+    def test_lazy_attributes(self):
+        """Test that public names resolve to their submodule objects"""
+        import magneto
+        from magneto.core import TorrentConverter
+        
+        assert magneto.TorrentConverter is TorrentConverter
+        assert 'UI' in dir(magneto)
+        with pytest.raises(AttributeError):
+            magneto.missing_attribute
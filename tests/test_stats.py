@@ -0,0 +1,113 @@
+"""
+Unit tests for timing statistics module
+"""
+import pickle
+
+import pytest
+
+from magneto.core import TorrentConverter
+from magneto.stats import ConversionStats, StageStats
+
+
+@pytest.mark.unit
+class TestConversionStats:
+    """Test cases for ConversionStats class"""
+    
+    def test_stage_summary(self):
+        """Test mean and nearest-rank percentiles of a stage"""
+        stage = StageStats('parse')
+        for value in range(1, 101):
+            stage.add(value / 1000)
+        
+        summary = stage.summary()
+        assert summary['count'] == 100
+        assert summary['mean'] == pytest.approx(0.0505)
+        assert summary['p50'] == pytest.approx(0.050)
+        assert summary['p95'] == pytest.approx(0.095)
+        assert summary['p99'] == pytest.approx(0.099)
+        assert summary['max'] == pytest.approx(0.100)
+    
+    def test_empty_stage(self):
+        """Test summary of a stage without samples"""
+        assert StageStats('read').summary()['p99'] == 0.0
+    
+    def test_slowest_files(self):
+        """Test that only the slowest files are kept, slowest first"""
+        stats = ConversionStats(slowest=2)
+        for name, seconds in [('a', 0.1), ('b', 0.3), ('c', 0.2)]:
+            stats.add_file(name, seconds)
+        
+        assert stats.slowest == [('b', 0.3), ('c', 0.2)]
+        assert stats.get('total').count == 3
+    
+    def test_merge(self):
+        """Test combining statistics of two instances"""
+        first, second = ConversionStats(), ConversionStats()
+        first.add('read', 0.1)
+        second.add('read', 0.3)
+        second.add_file('x', 0.5)
+        first.merge(second)
+        
+        assert first.get('read').count == 2
+        assert first.get('read').total == pytest.approx(0.4)
+        assert first.slowest == [('x', 0.5)]
+    
+    def test_pickle(self):
+        """Test that statistics survive pickling (worker processes)"""
+        stats = ConversionStats()
+        stats.add_file('x', 0.5)
+        restored = pickle.loads(pickle.dumps(stats))
+        restored.add('parse', 0.1)
+        assert restored.slowest == [('x', 0.5)]
+    
+    def test_report_order(self):
+        """Test that stages are summarized in pipeline order"""
+        stats = ConversionStats()
+        for stage in ('total', 'custom', 'parse', 'read'):
+            stats.add(stage, 0.001)
+        
+        assert list(stats.summary()) == ['read', 'parse', 'total', 'custom']
+        report = stats.format_report()
+        assert report[0].split()[0] == 'Stage'
+        assert report[1].split()[0] == 'read'
+
+
+@pytest.mark.unit
+class TestTorrentConverterTimings:
+    """Test cases for TorrentConverter timing instrumentation"""
+    
+    def test_disabled_by_default(self):
+        """Test that no statistics are collected unless requested"""
+        assert TorrentConverter().stats is None
+    
+    def test_convert_records_stages(self, mock_torrent_file):
+        """Test that a single conversion records every stage"""
+        converter = TorrentConverter(timings=True)
+        converter.convert(mock_torrent_file)
+        
+        for stage in ('read', 'parse', 'info_hash', 'magnet', 'total'):
+            assert converter.stats.get(stage).count == 1
+        assert converter.stats.slowest[0][0] == str(mock_torrent_file)
+    
+    def test_hashing_recorded_as_info_hash(self):
+        """Test that hashing done while parsing is reported as the info_hash stage"""
+        converter = TorrentConverter(timings=True)
+        pieces = b'\x00' * (4 * 1024 * 1024)
+        data = b'd4:infod4:name4:test6:pieces' + str(len(pieces)).encode() + b':' + pieces + b'ee'
+        converter.convert_bytes(data)
+        
+        stats = converter.stats
+        assert stats.get('info_hash').total > stats.get('parse').total
+    
+    @pytest.mark.parametrize("options", [{}, {'prefetch': 2}, {'jobs': 2, 'chunksize': 2}])
+    def test_convert_many_records_stages(self, sample_torrent_dir, mock_torrent_file_invalid, options):
+        """Test that batch conversion records one total per converted file"""
+        converter = TorrentConverter(timings=True)
+        paths = sorted(sample_torrent_dir.glob('*.torrent')) + [mock_torrent_file_invalid]
+        list(converter.convert_many(paths, **options))
+        
+        stats = converter.stats
+        assert stats.get('total').count == len(paths) - 1
+        assert stats.get('read').count >= len(paths) - 1
+        assert stats.get('parse').count >= len(paths) - 1
+        assert len(stats.slowest) == len(paths) - 1
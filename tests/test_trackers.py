@@ -0,0 +1,88 @@
+"""
+Unit tests for the tracker registry
+"""
+import threading
+
+import pytest
+
+from magneto.core import TorrentConverter
+from magneto.trackers import TrackerRegistry
+
+
+TRACKER = 'udp://tracker.example.org:1337/announce'
+
+
+@pytest.mark.unit
+class TestTrackerRegistry:
+    """Test cases for TrackerRegistry class"""
+    
+    def test_intern_shares_instances(self):
+        """Test that equal trackers come back as one shared string"""
+        registry = TrackerRegistry()
+        first = registry.intern(''.join(TRACKER))
+        second = registry.intern(''.join(list(TRACKER)))
+        assert first == TRACKER
+        assert first is second
+    
+    def test_intern_normalizes(self):
+        """Test that bytes are decoded and whitespace and empty trackers dropped"""
+        registry = TrackerRegistry()
+        assert registry.intern(f"  {TRACKER}\n") == TRACKER
+        assert registry.intern(TRACKER.encode() + b'\xff') == TRACKER
+        assert registry.intern('   ') is None
+    
+    def test_encode(self):
+        """Test percent-encoding for magnet links"""
+        registry = TrackerRegistry()
+        assert registry.encode('http://t.example/a?x=1&y=2') == 'http%3A%2F%2Ft.example%2Fa%3Fx%3D1%26y%3D2'
+    
+    def test_bounded(self):
+        """Test that only the most recently used trackers are kept"""
+        registry = TrackerRegistry(max_size=3)
+        for index in range(10):
+            registry.intern(f"udp://t{index}")
+        assert len(registry) == 3
+        assert registry.encode("udp://t9") == 'udp%3A%2F%2Ft9'
+    
+    def test_threads(self):
+        """Test sharing one registry between threads"""
+        registry = TrackerRegistry(max_size=8)
+        errors = []
+        
+        def work():
+            try:
+                for index in range(2000):
+                    assert registry.intern(f"udp://t{index % 20}") == f"udp://t{index % 20}"
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(registry) <= 8
+
+
+@pytest.mark.unit
+class TestConverterTrackers:
+    """Test cases for tracker handling in TorrentConverter"""
+    
+    def test_get_trackers_dedupes_in_order(self):
+        """Test that duplicate trackers are dropped and first occurrences kept in order"""
+        converter = TorrentConverter()
+        torrent_data = {
+            'announce': 'udp://a',
+            'announce-list': [['udp://b', 'udp://a'], ['udp://c', 'udp://b'], b'udp://d', ['', 'udp://c']],
+        }
+        assert converter.get_trackers(torrent_data) == ['udp://a', 'udp://b', 'udp://c', 'udp://d']
+    
+    def test_trackers_shared_across_torrents(self, mock_torrent_file):
+        """Test that results of one converter share tracker strings"""
+        converter = TorrentConverter()
+        first = converter.convert(mock_torrent_file, include_trackers=True)
+        second = converter.convert_bytes(mock_torrent_file.read_bytes(), include_trackers=True)
+        assert first.trackers == second.trackers
+        assert all(a is b for a, b in zip(first.trackers, second.trackers))
+        assert first.magnet_link == second.magnet_link
@@ -2,11 +2,14 @@
 Unit tests for UI module
 """
 
+import io
 import json
+import sys
 
 import pytest
 
-from magneto.ui import UI
+from magneto.result import ConversionResult
+from magneto.ui import Fore, ProgressLine, Style, UI
 
 
 @pytest.mark.unit
@@ -36,6 +39,17 @@ class TestUI:
         ui = UI(use_colors=False)
         assert ui.use_colors is False
 
+    def test_colors_only_on_terminals(self):
+        """Test that colors are only added for terminal streams"""
+        ui = UI()
+        terminal = io.StringIO()
+        terminal.isatty = lambda: True
+
+        assert ui._colorize("text", Fore.GREEN, io.StringIO()) == "text"
+        if sys.platform != 'win32':
+            assert ui._colorize("text", Fore.GREEN, terminal) == f"{Fore.GREEN}text{Style.RESET_ALL}"
+        assert UI(use_colors=False)._colorize("text", Fore.GREEN, terminal) == "text"
+
     def test_print_success(self, capsys):
         """Test printing success message"""
         ui = UI()
@@ -110,6 +124,21 @@ class TestUI:
         assert "test.torrent" in captured.out
         assert "1/10" in captured.out
 
+    def test_print_progress_unknown_total(self, capsys):
+        """Test printing progress while the total is still unknown"""
+        ui = UI()
+        ui.print_progress(3, None, "test.torrent")
+        captured = capsys.readouterr()
+        assert "[3] test.torrent" in captured.out
+
+    def test_message_stream(self, capsys):
+        """Test that status messages can be sent to another stream"""
+        ui = UI(use_colors=False, stream=sys.stderr)
+        ui.print_info("status")
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "status" in captured.err
+
     def test_print_summary(self, capsys):
         """Test printing summary"""
         ui = UI()
@@ -122,6 +151,19 @@ class TestUI:
         assert "2" in captured.out  # success count
         assert "1" in captured.out  # error count
 
+    def test_print_duplicates_verbose(self):
+        """Test that each duplicate group lists the kept copy before the skipped ones"""
+        from magneto.dedupe import DuplicateFilter
+
+        duplicates = DuplicateFilter(track_kept=True)
+        duplicates.add("AB" * 20, "a.torrent", "A")
+        duplicates.add("AB" * 20, "a2.torrent", "A")
+        stream = io.StringIO()
+        ui = UI(verbose=True, use_colors=False, stream=stream)
+        ui.print_duplicates(duplicates)
+        lines = stream.getvalue().splitlines()
+        assert lines[1:] == [f"  {'AB' * 20} A", "    a.torrent (kept)", "    a2.torrent"]
+
     def test_save_results_full_format(self, tmp_path):
         """Test saving results in full format"""
         ui = UI()
@@ -218,3 +260,185 @@ class TestUI:
         output = json.loads(captured.out)
         assert isinstance(output, list)
         assert output[0]["magnet"] == "magnet:?xt=urn:btih:ABC123"
+
+    def test_save_result_pairs_full_format(self, tmp_path):
+        """Test saving (path, result) pairs in full format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"), "Test")),
+            ("file2.torrent", ConversionResult("magnet:?xt=urn:btih:DEF456", bytes.fromhex("DEF456"))),
+        ]
+        output_file = tmp_path / "output.txt"
+        ui.save_results(results, output_file, "full")
+
+        assert output_file.exists()
+        content = output_file.read_text()
+        assert "Torrent to Magnet Link Conversion Results" in content
+        assert "file1.torrent" in content
+        assert "magnet:?xt=urn:btih:ABC123" in content
+
+    def test_save_result_pairs_links_only_format(self, tmp_path):
+        """Test saving (path, result) pairs in links_only format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"))),
+            ("file2.torrent", ConversionResult("magnet:?xt=urn:btih:DEF456", bytes.fromhex("DEF456"))),
+        ]
+        output_file = tmp_path / "output.txt"
+        ui.save_results(results, output_file, "links_only")
+
+        assert output_file.exists()
+        content = output_file.read_text()
+        assert "magnet:?xt=urn:btih:ABC123" in content
+        assert "magnet:?xt=urn:btih:DEF456" in content
+        assert "file1.torrent" not in content
+
+    def test_save_result_pairs_json_format(self, tmp_path):
+        """Test saving (path, result) pairs in JSON format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"), "Test")),
+        ]
+        output_file = tmp_path / "output.json"
+        ui.save_results(results, output_file, "json")
+
+        assert output_file.exists()
+        content = json.loads(output_file.read_text())
+        assert isinstance(content, list)
+        assert len(content) == 1
+        assert content[0]["magnet"] == "magnet:?xt=urn:btih:ABC123"
+
+    def test_save_result_pairs_with_errors(self, tmp_path):
+        """Test saving (path, result) pairs that include errors"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"))),
+            ("file2.torrent", ConversionResult.failed("Invalid file")),
+        ]
+        output_file = tmp_path / "output.txt"
+        ui.save_results(results, output_file, "links_only")
+
+        content = output_file.read_text()
+        assert "magnet:?xt=urn:btih:ABC123" in content
+        assert "Invalid file" not in content  # Errors should be filtered
+
+    def test_print_result_pairs_full_format(self, capsys):
+        """Test printing (path, result) pairs in full format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"), "Test")),
+        ]
+        ui.print_results(results, "full")
+        captured = capsys.readouterr()
+        assert "Torrent to Magnet Link Conversion Results" in captured.out
+        assert "magnet:?xt=urn:btih:ABC123" in captured.out
+
+    def test_print_result_pairs_links_only_format(self, capsys):
+        """Test printing (path, result) pairs in links_only format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"))),
+            ("file2.torrent", ConversionResult("magnet:?xt=urn:btih:DEF456", bytes.fromhex("DEF456"))),
+        ]
+        ui.print_results(results, "links_only")
+        captured = capsys.readouterr()
+        assert "magnet:?xt=urn:btih:ABC123" in captured.out
+        assert "magnet:?xt=urn:btih:DEF456" in captured.out
+        assert "file1.torrent" not in captured.out
+
+    def test_print_result_pairs_json_format(self, capsys):
+        """Test printing (path, result) pairs in JSON format"""
+        ui = UI()
+        results = [
+            ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"), "Test")),
+        ]
+        ui.print_results(results, "json")
+        captured = capsys.readouterr()
+        output = json.loads(captured.out)
+        assert isinstance(output, list)
+        assert output[0]["magnet"] == "magnet:?xt=urn:btih:ABC123"
+
+    def test_progress_line_summary(self, capsys):
+        """Test that finished files are tallied on the progress line"""
+        ui = UI(use_colors=False)
+        ui.start_progress(total=3)
+        ui.advance_progress(1024 * 1024)
+        ui.advance_progress(error="bad.torrent: broken")
+        ui.advance_progress(1024 * 1024)
+        ui.print_summary()
+        captured = capsys.readouterr()
+
+        assert ui.success_count == 2
+        assert ui.error_count == 1
+        assert "bad.torrent: broken" in captured.err
+        assert "Progress: [3/3] 100.0%" in captured.out
+        assert "1 error(s)" in captured.out
+        assert "Success: 2" in captured.out
+
+    def test_progress_line_quiet(self, capsys):
+        """Test that quiet mode has no progress display"""
+        ui = UI(quiet=True)
+        ui.start_progress(total=1)
+        ui.advance_progress(10)
+        ui.finish_progress()
+        assert ui.progress is None
+        assert ui.success_count == 1
+        assert capsys.readouterr().out == ""
+
+
+@pytest.mark.unit
+class TestProgressLine:
+    """Test cases for ProgressLine class"""
+
+    def test_status_with_total(self):
+        """Test status text with a known total"""
+        progress = ProgressLine(io.StringIO(), total=4, tty=False)
+        progress.update(2 * 1024 * 1024)
+        status = progress.status()
+        assert status.startswith("[1/4] 25.0%")
+        assert "files/s" in status
+        assert "MB/s" in status
+        assert "ETA " in status
+
+    def test_status_unknown_total(self):
+        """Test status text while the total is unknown"""
+        progress = ProgressLine(io.StringIO(), tty=False)
+        progress.update(error=True)
+        status = progress.status()
+        assert status.startswith("[1] |")
+        assert "1 error(s)" in status
+        assert "ETA" not in status
+
+    def test_throttled(self):
+        """Test that updates within the interval are not drawn"""
+        stream = io.StringIO()
+        progress = ProgressLine(stream, total=1000, rate=0.001, tty=True)
+        for _ in range(1000):
+            progress.update(100)
+        assert stream.getvalue() == ""
+        progress.finish()
+        assert stream.getvalue().count("\r") == 1
+        assert stream.getvalue().endswith("\n")
+
+    def test_tty_redraw(self):
+        """Test that a terminal line is redrawn in place"""
+        stream = io.StringIO()
+        progress = ProgressLine(stream, total=2, rate=1e9, tty=True)
+        progress.update()
+        progress.update()
+        output = stream.getvalue()
+        assert output.count("\r") == 2
+        assert "\n" not in output
+        progress.clear()
+        assert stream.getvalue().endswith("\r")
+
+    def test_non_tty_summary_lines(self):
+        """Test that other streams get whole summary lines"""
+        stream = io.StringIO()
+        progress = ProgressLine(stream, total=2, summary_interval=0)
+        progress.update()
+        progress.finish()
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 2
+        assert all(line.startswith("Progress: ") for line in lines)
+        assert "\r" not in stream.getvalue()
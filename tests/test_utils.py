@@ -5,7 +5,14 @@ from pathlib import Path
 
 import pytest
 
-from magneto.utils import collect_torrent_files, format_file_size, get_output_path, is_url
+from magneto.utils import (
+    collect_torrent_files,
+    format_file_size,
+    get_output_path,
+    is_url,
+    iter_torrent_files,
+    read_url_list,
+)
 
 
 @pytest.mark.unit
@@ -98,6 +105,58 @@ class TestCollectTorrentFiles:
         assert len(files) == 0
 
 
+@pytest.mark.unit
+class TestIterTorrentFiles:
+    """Test cases for iter_torrent_files function"""
+    
+    @pytest.fixture
+    def tree(self, tmp_path, mock_torrent_bytes):
+        """Create a nested directory with mixed-case extensions"""
+        root = tmp_path / "root"
+        (root / "a" / "b").mkdir(parents=True)
+        for relative in ("top.torrent", "a/mixed.Torrent", "a/b/upper.TORRENT", "a/b/deep.torrent"):
+            (root / relative).write_bytes(mock_torrent_bytes)
+        (root / "a" / "notes.txt").write_text("not a torrent")
+        (root / "a" / "dir.torrent").mkdir()
+        return root
+    
+    def test_is_generator(self, tree):
+        """Test that paths are yielded lazily"""
+        files = iter_torrent_files(tree, recursive=True)
+        assert next(files).suffix.lower() == '.torrent'
+        files.close()
+    
+    def test_recursive_case_insensitive(self, tree):
+        """Test that every extension case is found in one pass"""
+        files = iter_torrent_files(tree, recursive=True)
+        assert sorted(f.name for f in files) == [
+            'deep.torrent', 'mixed.Torrent', 'top.torrent', 'upper.TORRENT'
+        ]
+    
+    def test_recursive_case_sensitive(self, tree):
+        """Test that case-sensitive mode only matches .torrent"""
+        files = iter_torrent_files(tree, recursive=True, case_sensitive=True)
+        assert sorted(f.name for f in files) == ['deep.torrent', 'top.torrent']
+    
+    def test_non_recursive(self, tree):
+        """Test that subdirectories are skipped without recursion"""
+        assert [f.name for f in iter_torrent_files(tree)] == ['top.torrent']
+    
+    def test_collect_is_sorted(self, tree):
+        """Test that collect_torrent_files returns the walk sorted"""
+        files = collect_torrent_files(tree, recursive=True)
+        assert files == sorted(iter_torrent_files(tree, recursive=True))
+        assert len(files) == 4
+    
+    def test_symlinked_directory_not_followed(self, tree):
+        """Test that directory symlinks cannot cause a loop"""
+        try:
+            (tree / "a" / "loop").symlink_to(tree, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symbolic links are not supported")
+        assert len(list(iter_torrent_files(tree, recursive=True))) == 4
+
+
 @pytest.mark.unit
 class TestGetOutputPath:
     """Test cases for get_output_path function"""
@@ -253,3 +312,28 @@ class TestIsUrl:
         assert is_url("http://") is False
         assert is_url("https://") is False
 
+
+
+@pytest.mark.unit
+class TestReadUrlList:
+    """Test cases for read_url_list function"""
+    
+    def test_read_url_list(self, tmp_path):
+        """Test reading URLs skipping blank lines and comments"""
+        url_file = tmp_path / "urls.txt"
+        url_file.write_text(
+            "# indexer export\n"
+            "http://example.com/a.torrent\n"
+            "\n"
+            "  https://example.com/b.torrent  \n"
+        )
+        assert read_url_list(str(url_file)) == [
+            "http://example.com/a.torrent",
+            "https://example.com/b.torrent",
+        ]
+    
+    def test_read_url_list_stdin(self, monkeypatch):
+        """Test reading URLs from stdin"""
+        import io
+        monkeypatch.setattr('sys.stdin', io.StringIO("http://example.com/a.torrent\n"))
+        assert read_url_list('-') == ["http://example.com/a.torrent"]
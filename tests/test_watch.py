@@ -0,0 +1,82 @@
+"""
+Unit tests for the directory watcher
+"""
+import time
+
+import pytest
+
+from magneto.watch import DirectoryWatcher
+
+
+def collect(watcher, count, timeout=5.0):
+    """Poll a watcher until count files were reported or timeout passes"""
+    found = []
+    deadline = time.monotonic() + timeout
+    while len(found) < count and time.monotonic() < deadline:
+        found += watcher.poll(0.05)
+    return found
+
+
+@pytest.fixture(params=[True, False], ids=['inotify', 'polling'])
+def use_inotify(request):
+    """Run a test with each change detection backend"""
+    return request.param
+
+
+@pytest.mark.unit
+class TestDirectoryWatcher:
+    """Test cases for DirectoryWatcher"""
+    
+    def test_new_file(self, tmp_path, mock_torrent_bytes, use_inotify):
+        """Test that a torrent file added after starting is reported once"""
+        with DirectoryWatcher(tmp_path, settle=0.1, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+            if not use_inotify:
+                assert watcher.mode == 'polling'
+            assert watcher.poll(0) == []
+            (tmp_path / "new.torrent").write_bytes(mock_torrent_bytes)
+            (tmp_path / "notes.txt").write_text("not a torrent")
+            assert collect(watcher, 1) == [tmp_path / "new.torrent"]
+            assert collect(watcher, 1, timeout=0.3) == []
+    
+    def test_existing_files(self, sample_torrent_dir, use_inotify):
+        """Test that files already present are only reported when asked for"""
+        with DirectoryWatcher(sample_torrent_dir, settle=0, use_inotify=use_inotify) as watcher:
+            assert collect(watcher, 1, timeout=0.3) == []
+        with DirectoryWatcher(sample_torrent_dir, settle=0, existing=True, use_inotify=use_inotify) as watcher:
+            assert len(collect(watcher, 3)) == 3
+    
+    def test_partial_write_is_debounced(self, tmp_path, mock_torrent_bytes, use_inotify):
+        """Test that a file is not reported while it is still being written"""
+        torrent_file = tmp_path / "slow.torrent"
+        with DirectoryWatcher(tmp_path, settle=0.5, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+            with open(torrent_file, 'wb') as f:
+                for start in range(0, len(mock_torrent_bytes), 16):
+                    f.write(mock_torrent_bytes[start:start + 16])
+                    f.flush()
+                    assert watcher.poll(0.02) == []
+            assert collect(watcher, 1) == [torrent_file]
+        assert torrent_file.read_bytes() == mock_torrent_bytes
+    
+    def test_recursive_new_directory(self, tmp_path, mock_torrent_bytes, use_inotify):
+        """Test that files in subdirectories created while watching are reported"""
+        with DirectoryWatcher(
+            tmp_path, recursive=True, settle=0.1, poll_interval=0.05, use_inotify=use_inotify
+        ) as watcher:
+            subdir = tmp_path / "a" / "b"
+            subdir.mkdir(parents=True)
+            watcher.poll(0.05)
+            (subdir / "deep.torrent").write_bytes(mock_torrent_bytes)
+            assert collect(watcher, 1) == [subdir / "deep.torrent"]
+    
+    def test_not_recursive(self, tmp_path, mock_torrent_bytes, use_inotify):
+        """Test that subdirectories are ignored unless recursive"""
+        subdir = tmp_path / "sub"
+        subdir.mkdir()
+        with DirectoryWatcher(tmp_path, settle=0.1, poll_interval=0.05, use_inotify=use_inotify) as watcher:
+            (subdir / "skip.torrent").write_bytes(mock_torrent_bytes)
+            assert collect(watcher, 1, timeout=0.4) == []
+    
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing directory is rejected"""
+        with pytest.raises(IOError):
+            DirectoryWatcher(tmp_path / "missing")
@@ -0,0 +1,156 @@
+"""
+Unit tests for result writers module
+"""
+import io
+import json
+
+import pytest
+
+from magneto.result import ConversionResult
+from magneto.writers import (
+    FullWriter,
+    JsonLinesWriter,
+    JsonWriter,
+    LinksOnlyWriter,
+    create_writer,
+)
+
+
+RESULTS = [
+    ("file1.torrent", ConversionResult("magnet:?xt=urn:btih:ABC123", bytes.fromhex("ABC123"), "Test", ["t"])),
+    ("file2.torrent", ConversionResult.failed("Invalid file")),
+    ("file3.torrent", ConversionResult("magnet:?xt=urn:btih:DEF456", bytes.fromhex("DEF456"))),
+]
+
+
+def write_all(writer, results=RESULTS):
+    """Write results and close the writer"""
+    with writer:
+        for torrent_path, result in results:
+            writer.write_result(torrent_path, result)
+
+
+@pytest.mark.unit
+class TestResultWriters:
+    """Test cases for incremental result writers"""
+    
+    def test_create_writer(self, tmp_path):
+        """Test writer selection by format"""
+        assert isinstance(create_writer('full', tmp_path / "out.txt"), FullWriter)
+        assert isinstance(create_writer('links_only', tmp_path / "out.txt"), LinksOnlyWriter)
+        assert isinstance(create_writer('json', tmp_path / "out.json"), JsonWriter)
+        assert isinstance(create_writer('jsonl', tmp_path / "out.jsonl"), JsonLinesWriter)
+        with pytest.raises(ValueError, match="Unknown output format"):
+            create_writer('xml', tmp_path / "out.xml")
+    
+    def test_file_created_lazily(self, tmp_path):
+        """Test that no file is created without results"""
+        output_file = tmp_path / "out.txt"
+        writer = create_writer('full', output_file)
+        writer.close()
+        assert not output_file.exists()
+        assert writer.count == 0
+    
+    def test_periodic_flush(self, tmp_path):
+        """Test that results are visible in the file before close"""
+        output_file = tmp_path / "out.txt"
+        writer = create_writer('links_only', output_file, flush_interval=0)
+        writer.write_result(*RESULTS[0])
+        assert output_file.read_text() == "magnet:?xt=urn:btih:ABC123\n"
+        writer.close()
+    
+    def test_write_tuple_fields(self):
+        """Test that write() records a success even if its link reads like an error"""
+        stream = io.StringIO()
+        with create_writer('jsonl', stream=stream) as writer:
+            writer.write("a.torrent", "Error-free link", "AB" * 20, {"name": "A"})
+        record = json.loads(stream.getvalue())
+        assert record["status"] == "ok"
+        assert record["magnet"] == "Error-free link"
+    
+    def test_write_result(self):
+        """Test writing converter results and exceptions without the Error prefix"""
+        stream = io.StringIO()
+        with create_writer('jsonl', stream=stream) as writer:
+            writer.write_result("a.torrent", ConversionResult("magnet:x", b"\xab" * 20, "A", ["t"]))
+            writer.write_result("b.torrent", ValueError("Invalid file"))
+            writer.write_result("c.torrent", ConversionResult.failed("Timed out"))
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records[0]["info_hash"] == "AB" * 20
+        assert records[0]["trackers"] == ["t"]
+        assert records[1] == {"file": "b.torrent", "status": "error", "error": "Invalid file"}
+        assert records[2]["error"] == "Timed out"
+    
+    def test_links_only(self, tmp_path):
+        """Test links_only output skips errors"""
+        output_file = tmp_path / "out.txt"
+        write_all(create_writer('links_only', output_file))
+        assert output_file.read_text().splitlines() == [
+            "magnet:?xt=urn:btih:ABC123",
+            "magnet:?xt=urn:btih:DEF456",
+        ]
+    
+    def test_full(self, tmp_path):
+        """Test full output ends with the spooled link list"""
+        output_file = tmp_path / "out.txt"
+        write_all(create_writer('full', output_file))
+        content = output_file.read_text()
+        
+        body, links = content.split("Magnet Link List (Links Only)\n")
+        assert "File: file2.torrent\nMagnet Link: Error: Invalid file\n" in body
+        assert "Name: Test\nTrackers: 1 found\n" in body
+        assert links.split() == [
+            "=" * 80,
+            "magnet:?xt=urn:btih:ABC123",
+            "magnet:?xt=urn:btih:DEF456",
+        ]
+    
+    def test_json(self, tmp_path):
+        """Test JSON output matches a pretty-printed list of successes"""
+        output_file = tmp_path / "out.json"
+        write_all(create_writer('json', output_file))
+        content = output_file.read_text()
+        
+        data = json.loads(content)
+        assert [item["file"] for item in data] == ["file1.torrent", "file3.torrent"]
+        assert data[0] == {
+            "file": "file1.torrent",
+            "magnet": "magnet:?xt=urn:btih:ABC123",
+            "info_hash": "ABC123",
+            "name": "Test",
+            "trackers": ["t"],
+        }
+        assert content == json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+    
+    def test_json_only_errors(self, tmp_path):
+        """Test JSON output when every result failed"""
+        output_file = tmp_path / "out.json"
+        write_all(create_writer('json', output_file), [RESULTS[1]])
+        assert json.loads(output_file.read_text()) == []
+    
+    def test_jsonl(self, tmp_path):
+        """Test JSON Lines output has one compact record per result"""
+        output_file = tmp_path / "out.jsonl"
+        write_all(create_writer('jsonl', output_file))
+        lines = output_file.read_text().splitlines()
+        
+        assert len(lines) == 3
+        assert all(': ' not in line for line in lines)
+        records = [json.loads(line) for line in lines]
+        assert records[0] == {
+            "file": "file1.torrent",
+            "status": "ok",
+            "magnet": "magnet:?xt=urn:btih:ABC123",
+            "info_hash": "ABC123",
+            "name": "Test",
+            "trackers": ["t"],
+        }
+        assert records[1] == {"file": "file2.torrent", "status": "error", "error": "Invalid file"}
+        assert records[2]["status"] == "ok"
+    
+    def test_stream_not_closed(self):
+        """Test that a caller-supplied stream is flushed but left open"""
+        stream = io.StringIO()
+        write_all(create_writer('links_only', stream=stream))
+        assert not stream.closed
+        assert "magnet:?xt=urn:btih:DEF456" in stream.getvalue()